@@ -0,0 +1,47 @@
+"""add change versions
+
+Revision ID: 005
+Revises: 004
+Create Date: 2025-11-20
+
+Per-tournament change tracking for incremental sync
+- Adds change_version / resync_version to tournaments
+- Adds change_version to matches, tournament_participants, tournament_standings
+- Creates (tournament_id, change_version) indexes for delta queries
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('tournaments', sa.Column('change_version', sa.BigInteger(), nullable=False, server_default='0'))
+    op.add_column('tournaments', sa.Column('resync_version', sa.BigInteger(), nullable=False, server_default='0'))
+
+    op.add_column('matches', sa.Column('change_version', sa.BigInteger(), nullable=False, server_default='0'))
+    op.create_index('idx_match_tournament_version', 'matches', ['tournament_id', 'change_version'])
+
+    op.add_column('tournament_participants', sa.Column('change_version', sa.BigInteger(), nullable=False, server_default='0'))
+    op.create_index('idx_participant_tournament_version', 'tournament_participants', ['tournament_id', 'change_version'])
+
+    op.add_column('tournament_standings', sa.Column('change_version', sa.BigInteger(), nullable=False, server_default='0'))
+    op.create_index('idx_standings_tournament_version', 'tournament_standings', ['tournament_id', 'change_version'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_standings_tournament_version', table_name='tournament_standings')
+    op.drop_column('tournament_standings', 'change_version')
+
+    op.drop_index('idx_participant_tournament_version', table_name='tournament_participants')
+    op.drop_column('tournament_participants', 'change_version')
+
+    op.drop_index('idx_match_tournament_version', table_name='matches')
+    op.drop_column('matches', 'change_version')
+
+    op.drop_column('tournaments', 'resync_version')
+    op.drop_column('tournaments', 'change_version')
@@ -0,0 +1,162 @@
+"""add standings materialized view
+
+Revision ID: 006
+Revises: 005
+Create Date: 2025-12-04
+
+Database-side standings (STANDINGS_BACKEND=materialized_view)
+- tournament_standings_mv: standings of every tournament ('' group_key)
+  and of every group, computed from matches / match_participants with the
+  same rules as StandingsService.aggregate_results
+- Unique index (required for REFRESH MATERIALIZED VIEW CONCURRENTLY)
+- standings_view_state: refresh generation, part of the standings ETag
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+
+STANDINGS_VIEW = """
+CREATE MATERIALIZED VIEW tournament_standings_mv AS
+WITH entries AS (
+    -- One row per participant of a finished match, with the match-level
+    -- values it is compared against
+    SELECT
+        m.tournament_id,
+        m.group_name,
+        mp.participant_id,
+        mp.slot_number,
+        mp.final_position,
+        coalesce(mp.score_value, 0) AS score,
+        coalesce(mp.is_winner, false) AS marked,
+        tp.tournament_id IS NOT DISTINCT FROM m.tournament_id AS in_tournament,
+        tp.tournament_id IS NOT DISTINCT FROM m.tournament_id
+            AND tp.group_assignment = m.group_name AS in_group,
+        count(*) OVER w AS size,
+        sum(coalesce(mp.score_value, 0)) OVER w AS match_score,
+        sum(CASE WHEN coalesce(mp.is_winner, false) THEN 1 ELSE 0 END) OVER w AS marked_count,
+        min(CASE WHEN coalesce(mp.is_winner, false) THEN mp.slot_number END) OVER w AS first_marked_slot,
+        sum(CASE WHEN tp.tournament_id IS NOT DISTINCT FROM m.tournament_id THEN 1 ELSE 0 END) OVER w AS tournament_known,
+        sum(CASE WHEN tp.tournament_id IS NOT DISTINCT FROM m.tournament_id
+                  AND tp.group_assignment = m.group_name THEN 1 ELSE 0 END) OVER w AS group_known
+    FROM match_participants mp
+    JOIN matches m ON m.id = mp.match_id
+    LEFT JOIN tournament_participants tp ON tp.id = mp.participant_id
+    WHERE m.is_finished AND m.is_bye IS NOT TRUE
+    WINDOW w AS (PARTITION BY mp.match_id)
+),
+scoped AS (
+    -- Whole tournament
+    SELECT '' AS group_key, * FROM entries
+    WHERE in_tournament AND (size <> 2 OR tournament_known = 2)
+    UNION ALL
+    -- Group of the match
+    SELECT group_name AS group_key, * FROM entries
+    WHERE in_group AND (size <> 2 OR group_known = 2)
+),
+results AS (
+    SELECT
+        tournament_id,
+        group_key,
+        participant_id,
+        count(*) AS played,
+        sum(CASE
+            WHEN size = 2 AND marked_count = 0 AND score > match_score - score THEN 1
+            WHEN size = 2 AND marked AND slot_number = first_marked_slot THEN 1
+            WHEN size <> 2 AND (final_position = 1 OR marked) THEN 1
+            ELSE 0
+        END) AS won,
+        sum(CASE WHEN size = 2 AND marked_count = 0 AND score = match_score - score THEN 1 ELSE 0 END) AS drawn,
+        sum(CASE WHEN size = 2 THEN 1 ELSE 0 END) AS two_player_played,
+        sum(CASE WHEN size <> 2 THEN
+            CASE final_position
+                WHEN 1 THEN 25 WHEN 2 THEN 18 WHEN 3 THEN 15 WHEN 4 THEN 12 WHEN 5 THEN 10
+                WHEN 6 THEN 8 WHEN 7 THEN 6 WHEN 8 THEN 4 WHEN 9 THEN 2 WHEN 10 THEN 1
+                ELSE 0
+            END
+        ELSE 0 END) AS position_points,
+        sum(CASE WHEN size = 2 AND (
+                  (marked_count = 0 AND score > match_score - score)
+                  OR (marked AND slot_number = first_marked_slot)
+              ) THEN 1 ELSE 0 END) AS two_player_won,
+        sum(score) AS score_for,
+        sum(CASE WHEN size = 2 THEN match_score - score ELSE 0 END) AS score_against
+    FROM scoped
+    GROUP BY tournament_id, group_key, participant_id
+),
+scopes AS (
+    SELECT id AS participant_id, tournament_id, '' AS group_key, created_at
+    FROM tournament_participants
+    UNION ALL
+    SELECT id, tournament_id, group_assignment, created_at
+    FROM tournament_participants
+    WHERE group_assignment IS NOT NULL AND group_assignment <> ''
+),
+standings AS (
+    SELECT
+        s.tournament_id,
+        s.group_key,
+        s.participant_id,
+        s.created_at,
+        coalesce(r.played, 0)::integer AS matches_played,
+        coalesce(r.won, 0)::integer AS matches_won,
+        coalesce(r.drawn, 0)::integer AS matches_drawn,
+        coalesce(r.two_player_played - r.two_player_won - r.drawn, 0)::integer AS matches_lost,
+        coalesce(3 * r.two_player_won + r.drawn + r.position_points, 0)::integer AS points,
+        coalesce(r.score_for, 0)::numeric(10, 2) AS score_for,
+        coalesce(r.score_against, 0)::numeric(10, 2) AS score_against,
+        coalesce(r.score_for - r.score_against, 0)::numeric(10, 2) AS score_difference
+    FROM scopes s
+    LEFT JOIN results r
+        ON r.tournament_id = s.tournament_id
+        AND r.group_key = s.group_key
+        AND r.participant_id = s.participant_id
+)
+SELECT
+    tournament_id,
+    group_key,
+    participant_id,
+    matches_played,
+    matches_won,
+    matches_drawn,
+    matches_lost,
+    points,
+    score_for,
+    score_against,
+    score_difference,
+    row_number() OVER (
+        PARTITION BY tournament_id, group_key
+        ORDER BY points DESC, score_difference DESC, score_for DESC, created_at, participant_id
+    )::integer AS current_rank
+FROM standings
+"""
+
+
+def upgrade() -> None:
+    op.execute(STANDINGS_VIEW)
+    op.create_index(
+        'uq_standings_mv_participant', 'tournament_standings_mv',
+        ['tournament_id', 'group_key', 'participant_id'], unique=True
+    )
+    op.create_index(
+        'idx_standings_mv_rank', 'tournament_standings_mv',
+        ['tournament_id', 'group_key', 'current_rank']
+    )
+
+    op.execute("""
+        CREATE TABLE standings_view_state (
+            id integer PRIMARY KEY CHECK (id = 1),
+            generation bigint NOT NULL DEFAULT 0,
+            refreshed_at timestamp without time zone NOT NULL DEFAULT now()
+        )
+    """)
+    op.execute("INSERT INTO standings_view_state (id) VALUES (1)")
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE standings_view_state")
+    op.execute("DROP MATERIALIZED VIEW tournament_standings_mv")
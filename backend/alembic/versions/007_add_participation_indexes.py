@@ -0,0 +1,42 @@
+"""add participation indexes
+
+Revision ID: 007
+Revises: 006
+Create Date: 2025-12-11
+
+Upcoming matches across tournaments (GET /matches/upcoming): a user's or
+club's participations → their match entries → matches
+- (participant_user_id, id) / (participant_club_id, id) on
+  tournament_participants replace the single-column indexes
+- (participant_id, match_id) on match_participants replaces the
+  single-column index, so entries → matches is an index-only scan
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('idx_participant_user_entry', 'tournament_participants', ['participant_user_id', 'id'])
+    op.drop_index('idx_participant_user', table_name='tournament_participants')
+
+    op.create_index('idx_participant_club_entry', 'tournament_participants', ['participant_club_id', 'id'])
+    op.drop_index('idx_participant_club', table_name='tournament_participants')
+
+    op.create_index('idx_match_participants_participant_match', 'match_participants', ['participant_id', 'match_id'])
+    op.drop_index('idx_match_participants_participant', table_name='match_participants')
+
+
+def downgrade() -> None:
+    op.create_index('idx_match_participants_participant', 'match_participants', ['participant_id'])
+    op.drop_index('idx_match_participants_participant_match', table_name='match_participants')
+
+    op.create_index('idx_participant_club', 'tournament_participants', ['participant_club_id'])
+    op.drop_index('idx_participant_club_entry', table_name='tournament_participants')
+
+    op.create_index('idx_participant_user', 'tournament_participants', ['participant_user_id'])
+    op.drop_index('idx_participant_user_entry', table_name='tournament_participants')
@@ -0,0 +1,81 @@
+"""add court booking constraint
+
+Revision ID: 008
+Revises: 007
+Create Date: 2025-12-12
+
+Court double-booking prevention: two matches of a tournament that occupy
+the same venue and court must not overlap in time
+- ck_match_schedule_order: scheduled_end is not before scheduled_start
+  (tsrange() raises on reversed bounds)
+- excl_match_court_slot: EXCLUDE USING gist on (tournament_id, venue_name,
+  court_field_number, tsrange(scheduled_start, scheduled_end)), only for
+  matches with venue, court, start and end set that still occupy the
+  court (not cancelled, postponed or walkover). Needs the btree_gist
+  extension for the = columns. The same index answers the conflict probe
+  (MatchService.find_schedule_conflicts).
+
+Where btree_gist is not available, a plain GiST index on the time range
+(same predicate) is created instead: conflicts are then only checked by
+the application, still with an index probe.
+
+Existing overlapping bookings make the upgrade fail; list them with the
+conflict check and move them first.
+"""
+import logging
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '008'
+down_revision = '007'
+branch_labels = None
+depends_on = None
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+# Keep in sync with MatchService.find_schedule_conflicts
+SLOT_PREDICATE = (
+    "venue_name IS NOT NULL AND court_field_number IS NOT NULL "
+    "AND scheduled_start IS NOT NULL AND scheduled_end IS NOT NULL "
+    "AND status NOT IN ('cancelled', 'postponed', 'walkover')"
+)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+
+    op.create_check_constraint(
+        'ck_match_schedule_order',
+        'matches',
+        'scheduled_end IS NULL OR scheduled_start IS NULL OR scheduled_end >= scheduled_start'
+    )
+
+    has_btree_gist = bind.execute(
+        sa.text("SELECT 1 FROM pg_available_extensions WHERE name = 'btree_gist'")
+    ).scalar()
+    if has_btree_gist:
+        op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+        op.execute(f"""
+            ALTER TABLE matches ADD CONSTRAINT excl_match_court_slot
+            EXCLUDE USING gist (
+                tournament_id WITH =,
+                venue_name WITH =,
+                court_field_number WITH =,
+                tsrange(scheduled_start, scheduled_end) WITH &&
+            ) WHERE ({SLOT_PREDICATE})
+        """)
+    else:
+        logger.warning("btree_gist not available: court bookings are checked by the application only")
+        op.execute(f"""
+            CREATE INDEX idx_match_court_slot ON matches
+            USING gist (tsrange(scheduled_start, scheduled_end))
+            WHERE {SLOT_PREDICATE}
+        """)
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE matches DROP CONSTRAINT IF EXISTS excl_match_court_slot")
+    op.execute("DROP INDEX IF EXISTS idx_match_court_slot")
+    op.drop_constraint('ck_match_schedule_order', 'matches', type_='check')
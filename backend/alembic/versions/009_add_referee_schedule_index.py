@@ -0,0 +1,32 @@
+"""add referee schedule index
+
+Revision ID: 009
+Revises: 008
+Create Date: 2025-12-13
+
+Referee assignment (RefereeService.assign_referees) looks up the pool's
+referee duties in other tournaments during a schedule: (referee_user_id,
+scheduled_start), partial on assigned matches. Also serves the
+ON DELETE SET NULL of referee_user_id when a user is deleted.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '009'
+down_revision = '008'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'idx_match_referee_schedule',
+        'matches',
+        ['referee_user_id', 'scheduled_start'],
+        postgresql_where=sa.text('referee_user_id IS NOT NULL')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_match_referee_schedule', table_name='matches')
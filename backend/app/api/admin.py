@@ -0,0 +1,80 @@
+"""
+Admin API endpoints (superusers only)
+"""
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import HTMLResponse, PlainTextResponse
+from app.api.dependencies import get_current_superuser
+from app.core.profiling import profile_store, render_profile
+from app.schemas.admin import ProfilingStatus, ProfilingTargets
+
+router = APIRouter(
+    prefix="/admin",
+    tags=["Admin"],
+    dependencies=[Depends(get_current_superuser)],
+)
+
+
+def _profiling_status() -> ProfilingStatus:
+    return ProfilingStatus(
+        routes=sorted(profile_store.routes),
+        functions=sorted(profile_store.functions),
+        available_functions=sorted(profile_store.available_functions),
+        sample_rate=profile_store.sample_rate,
+        profiles=profile_store.list(),
+    )
+
+
+@router.get("/profiling", response_model=ProfilingStatus)
+async def get_profiling():
+    """
+    Get profiling targets and the most recent profiles
+    
+    Targets and profiles are kept per worker process.
+    """
+    return _profiling_status()
+
+
+@router.put("/profiling/targets", response_model=ProfilingStatus)
+async def set_profiling_targets(targets: ProfilingTargets):
+    """
+    Set the route templates and functions to profile
+    
+    An empty list stops profiling them. Individual requests can also be
+    profiled by sending the X-Profile header as a superuser.
+    """
+    profile_store.configure(targets.routes, targets.functions, targets.sample_rate)
+    return _profiling_status()
+
+
+@router.get("/profiling/{profile_id}")
+async def get_profile(
+    profile_id: str,
+    format: str = Query("text", pattern="^(text|html)$"),
+):
+    """
+    Get a profile's call tree (text or interactive HTML)
+    """
+    profile = profile_store.get(profile_id)
+    if not profile:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Profile not found"
+        )
+
+    if format == "html":
+        return HTMLResponse(render_profile(profile, html=True))
+
+    header = (
+        f"{profile['kind']} {profile['target']}: {profile['duration_ms']} ms total, "
+        f"{profile['db_ms']} ms in {profile['db_queries']} queries, "
+        f"{profile['python_ms']} ms Python\n"
+    )
+    return PlainTextResponse(header + render_profile(profile))
+
+
+@router.delete("/profiling", status_code=status.HTTP_204_NO_CONTENT)
+async def clear_profiles():
+    """
+    Delete the stored profiles
+    """
+    profile_store.clear()
@@ -5,7 +5,7 @@ from typing import List, Optional
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.db.session import get_db
+from app.db.session import get_db, get_read_db
 from app.schemas.club import (
     ClubCreate,
     ClubUpdate,
@@ -48,7 +48,6 @@ async def create_club(
     """
     try:
         club = await ClubService.create(db, club_in, current_user.id)
-        await db.commit()
         return club
     except ValueError as e:
         raise HTTPException(
@@ -64,7 +63,7 @@ async def list_clubs(
         search: Optional[str] = Query(None, max_length=100),
         city: Optional[str] = Query(None, max_length=100),
         verified_only: bool = Query(False),
-        db: AsyncSession = Depends(get_db),
+        db: AsyncSession = Depends(get_read_db),
 ):
     """
     List clubs with optional filters and pagination.
@@ -84,7 +83,7 @@ async def list_clubs(
 async def count_clubs(
         search: Optional[str] = Query(None, max_length=100),
         city: Optional[str] = Query(None, max_length=100),
-        db: AsyncSession = Depends(get_db),
+        db: AsyncSession = Depends(get_read_db),
 ):
     """
     Count clubs with filters.
@@ -97,7 +96,7 @@ async def count_clubs(
 async def get_club(
         club_id: UUID,
         include_members: bool = Query(False),
-        db: AsyncSession = Depends(get_db),
+        db: AsyncSession = Depends(get_read_db),
 ):
     """
     Get club by ID.
@@ -116,7 +115,7 @@ async def get_club(
 @router.get("/slug/{slug}", response_model=ClubResponse)
 async def get_club_by_slug(
         slug: str,
-        db: AsyncSession = Depends(get_db),
+        db: AsyncSession = Depends(get_read_db),
 ):
     """
     Get club by slug.
@@ -150,7 +149,6 @@ async def update_club(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Club not found"
             )
-        await db.commit()
         return club
     except ValueError as e:
         raise HTTPException(
@@ -177,7 +175,6 @@ async def delete_club(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Club not found"
         )
-    await db.commit()
     return None
 
 
@@ -189,7 +186,7 @@ async def delete_club(
 async def list_club_members(
         club_id: UUID,
         role: Optional[ClubRole] = Query(None),
-        db: AsyncSession = Depends(get_db),
+        db: AsyncSession = Depends(get_read_db),
 ):
     """
     List all members of a club.
@@ -221,7 +218,6 @@ async def add_club_member(
 
     try:
         member = await ClubMemberService.add_member(db, club_id, member_in)
-        await db.commit()
         return member
     except ValueError as e:
         raise HTTPException(
@@ -250,7 +246,6 @@ async def update_club_member(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Member not found"
         )
-    await db.commit()
     return member
 
 
@@ -283,7 +278,6 @@ async def remove_club_member(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Member not found"
             )
-        await db.commit()
         return None
     except ValueError as e:
         raise HTTPException(
@@ -363,5 +357,4 @@ async def update_verification(
             detail="Club not found"
         )
 
-    await db.commit()
     return club
\ No newline at end of file
@@ -0,0 +1,44 @@
+"""
+Background job API endpoints
+"""
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from app.api.dependencies import get_current_user
+from app.models.user import User
+from app.schemas.job import JobResponse
+from app.services.job_service import JobService
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+
+@router.get(
+    "/{job_id}",
+    response_model=JobResponse,
+    summary="Get job",
+    description="Get status, progress and result of a background job"
+)
+async def get_job(
+    job_id: UUID,
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Get a background job.
+    
+    Jobs are started by the `async=true` variants of bracket generation
+    and standings recalculation. Finished jobs are kept for
+    JOBS_RESULT_TTL seconds.
+    
+    Permissions:
+    - User who started the job, or superuser
+    """
+    job = await JobService.get_job(job_id)
+    if job is None or (
+        job.user_id != str(current_user.id) and not current_user.is_superuser
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
+        )
+    return job
@@ -8,27 +8,63 @@ This module provides all match-related API endpoints including:
 - Tournament standings
 """
 
+from datetime import datetime
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import get_db
+from app.core.config import settings
+from app.db.session import get_db, get_read_db
+from app.db.query_budget import query_budget
+from app.core.responses import ModelListSerializer
+from app.core.etag import weak_etag, etag_matches, set_etag_headers, not_modified
 from app.models.user import User
 from app.schemas.match import (
     MatchCreate, MatchUpdate, MatchResponse, MatchDetail,
-    MatchListItem, MatchScoreUpdate, MatchStatusUpdate,
+    MatchListItem, MatchScoreUpdate, MatchStatusUpdate, UpcomingMatchItem,
+    ScheduleConflictItem,
     BracketGenerationRequest, RoundRobinGenerationRequest,
+    RefereeAssignmentRequest, RefereeAssignmentResult,
     StandingsResponse, StandingsDetail
 )
+from app.schemas.job import JobResponse
 from app.services.match_service import MatchService
 from app.services.bracket_service import BracketService
-from app.services.standings_service import StandingsService
-from app.api.dependencies import get_current_user
+from app.services.referee_service import RefereeService
+from app.services.job_service import (
+    GENERATE_KNOCKOUT, GENERATE_ROUND_ROBIN, RECALCULATE_STANDINGS, JobService
+)
+from app.services.standings_service import StandingsService, standings_recalculator
+from app.services.standings_view_service import StandingsViewService
+from app.services.live_tournament_service import live_tournaments
+from app.services.tournament_service import TournamentService
+from app.api.dependencies import get_current_user, require_club_manager, require_club_member
 
 router = APIRouter(prefix="/matches", tags=["matches"])
 
+match_list_serializer = ModelListSerializer(MatchListItem)
+upcoming_list_serializer = ModelListSerializer(UpcomingMatchItem)
+conflict_list_serializer = ModelListSerializer(ScheduleConflictItem)
+standings_list_serializer = ModelListSerializer(StandingsDetail)
+
+RUN_ASYNC = Query(
+    False,
+    alias="async",
+    description="Run as background job: 202 with the job, poll GET /jobs/{id}"
+)
+JOB_ACCEPTED = {202: {"model": JobResponse, "description": "Job queued (async=true)"}}
+
+
+def _job_accepted(job) -> JSONResponse:
+    return JSONResponse(
+        status_code=status.HTTP_202_ACCEPTED,
+        content=JobResponse.model_validate(job).model_dump(mode="json"),
+        headers={"Location": f"{settings.API_PREFIX}/jobs/{job.id}"},
+    )
+
 
 # ==================== MATCH CRUD ====================
 
@@ -69,7 +105,9 @@ async def create_match(
     summary="List matches",
     description="Get list of matches for a tournament with optional filters"
 )
+@query_budget(2)
 async def list_matches(
+    request: Request,
     tournament_id: UUID = Query(..., description="Tournament ID"),
     round_number: Optional[int] = Query(None, ge=1, description="Filter by round number"),
     group_name: Optional[str] = Query(None, description="Filter by group name"),
@@ -77,17 +115,113 @@ async def list_matches(
     status: Optional[str] = Query(None, description="Filter by status"),
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=100, description="Maximum number of records"),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get list of matches for a tournament.
     
     Supports filtering by round, group, phase, and status.
+    Each item includes participant names and scores.
+    Supports conditional requests: answers If-None-Match with 304.
     """
-    matches = await MatchService.get_tournament_matches(
+    version = await TournamentService.get_tournament_version(db, tournament_id)
+    if version is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Tournament not found"
+        )
+    etag = weak_etag(*version)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    matches = await MatchService.get_tournament_match_list(
         db, tournament_id, round_number, group_name, phase, status, skip, limit
     )
-    return matches
+    response = match_list_serializer.response(matches)
+    set_etag_headers(response, etag)
+    return response
+
+
+@router.get(
+    "/upcoming",
+    response_model=List[UpcomingMatchItem],
+    summary="List my upcoming matches",
+    description="Get the next unfinished matches of the current user (or a club) across all tournaments"
+)
+@query_budget(3)
+async def list_upcoming_matches(
+    club_id: Optional[UUID] = Query(None, description="List the club's matches instead (members only)"),
+    include_clubs: bool = Query(True, description="Include matches of the user's clubs"),
+    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    limit: int = Query(50, ge=1, le=100, description="Maximum number of records"),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Get upcoming matches across tournaments.
+    
+    Ordered by scheduled start (unscheduled matches last). Each item
+    names the tournament and which participant of the match is the
+    user's (or club's) entry.
+    
+    Permissions:
+    - Own matches: any user
+    - Club matches: club members
+    """
+    if club_id is not None:
+        await require_club_member(club_id, current_user, db)
+    
+    matches = await MatchService.get_upcoming_matches(
+        db,
+        user_id=current_user.id,
+        club_id=club_id,
+        include_clubs=include_clubs,
+        skip=skip,
+        limit=limit
+    )
+    return upcoming_list_serializer.response(matches)
+
+
+@router.get(
+    "/conflicts",
+    response_model=List[ScheduleConflictItem],
+    summary="Check court booking",
+    description="Get the matches that already occupy a court during a proposed time slot"
+)
+@query_budget(1)
+async def check_schedule_conflicts(
+    tournament_id: UUID = Query(..., description="Tournament ID"),
+    venue_name: str = Query(..., max_length=200, description="Venue of the slot"),
+    court_field_number: str = Query(..., max_length=50, description="Court/field of the slot"),
+    scheduled_start: datetime = Query(..., description="Slot start"),
+    scheduled_end: datetime = Query(..., description="Slot end"),
+    exclude_match_id: Optional[UUID] = Query(None, description="Match being rescheduled"),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    Check a proposed slot before (re)scheduling a match.
+    
+    Returns the overlapping matches; an empty list means the court is
+    free. Slots are half-open: a match may start when the previous one
+    ends. Times with a UTC offset are compared as UTC. Creating or
+    updating a match into an occupied slot answers 409.
+    """
+    try:
+        conflicts = await MatchService.find_schedule_conflicts(
+            db,
+            tournament_id,
+            venue_name,
+            court_field_number,
+            scheduled_start,
+            scheduled_end,
+            exclude_match_id=exclude_match_id
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    return conflict_list_serializer.response(conflicts)
 
 
 @router.get(
@@ -96,11 +230,17 @@ async def list_matches(
     summary="Get match details",
     description="Get detailed information about a specific match"
 )
+@query_budget(4)
 async def get_match(
     match_id: UUID,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get match by ID with full details including participants."""
+    if settings.LIVE_ENGINE_ENABLED:
+        match = live_tournaments.get_match(match_id)
+        if match is not None:
+            return match
+    
     match = await MatchService.get_match_by_id(db, match_id, load_relationships=True)
     if not match:
         raise HTTPException(
@@ -127,6 +267,8 @@ async def update_match(
     
     Can update scheduling, venue, notes, etc.
     Does not update scores (use PUT /matches/{id}/score).
+    Answers 409 if another match occupies the court in the new slot
+    (see GET /matches/conflicts).
     
     Permissions:
     - Tournament creator or club admin
@@ -184,15 +326,27 @@ async def update_match_score(
     Update match score and determine winner.
     
     Automatically recalculates tournament standings after score update.
+    Matches of live tournaments (LIVE_ENGINE_ENABLED) are updated in
+    memory and persisted in batches; the response waits for the commit.
     
     Permissions:
     - Tournament creator, club admin, or assigned referee
     """
     try:
+        if settings.LIVE_ENGINE_ENABLED and live_tournaments.is_live_match(match_id):
+            # Return the connection held since authentication: the actor
+            # writes with its own, waiting callers must not starve it
+            await db.commit()
+            match = await live_tournaments.update_score(match_id, score_data)
+            if match is not None:
+                return match
+        
         match = await MatchService.update_match_score(db, match_id, score_data)
         
         # Recalculate standings after score update
-        await StandingsService.calculate_standings(db, match.tournament_id)
+        await StandingsService.results_changed(
+            db, match.tournament_id, [match.group_name]
+        )
         
         return match
     except ValueError as e:
@@ -243,10 +397,12 @@ async def update_match_status(
     "/generate/knockout",
     response_model=List[MatchResponse],
     summary="Generate knockout bracket",
-    description="Generate single-elimination knockout bracket for tournament"
+    description="Generate single-elimination knockout bracket for tournament",
+    responses=JOB_ACCEPTED
 )
 async def generate_knockout_bracket(
     request: BracketGenerationRequest,
+    run_async: bool = RUN_ASYNC,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -255,10 +411,18 @@ async def generate_knockout_bracket(
     
     Creates all matches from first round to final.
     Supports byes for non-power-of-2 participant counts.
+    With async=true the bracket is generated by a background job.
     
     Permissions:
     - Tournament creator or club admin
     """
+    if run_async:
+        job = await JobService.enqueue(
+            GENERATE_KNOCKOUT, request.tournament_id, current_user.id,
+            {"shuffle_seeds": request.shuffle_seeds}
+        )
+        return _job_accepted(job)
+    
     try:
         matches = await BracketService.generate_knockout_bracket(
             db, request.tournament_id, request.shuffle_seeds
@@ -275,10 +439,12 @@ async def generate_knockout_bracket(
     "/generate/round-robin",
     response_model=List[MatchResponse],
     summary="Generate round-robin schedule",
-    description="Generate round-robin schedule (everyone plays everyone)"
+    description="Generate round-robin schedule (everyone plays everyone)",
+    responses=JOB_ACCEPTED
 )
 async def generate_round_robin_schedule(
     request: RoundRobinGenerationRequest,
+    run_async: bool = RUN_ASYNC,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -287,10 +453,18 @@ async def generate_round_robin_schedule(
     
     Creates matches so everyone plays everyone once (or twice if home_and_away=True).
     Uses circle method for fair scheduling.
+    With async=true the schedule is generated by a background job.
     
     Permissions:
     - Tournament creator or club admin
     """
+    if run_async:
+        job = await JobService.enqueue(
+            GENERATE_ROUND_ROBIN, request.tournament_id, current_user.id,
+            {"home_and_away": request.home_and_away, "group_name": request.group_name}
+        )
+        return _job_accepted(job)
+    
     try:
         matches = await BracketService.generate_round_robin_schedule(
             db,
@@ -306,6 +480,48 @@ async def generate_round_robin_schedule(
         )
 
 
+# ==================== REFEREE ASSIGNMENT ====================
+
+@router.post(
+    "/referees/assign",
+    response_model=RefereeAssignmentResult,
+    summary="Assign referees",
+    description="Assign referees from the organizing club to all scheduled matches of a tournament"
+)
+async def assign_referees(
+    request: RefereeAssignmentRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Assign referees to a tournament's scheduled matches in one run.
+    
+    Referees are the organizing club's members with the member or
+    volunteer role. Nobody referees their own (or their club's) match,
+    two matches at once or while playing; matches are spread evenly.
+    Existing assignments are kept unless reassign is set. Matches without
+    a free eligible referee are listed as unassigned.
+    
+    Permissions:
+    - Club managers/admins/owners of the organizing club
+    """
+    tournament = await TournamentService.get_tournament_by_id(db, request.tournament_id)
+    if not tournament:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Tournament not found"
+        )
+    await require_club_manager(tournament.club_id, current_user, db)
+    
+    try:
+        return await RefereeService.assign_referees(db, request.tournament_id, request.reassign)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+
 # ==================== TOURNAMENT STANDINGS ====================
 
 @router.get(
@@ -316,49 +532,82 @@ async def generate_round_robin_schedule(
 )
 async def get_tournament_standings(
     tournament_id: UUID,
+    request: Request,
     group_name: Optional[str] = Query(None, description="Filter by group name"),
     recalculate: bool = Query(False, description="Force recalculation from matches"),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get tournament standings.
     
-    Returns cached standings by default.
-    Set recalculate=true to force recalculation from all completed matches.
+    Returns cached standings by default (computed in memory for live
+    tournaments, see LIVE_ENGINE_ENABLED).
+    Set recalculate=true to force recalculation from all completed matches
+    (on the primary; concurrent requests share one recalculation).
+    Cached reads support conditional requests (If-None-Match → 304).
     """
     if recalculate:
-        standings = await StandingsService.calculate_standings(
-            db, tournament_id, group_name
+        standings = await standings_recalculator.recalculate(tournament_id, group_name)
+        return standings_list_serializer.response(standings)
+    
+    version = await TournamentService.get_tournament_version(db, tournament_id)
+    if version is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Tournament not found"
         )
-    else:
+    if settings.STANDINGS_BACKEND == "materialized_view":
+        # Refreshed after the tournament version was bumped
+        version += (await StandingsViewService.generation(db),)
+    etag = weak_etag(*version)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    
+    standings = live_tournaments.get_standings(
+        tournament_id, version[0], group_name
+    ) if settings.LIVE_ENGINE_ENABLED else None
+    if standings is None:
         standings = await StandingsService.get_standings(
             db, tournament_id, group_name
         )
-    
-    return standings
+    response = standings_list_serializer.response(standings)
+    set_etag_headers(response, etag)
+    return response
 
 
 @router.post(
     "/standings/{tournament_id}/recalculate",
     response_model=List[StandingsDetail],
     summary="Recalculate standings",
-    description="Force recalculation of tournament standings"
+    description="Force recalculation of tournament standings",
+    responses=JOB_ACCEPTED
 )
 async def recalculate_standings(
     tournament_id: UUID,
     group_name: Optional[str] = Query(None),
+    run_async: bool = RUN_ASYNC,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     Recalculate tournament standings from scratch.
     
-    Recalculates based on all completed matches.
+    Recalculates based on all completed matches; concurrent requests for
+    the same standings share one recalculation.
+    With async=true the recalculation runs as a background job.
     
     Permissions:
     - Tournament creator or club admin
     """
-    standings = await StandingsService.calculate_standings(
-        db, tournament_id, group_name
-    )
-    return standings
+    if run_async:
+        job = await JobService.enqueue(
+            RECALCULATE_STANDINGS, tournament_id, current_user.id,
+            {"group_name": group_name}
+        )
+        return _job_accepted(job)
+    
+    # Return the connection held since authentication: the recalculation
+    # uses its own session
+    await db.commit()
+    standings = await standings_recalculator.recalculate(tournament_id, group_name)
+    return standings_list_serializer.response(standings)
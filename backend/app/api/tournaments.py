@@ -8,10 +8,15 @@ CRUD operations, status management, and registration.
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import get_db
+from app.core.cache import VersionedCache
+from app.core.config import settings
+from app.db.session import get_db, get_read_db
+from app.db.query_budget import query_budget
+from app.core.responses import FastJSONResponse, ModelListSerializer
+from app.core.etag import weak_etag, etag_matches, set_etag_headers, not_modified
 from app.models.user import User
 from app.schemas.tournament import (
     TournamentCreate, TournamentUpdate, TournamentResponse,
@@ -21,12 +26,22 @@ from app.schemas.tournament import (
     TournamentParticipantResponse, TournamentParticipantDetail,
     ParticipantStatusUpdate, ParticipantPaymentUpdate
 )
+from app.schemas.match import BracketResponse, ScheduleValidationResponse, TournamentChanges
+from app.services.bracket_service import BracketService
+from app.services.change_feed_service import ChangeFeedService
+from app.services.schedule_service import ScheduleService
 from app.services.tournament_service import TournamentService
 from app.services.tournament_participant_service import TournamentParticipantService
 from app.api.dependencies import get_current_user
 
 router = APIRouter(prefix="/tournaments", tags=["tournaments"])
 
+tournament_list_serializer = ModelListSerializer(TournamentListItem)
+participant_list_serializer = ModelListSerializer(TournamentParticipantResponse)
+
+# Rendered bracket JSON by (tournament, phase, group) for one tournament version
+bracket_cache = VersionedCache("bracket", settings.BRACKET_CACHE_SIZE)
+
 
 # ==================== TOURNAMENT CRUD ====================
 
@@ -77,6 +92,7 @@ async def create_tournament(
     summary="List tournaments",
     description="Get list of tournaments with optional filters"
 )
+@query_budget(1)
 async def list_tournaments(
         sport_type: Optional[str] = Query(None, description="Filter by sport type"),
         tournament_type: Optional[str] = Query(None, description="Filter by tournament type"),
@@ -86,7 +102,7 @@ async def list_tournaments(
         is_public: Optional[bool] = Query(None, description="Filter by visibility"),
         skip: int = Query(0, ge=0, description="Number of records to skip"),
         limit: int = Query(100, ge=1, le=100, description="Maximum number of records"),
-        db: AsyncSession = Depends(get_db)
+        db: AsyncSession = Depends(get_read_db)
 ):
     """Get list of tournaments with optional filters."""
     filters = TournamentFilters(
@@ -101,7 +117,7 @@ async def list_tournaments(
     tournaments = await TournamentService.get_tournaments(
         db, filters, skip, limit
     )
-    return tournaments
+    return tournament_list_serializer.response(tournaments)
 
 
 @router.get(
@@ -110,11 +126,28 @@ async def list_tournaments(
     summary="Get tournament details",
     description="Get detailed information about a specific tournament"
 )
+@query_budget(5)
 async def get_tournament(
         tournament_id: UUID,
-        db: AsyncSession = Depends(get_db)
+        request: Request,
+        response: Response,
+        db: AsyncSession = Depends(get_read_db)
 ):
-    """Get tournament by ID with full details."""
+    """
+    Get tournament by ID with full details.
+
+    Supports conditional requests: answers If-None-Match with 304.
+    """
+    version = await TournamentService.get_tournament_version(db, tournament_id)
+    if version is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Tournament not found"
+        )
+    etag = weak_etag(*version)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
     tournament = await TournamentService.get_tournament_by_id(
         db, tournament_id, load_relationships=True
     )
@@ -123,6 +156,7 @@ async def get_tournament(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Tournament not found"
         )
+    set_etag_headers(response, etag)
     return tournament
 
 
@@ -132,11 +166,28 @@ async def get_tournament(
     summary="Get tournament by slug",
     description="Get tournament details using slug instead of ID"
 )
+@query_budget(5)
 async def get_tournament_by_slug(
         slug: str,
-        db: AsyncSession = Depends(get_db)
+        request: Request,
+        response: Response,
+        db: AsyncSession = Depends(get_read_db)
 ):
-    """Get tournament by slug."""
+    """
+    Get tournament by slug.
+
+    Supports conditional requests: answers If-None-Match with 304.
+    """
+    version = await TournamentService.get_tournament_version(db, slug=slug)
+    if version is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Tournament not found"
+        )
+    etag = weak_etag(*version)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
     tournament = await TournamentService.get_tournament_by_slug(
         db, slug, load_relationships=True
     )
@@ -145,6 +196,7 @@ async def get_tournament_by_slug(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Tournament not found"
         )
+    set_etag_headers(response, etag)
     return tournament
 
 
@@ -279,7 +331,7 @@ async def get_my_tournaments(
     tournaments = await TournamentService.get_tournaments_by_creator(
         db, current_user.id, skip, limit
     )
-    return tournaments
+    return tournament_list_serializer.response(tournaments)
 
 
 @router.get(
@@ -303,12 +355,14 @@ async def get_my_participations(
 
 @router.get(
     "/{tournament_id}/statistics",
+    response_class=FastJSONResponse,
     summary="Get tournament statistics",
     description="Get detailed statistics about a tournament"
 )
+@query_budget(5)
 async def get_tournament_statistics(
         tournament_id: UUID,
-        db: AsyncSession = Depends(get_db)
+        db: AsyncSession = Depends(get_read_db)
 ):
     """Get tournament statistics."""
     stats = await TournamentService.get_tournament_statistics(db, tournament_id)
@@ -320,6 +374,131 @@ async def get_tournament_statistics(
     return stats
 
 
+@router.get(
+    "/{tournament_id}/changes",
+    response_model=TournamentChanges,
+    summary="Get tournament changes",
+    description="Get matches, participants and standings changed since a version"
+)
+@query_budget(4)
+async def get_tournament_changes(
+        tournament_id: UUID,
+        since: int = Query(0, ge=0, description="Last change version seen by the client"),
+        db: AsyncSession = Depends(get_read_db)
+):
+    """
+    Get incremental tournament changes.
+
+    Clients pass the version of their last sync and receive only rows
+    written after it. When full_resync is true (first sync, or rows were
+    deleted since) the response holds the complete state instead.
+    """
+    changes = await ChangeFeedService.get_changes(db, tournament_id, since)
+    if not changes:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Tournament not found"
+        )
+    return changes
+
+
+@router.get(
+    "/{tournament_id}/bracket",
+    response_model=BracketResponse,
+    summary="Get tournament bracket",
+    description="Get all rounds, matches and participants of a tournament in one response"
+)
+@query_budget(2)
+async def get_tournament_bracket(
+        tournament_id: UUID,
+        request: Request,
+        phase: Optional[str] = Query(None, description="Filter by phase (e.g., 'knockout')"),
+        group_name: Optional[str] = Query(None, description="Filter by group name"),
+        db: AsyncSession = Depends(get_read_db)
+):
+    """
+    Get the bracket tree (rounds → matches → participants, scores, winner).
+
+    Matches reference the match their winner advances to via
+    feeds_into_match_id. The rendered response is cached per tournament
+    version, so any write (e.g. a score update) invalidates it.
+    Supports conditional requests: answers If-None-Match with 304.
+    """
+    version = await TournamentService.get_tournament_version(db, tournament_id)
+    if version is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Tournament not found"
+        )
+    etag = weak_etag(*version, phase, group_name)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    key = (tournament_id, phase, group_name)
+    body = bracket_cache.get(key, version)
+    if body is None:
+        rounds = await BracketService.get_bracket(db, tournament_id, phase, group_name)
+        body = BracketResponse(
+            tournament_id=tournament_id,
+            version=version[0],
+            rounds=rounds
+        ).model_dump_json().encode()
+        bracket_cache.set(key, version, body)
+    response = Response(content=body, media_type="application/json")
+    set_etag_headers(response, etag)
+    return response
+
+
+@router.get(
+    "/{tournament_id}/schedule/clashes",
+    response_model=ScheduleValidationResponse,
+    summary="Validate tournament schedule",
+    description="Get all participants booked into overlapping matches or without minimum rest"
+)
+@query_budget(2)
+async def get_schedule_clashes(
+        tournament_id: UUID,
+        request: Request,
+        min_rest_minutes: int = Query(
+            settings.SCHEDULE_MIN_REST_MINUTES, ge=0, le=1440,
+            description="Minimum minutes between two matches of a participant"
+        ),
+        db: AsyncSession = Depends(get_read_db)
+):
+    """
+    Validate the whole schedule in one response.
+
+    Lists every pair of matches of the same participant that overlap
+    (kind "overlap", e.g. on two courts at once) or leave less than
+    min_rest_minutes between them (kind "rest"). Use after editing the
+    schedule by hand instead of checking match by match.
+    Supports conditional requests: answers If-None-Match with 304.
+    """
+    version = await TournamentService.get_tournament_version(db, tournament_id)
+    if version is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Tournament not found"
+        )
+    etag = weak_etag(*version, min_rest_minutes)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    checked_matches, clashes = await ScheduleService.find_participant_clashes(
+        db, tournament_id, min_rest_minutes
+    )
+    body = ScheduleValidationResponse(
+        tournament_id=tournament_id,
+        version=version[0],
+        min_rest_minutes=min_rest_minutes,
+        checked_matches=checked_matches,
+        clashes=clashes
+    ).model_dump_json()
+    response = Response(content=body, media_type="application/json")
+    set_etag_headers(response, etag)
+    return response
+
+
 # ==================== PARTICIPANT REGISTRATION ====================
 
 @router.post(
@@ -354,18 +533,19 @@ async def register_for_tournament(
     summary="Get tournament participants",
     description="Get all participants registered for a tournament"
 )
+@query_budget(1)
 async def get_tournament_participants(
         tournament_id: UUID,
         status: Optional[str] = Query(None, description="Filter by participant status"),
         skip: int = Query(0, ge=0),
         limit: int = Query(100, ge=1, le=100),
-        db: AsyncSession = Depends(get_db)
+        db: AsyncSession = Depends(get_read_db)
 ):
     """Get all participants for a tournament."""
     participants = await TournamentParticipantService.get_tournament_participants(
         db, tournament_id, status, skip, limit
     )
-    return participants
+    return participant_list_serializer.response(participants)
 
 
 @router.get(
@@ -377,7 +557,7 @@ async def get_tournament_participants(
 async def get_participant(
         tournament_id: UUID,
         participant_id: UUID,
-        db: AsyncSession = Depends(get_db)
+        db: AsyncSession = Depends(get_read_db)
 ):
     """Get participant by ID."""
     participant = await TournamentParticipantService.get_participant_by_id(
@@ -0,0 +1,40 @@
+"""
+In-process response cache
+
+Entries are stored with the version of the data they were built from
+(e.g. a tournament's change_version) and only returned for that version,
+so writes invalidate them without any explicit purge. Per process and
+bounded (least recently used entries are dropped).
+"""
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+from app.core.metrics import record_cache
+
+
+class VersionedCache:
+    """LRU cache of values valid for one version of their key"""
+
+    def __init__(self, name: str, maxsize: int):
+        self.name = name  # Metrics label
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+
+    def get(self, key: Hashable, version: Any) -> Optional[Any]:
+        """Value stored for key at exactly this version, else None"""
+        entry = self._entries.get(key)
+        hit = entry is not None and entry[0] == version
+        record_cache(self.name, hit)
+        if not hit:
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def set(self, key: Hashable, version: Any, value: Any) -> None:
+        self._entries[key] = (version, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
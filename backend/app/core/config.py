@@ -1,7 +1,7 @@
 """
 Core configuration using Pydantic Settings
 """
-from typing import List
+from typing import List, Optional
 from pydantic_settings import BaseSettings
 from pydantic import AnyHttpUrl, PostgresDsn, RedisDsn, validator
 
@@ -30,10 +30,32 @@ class Settings(BaseSettings):
     DATABASE_URL: PostgresDsn
     DATABASE_POOL_SIZE: int = 20
     DATABASE_MAX_OVERFLOW: int = 0
+    DATABASE_POOL_TIMEOUT: float = 5.0  # Seconds to wait for a connection before 503
+    DATABASE_POOL_RECYCLE: int = 1800  # Seconds; -1 disables
+    DATABASE_POOL_PRE_PING: bool = True
+    DATABASE_STATEMENT_CACHE_SIZE: int = 500  # 0 when running behind PgBouncer
+    DATABASE_STARTUP_MODE: str = "verify"  # verify | create_all | skip
+    DATABASE_POOL_WARMUP: int = 5  # Connections opened at startup
+    
+    # Read replica (optional; unset = all reads go to the primary)
+    DATABASE_READ_URL: Optional[PostgresDsn] = None
+    DATABASE_READ_POOL_SIZE: int = 20
+    DATABASE_READ_MAX_LAG_SECONDS: float = 5.0  # Fall back to primary above this
+    DATABASE_READ_CHECK_INTERVAL: float = 2.0  # Seconds between replica health checks
+    DATABASE_READ_STICKY_SECONDS: int = 10  # Read from primary this long after a write
     
     # Redis
     REDIS_URL: RedisDsn
     REDIS_CACHE_TTL: int = 3600
+    REDIS_SOCKET_TIMEOUT: float = 1.0
+    
+    # Health checks
+    HEALTH_CHECK_TIMEOUT: float = 0.5  # Per dependency check
+    HEALTH_CACHE_SECONDS: float = 1.5  # Reuse readiness result this long
+    HEALTH_MAX_LOOP_LAG_SECONDS: float = 0.5  # Not ready above this event loop lag
+    HEALTH_CHECK_REDIS: bool = True
+    SHUTDOWN_GRACE_SECONDS: float = 5.0  # Not ready but serving after SIGTERM (0 = stop at once)
+    SHUTDOWN_DRAIN_TIMEOUT: float = 10.0  # Wait for DB work before closing pools
     
     # CORS
     CORS_ORIGINS: List[str] = [
@@ -65,6 +87,44 @@ class Settings(BaseSettings):
     # Logging
     LOG_LEVEL: str = "INFO"
     
+    # Metrics (Prometheus, served on /metrics)
+    METRICS_ENABLED: bool = True
+    
+    # Query budgets / N+1 detection (development and test runs)
+    QUERY_BUDGET_ENABLED: bool = False
+    QUERY_BUDGET_ENFORCE: bool = False  # Raise instead of logging violations
+    QUERY_REPEAT_THRESHOLD: int = 5  # Same statement this often = N+1 warning
+    
+    # On-demand profiling (admin endpoints under /admin/profiling)
+    PROFILING_ENABLED: bool = False
+    PROFILING_MAX_PROFILES: int = 50  # Profiles kept in memory per worker
+    PROFILING_INTERVAL: float = 0.001  # Sampling interval in seconds
+    
+    # Standings storage
+    STANDINGS_BACKEND: str = "table"  # table | materialized_view
+    STANDINGS_VIEW_REFRESH_DELAY: float = 1.0  # Seconds to collect score updates per refresh
+    STANDINGS_RECALC_DELAY: float = 0.0  # table: 0 = recalculate per score update, else seconds to collect them
+    
+    # Bracket tree responses cached per tournament version (per worker)
+    BRACKET_CACHE_SIZE: int = 256
+    
+    # Schedule validation: minimum time between two matches of a participant
+    SCHEDULE_MIN_REST_MINUTES: int = 10
+    
+    # Live tournament engine (ACTIVE tournaments in memory; state is per worker)
+    LIVE_ENGINE_ENABLED: bool = False
+    LIVE_ENGINE_MAX_BATCH: int = 200  # Score events persisted per transaction
+    
+    # Background jobs (bracket generation, standings recalculation)
+    JOBS_BACKEND: str = "local"  # local | redis
+    JOBS_WORKER_ENABLED: bool = True  # Run jobs in the API process (always with local)
+    JOBS_WORKER_CONCURRENCY: int = 2  # Jobs run in parallel (never two per tournament)
+    JOBS_MAX_ATTEMPTS: int = 3
+    JOBS_RETRY_DELAY: float = 1.0  # Seconds before the first retry, doubled per attempt
+    JOBS_RESULT_TTL: int = 3600  # Seconds finished jobs stay readable
+    JOBS_LOCK_TIMEOUT: int = 60  # Seconds a job's lease and tournament lock outlive a dead worker (redis)
+    JOBS_POLL_INTERVAL: float = 0.2  # Seconds between queue polls (redis) and busy retries
+    
     class Config:
         env_file = ".env"
         case_sensitive = True
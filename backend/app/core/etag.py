@@ -0,0 +1,49 @@
+"""
+HTTP conditional request helpers (weak ETags / If-None-Match)
+"""
+import hashlib
+from typing import Any
+
+from fastapi import Request, Response, status
+
+from app.core.metrics import record_cache
+
+
+def weak_etag(*parts: Any) -> str:
+    """Build a weak ETag from version parts (e.g. timestamps and counts)"""
+    raw = "|".join(str(part) for part in parts).encode()
+    digest = hashlib.blake2b(raw, digest_size=12).hexdigest()
+    return f'W/"{digest}"'
+
+
+def _opaque_tag(etag: str) -> str:
+    """Strip the weak indicator for weak comparison (RFC 9110 8.8.3.2)"""
+    etag = etag.strip()
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the request's If-None-Match header matches etag"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    wanted = _opaque_tag(etag)
+    hit = header.strip() == "*" or any(
+        _opaque_tag(candidate) == wanted for candidate in header.split(",")
+    )
+    # Only revalidations count: requests without If-None-Match cannot hit
+    record_cache("http_etag", hit)
+    return hit
+
+
+def set_etag_headers(response: Response, etag: str) -> None:
+    """Attach ETag and force clients to revalidate before reusing the body"""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
+
+
+def not_modified(etag: str) -> Response:
+    """Empty 304 response for a matching If-None-Match"""
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    set_etag_headers(response, etag)
+    return response
@@ -0,0 +1,220 @@
+"""
+Readiness checks for load balancer probes
+
+Probes hit every worker every few seconds, so the dependency checks are
+cached for HEALTH_CACHE_SECONDS and run with tight timeouts: a probe never
+costs more than one pooled connection and one Redis PING per interval.
+
+On SIGTERM readiness fails at once, while the server keeps serving for
+SHUTDOWN_GRACE_SECONDS so the load balancer takes the worker out of
+rotation before it stops accepting connections (see ShutdownGrace).
+"""
+import asyncio
+import logging
+import signal
+import time
+from typing import Any, Dict, Optional
+
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.core.redis import get_redis
+from app.db.pool import pool_status
+from app.db.session import engine, read_engine
+
+logger = logging.getLogger(__name__)
+
+
+class LoopLagMonitor:
+    """
+    Measures event loop lag: how late a periodic sleep wakes up.
+
+    High lag means the worker is CPU-bound or blocked and will answer
+    requests slowly even if its dependencies are healthy.
+    """
+
+    def __init__(self, interval: float = 0.25):
+        self.interval = interval
+        self.lag_seconds = 0.0
+        self.max_lag_seconds = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.interval)
+            self.lag_seconds = max(loop.time() - start - self.interval, 0.0)
+            self.max_lag_seconds = max(self.max_lag_seconds, self.lag_seconds)
+
+
+loop_lag_monitor = LoopLagMonitor()
+
+
+async def _timed(check) -> Dict[str, Any]:
+    """Run a dependency check with the probe timeout"""
+    start = time.perf_counter()
+    try:
+        await asyncio.wait_for(check(), timeout=settings.HEALTH_CHECK_TIMEOUT)
+    except asyncio.TimeoutError:
+        return {"ok": False, "error": "timeout"}
+    except Exception as e:
+        return {"ok": False, "error": str(e) or type(e).__name__}
+    return {"ok": True, "latency_ms": round((time.perf_counter() - start) * 1000, 2)}
+
+
+async def _check_database() -> None:
+    # Goes through the pool, so an exhausted pool fails the probe
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+
+async def _check_redis() -> None:
+    await get_redis().ping()
+
+
+def _pool_utilization(status: Dict[str, Any]) -> Dict[str, Any]:
+    capacity = status.get("size", 0) + status.get("max_overflow", 0)
+    in_use = status.get("checked_out", 0)
+    return {
+        "in_use": in_use,
+        "capacity": capacity,
+        "utilization": round(in_use / capacity, 3) if capacity else None,
+        "timeouts": status.get("timeouts", 0),
+    }
+
+
+class ReadinessChecker:
+    """Cached readiness evaluation (one check in flight at a time)"""
+
+    def __init__(self):
+        self._result: Optional[Dict[str, Any]] = None
+        self._checked_at = float("-inf")
+        self._lock = asyncio.Lock()
+
+    async def check(self) -> Dict[str, Any]:
+        if self._fresh():
+            return self._result
+        async with self._lock:
+            if not self._fresh():
+                self._result = await self._evaluate()
+                self._checked_at = time.monotonic()
+        return self._result
+
+    def _fresh(self) -> bool:
+        return (
+            self._result is not None
+            and time.monotonic() - self._checked_at < settings.HEALTH_CACHE_SECONDS
+        )
+
+    async def _evaluate(self) -> Dict[str, Any]:
+        probes = {"database": _check_database}
+        if settings.HEALTH_CHECK_REDIS:
+            probes["redis"] = _check_redis
+        results = await asyncio.gather(*(_timed(probe) for probe in probes.values()))
+        checks = dict(zip(probes, results))
+
+        lag = loop_lag_monitor.lag_seconds
+        ready = (
+            all(result["ok"] for result in checks.values())
+            and lag <= settings.HEALTH_MAX_LOOP_LAG_SECONDS
+        )
+
+        pools = {"primary": _pool_utilization(pool_status(engine))}
+        if read_engine is not None:
+            pools["replica"] = _pool_utilization(pool_status(read_engine))
+
+        return {
+            "status": "ready" if ready else "not_ready",
+            "checks": checks,
+            "pool": pools,
+            "event_loop_lag_ms": round(lag * 1000, 2),
+            "event_loop_max_lag_ms": round(loop_lag_monitor.max_lag_seconds * 1000, 2),
+        }
+
+
+readiness_checker = ReadinessChecker()
+
+
+class ShutdownGrace:
+    """
+    Delays the server's SIGTERM handling by SHUTDOWN_GRACE_SECONDS.
+
+    Uvicorn stops accepting connections as soon as it handles SIGTERM, and
+    only runs the lifespan shutdown after that, too late to fail readiness.
+    This takes over SIGTERM after uvicorn installed its handlers: readiness
+    fails right away, requests are still served during the grace period,
+    then the signal is passed on as SIGINT (uvicorn treats the first one
+    like SIGTERM). A second SIGTERM ends the grace period early.
+    """
+
+    def __init__(self):
+        self.shutting_down = False
+        self._task: Optional[asyncio.Task] = None
+
+    def install(self) -> bool:
+        """
+        Take over SIGTERM (call from the lifespan startup).
+
+        Returns:
+            False if signals cannot be handled here (not the main thread,
+            Windows) or no grace period is configured
+        """
+        if settings.SHUTDOWN_GRACE_SECONDS <= 0:
+            return False
+        try:
+            asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, self._on_sigterm)
+        except (NotImplementedError, RuntimeError, ValueError):
+            return False
+        return True
+
+    def _on_sigterm(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            return
+        self.shutting_down = True
+        logger.info("SIGTERM: not ready, shutting down in %ss", settings.SHUTDOWN_GRACE_SECONDS)
+        self._task = asyncio.get_running_loop().create_task(self._exit_after_grace())
+
+    async def _exit_after_grace(self) -> None:
+        try:
+            await asyncio.sleep(settings.SHUTDOWN_GRACE_SECONDS)
+        finally:
+            signal.raise_signal(signal.SIGINT)
+
+
+shutdown_grace = ShutdownGrace()
+
+
+async def drain_connections(timeout: float) -> int:
+    """
+    Wait for in-flight database work to finish before the pools are closed.
+
+    Args:
+        timeout: Maximum seconds to wait
+
+    Returns:
+        Connections still checked out when the wait ended
+    """
+    engines = [e for e in (engine, read_engine) if e is not None]
+    deadline = time.monotonic() + timeout
+
+    def in_use() -> int:
+        return sum(e.pool.checkedout() for e in engines)
+
+    while in_use() and time.monotonic() < deadline:
+        await asyncio.sleep(0.05)
+    return in_use()
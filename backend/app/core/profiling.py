@@ -0,0 +1,272 @@
+"""
+On-demand request and function profiling
+
+Opt-in (PROFILING_ENABLED). Nothing is profiled until one of these
+triggers fires:
+- a superuser sends the X-Profile header with a request
+- the route template was enabled at runtime via the admin endpoints
+  (optionally sampled, e.g. 5% of requests)
+- a function decorated with @profiled(name) was enabled at runtime
+
+Profiles are captured with pyinstrument's sampling profiler (call tree,
+async aware). Database statement time is measured separately through
+engine events, so the remaining Python time is visible. The last
+PROFILING_MAX_PROFILES profiles are kept in memory per worker process.
+"""
+import functools
+import random
+import time
+import uuid
+from collections import deque
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, List, Optional, Set
+from uuid import UUID
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.routing import Match
+
+from app.core.config import settings
+
+PROFILE_HEADER = b"x-profile"
+PROFILE_ID_HEADER = b"x-profile-id"
+
+
+class DbTime:
+    """Statement count and time of the profiled call"""
+
+    __slots__ = ("queries", "seconds")
+
+    def __init__(self):
+        self.queries = 0
+        self.seconds = 0.0
+
+
+# Set while a profile is being captured (profiles never nest)
+_current_db_time: ContextVar[Optional[DbTime]] = ContextVar("profile_db_time", default=None)
+
+
+class ProfileStore:
+    """Runtime targets and the most recent profiles (per process)"""
+
+    def __init__(self, max_profiles: int):
+        self.routes: Set[str] = set()
+        self.functions: Set[str] = set()
+        self.available_functions: Set[str] = set()
+        self.sample_rate = 1.0
+        self._profiles: Deque[Dict[str, Any]] = deque(maxlen=max_profiles)
+
+    def configure(self, routes: List[str], functions: List[str], sample_rate: float) -> None:
+        self.routes = set(routes)
+        self.functions = set(functions)
+        self.sample_rate = sample_rate
+
+    def sampled(self) -> bool:
+        return self.sample_rate >= 1.0 or random.random() < self.sample_rate
+
+    def add(self, profile: Dict[str, Any]) -> None:
+        self._profiles.append(profile)
+
+    def get(self, profile_id: str) -> Optional[Dict[str, Any]]:
+        for profile in self._profiles:
+            if profile["id"] == profile_id:
+                return profile
+        return None
+
+    def list(self) -> List[Dict[str, Any]]:
+        """Summaries, newest first"""
+        return [
+            {k: v for k, v in profile.items() if k != "session"}
+            for profile in reversed(self._profiles)
+        ]
+
+    def clear(self) -> None:
+        self._profiles.clear()
+
+
+profile_store = ProfileStore(settings.PROFILING_MAX_PROFILES)
+
+
+class _Capture:
+    """One running profile: pyinstrument profiler plus DB time"""
+
+    def __init__(self, kind: str, target: str, method: Optional[str] = None, path: Optional[str] = None):
+        from pyinstrument import Profiler
+
+        self.info = {
+            "id": uuid.uuid4().hex[:12],
+            "kind": kind,
+            "target": target,
+            "method": method,
+            "path": path,
+            "started_at": datetime.utcnow().isoformat(),
+        }
+        self.db_time = DbTime()
+        self.profiler = Profiler(
+            interval=settings.PROFILING_INTERVAL, async_mode="enabled"
+        )
+
+    def start(self) -> None:
+        self._token = _current_db_time.set(self.db_time)
+        self._start = time.perf_counter()
+        self.profiler.start()
+
+    def stop(self, status_code: Optional[int] = None) -> Dict[str, Any]:
+        session = self.profiler.stop()
+        duration = time.perf_counter() - self._start
+        _current_db_time.reset(self._token)
+
+        profile = {
+            **self.info,
+            "status_code": status_code,
+            "duration_ms": round(duration * 1000, 2),
+            "db_queries": self.db_time.queries,
+            "db_ms": round(self.db_time.seconds * 1000, 2),
+            "python_ms": round(max(duration - self.db_time.seconds, 0.0) * 1000, 2),
+            "session": session,
+        }
+        profile_store.add(profile)
+        return profile
+
+
+def render_profile(profile: Dict[str, Any], html: bool = False) -> str:
+    """Render a stored profile's call tree as text or HTML"""
+    from pyinstrument.renderers import ConsoleRenderer, HTMLRenderer
+
+    if html:
+        return HTMLRenderer().render(profile["session"])
+    return ConsoleRenderer(unicode=True, color=False, show_all=False).render(profile["session"])
+
+
+def install_profiling_db_timer(engine: AsyncEngine) -> None:
+    """Attribute statement time to the profile being captured"""
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if _current_db_time.get() is not None:
+            conn.info["profile_query_start"] = time.perf_counter()
+
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        db_time = _current_db_time.get()
+        start = conn.info.pop("profile_query_start", None)
+        if db_time is not None and start is not None:
+            db_time.queries += 1
+            db_time.seconds += time.perf_counter() - start
+
+    event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", after_cursor_execute)
+
+
+def profiled(name: str) -> Callable:
+    """
+    Make an async function profileable at runtime under name.
+
+    Calls are only profiled while name is enabled via the admin endpoints
+    and no other profile is running (e.g. the whole request).
+    """
+    def decorator(func):
+        if not settings.PROFILING_ENABLED:
+            return func
+        profile_store.available_functions.add(name)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            if (
+                name not in profile_store.functions
+                or _current_db_time.get() is not None
+                or not profile_store.sampled()
+            ):
+                return await func(*args, **kwargs)
+
+            capture = _Capture("function", name)
+            capture.start()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                capture.stop()
+        return wrapper
+    return decorator
+
+
+async def _is_superuser(authorization: str) -> bool:
+    """Check a bearer token belongs to an active superuser"""
+    from app.core.security import verify_token
+    from app.db.session import AsyncSessionLocal
+    from app.services.user_service import UserService
+
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return False
+    payload = verify_token(token, token_type="access")
+    if not payload or not payload.get("sub"):
+        return False
+    try:
+        user_id = UUID(payload["sub"])
+    except ValueError:
+        return False
+
+    async with AsyncSessionLocal() as db:
+        user = await UserService.get_by_id(db, user_id)
+    return bool(user and user.is_active and user.is_superuser)
+
+
+class ProfilingMiddleware:
+    """
+    Profile selected requests.
+
+    Adds an X-Profile-Id header to profiled responses; the profile is then
+    available from the admin profiling endpoints.
+    """
+
+    def __init__(self, app, router):
+        self.app = app
+        self.router = router
+
+    def _route_template(self, scope) -> Optional[str]:
+        for route in self.router.routes:
+            match, _ = route.matches(scope)
+            if match == Match.FULL:
+                return getattr(route, "path", None)
+        return None
+
+    async def _target(self, scope) -> Optional[str]:
+        """Route template to profile this request under, or None"""
+        headers = dict(scope["headers"])
+        if PROFILE_HEADER in headers:
+            authorization = headers.get(b"authorization", b"").decode("latin-1")
+            if await _is_superuser(authorization):
+                return self._route_template(scope) or scope["path"]
+
+        if profile_store.routes:
+            template = self._route_template(scope)
+            if template in profile_store.routes and profile_store.sampled():
+                return template
+        return None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        target = await self._target(scope)
+        if target is None:
+            await self.app(scope, receive, send)
+            return
+
+        capture = _Capture("request", target, scope["method"], scope["path"])
+        status_code = None
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = list(message.get("headers", []))
+                headers.append((PROFILE_ID_HEADER, capture.info["id"].encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        capture.start()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            capture.stop(status_code)
@@ -0,0 +1,31 @@
+"""
+Shared Redis client
+"""
+from typing import Optional
+
+from redis.asyncio import Redis
+
+from app.core.config import settings
+
+_client: Optional[Redis] = None
+
+
+def get_redis() -> Redis:
+    """Process-wide Redis client (connection pool created on first use)"""
+    global _client
+    if _client is None:
+        _client = Redis.from_url(
+            str(settings.REDIS_URL),
+            socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+            health_check_interval=30,
+        )
+    return _client
+
+
+async def close_redis() -> None:
+    """Close the Redis connection pool"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -0,0 +1,72 @@
+"""
+High-performance JSON responses.
+
+FastAPI's default path validates the return value against the response
+model, converts it with jsonable_encoder and renders it with json.dumps.
+For large lists this per-item Python work dominates the request time, so
+list endpoints can opt into the helpers below instead.
+"""
+from decimal import Decimal
+from typing import Any, Generic, Iterable, List, Type, TypeVar
+
+import orjson
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel, TypeAdapter
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Serialize types orjson does not handle natively"""
+    if isinstance(obj, Decimal):
+        # Same representation Pydantic uses in JSON mode
+        return str(obj)
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+
+    UUID and datetime values are serialized natively, Decimal values as
+    strings (matching Pydantic's JSON mode).
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_orjson_default,
+            option=orjson.OPT_NON_STR_KEYS,
+        )
+
+
+class ModelListSerializer(Generic[ModelT]):
+    """
+    Bulk serializer for list endpoints.
+
+    Validates ORM objects (or rows) into the response model and dumps the
+    whole list to JSON in one call to pydantic-core, bypassing
+    jsonable_encoder. Build one instance per response model at import time.
+    """
+
+    def __init__(self, model: Type[ModelT]):
+        self.model = model
+        self._adapter = TypeAdapter(List[model])
+
+    def validate(self, items: Iterable[Any]) -> List[ModelT]:
+        """Validate items into response models (model instances pass through)"""
+        return self._adapter.validate_python(list(items), from_attributes=True)
+
+    def dump_json(self, items: Iterable[Any]) -> bytes:
+        """Validate items and serialize them as a JSON array"""
+        return self._adapter.dump_json(self.validate(items))
+
+    def response(self, items: Iterable[Any], status_code: int = 200) -> Response:
+        """Build a ready-to-send JSON response for items"""
+        return Response(
+            content=self.dump_json(items),
+            status_code=status_code,
+            media_type="application/json",
+        )
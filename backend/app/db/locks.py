@@ -0,0 +1,87 @@
+"""
+Per-tournament advisory locks
+
+Operations that read a tournament's state and write based on it (bracket
+generation, standings recalculation, registrations) take a transaction-
+scoped Postgres advisory lock on the tournament first, so two of them
+never interleave. The lock is released at commit or rollback.
+
+- lock_tournament() waits for the lock: short transactions (score
+  updates, registrations, every change version bump) and background work
+- try_lock_tournament() raises TournamentBusyError right away if another
+  transaction holds it (answered with 409): slow operations (bracket
+  generation, referee assignment), so contending requests fail fast
+  instead of holding connections while they queue
+
+Lock order: ChangeFeedService.bump_version takes the lock before it
+row-locks the tournament, so every writer takes the advisory lock first
+and writers of one tournament cannot deadlock on the two locks. Pending
+ORM changes are not flushed before locking for the same reason.
+"""
+from uuid import UUID
+
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+# Session.info key: tournaments locked by the current transaction
+LOCKED_TOURNAMENTS = "locked_tournaments"
+
+
+class TournamentBusyError(Exception):
+    """Another transaction holds the tournament's lock"""
+
+    def __init__(self, tournament_id: UUID):
+        super().__init__("Tournament is busy with another operation, please retry")
+        self.tournament_id = tournament_id
+
+
+def tournament_lock_key(tournament_id: UUID) -> int:
+    """Advisory lock key of a tournament (the same in every process, unlike hash())"""
+    return int.from_bytes(tournament_id.bytes[:8], "big", signed=True)
+
+
+async def lock_tournament(db: AsyncSession, tournament_id: UUID) -> None:
+    """
+    Lock the tournament until the transaction ends, waiting if needed.
+
+    Args:
+        db: Database session
+        tournament_id: Tournament UUID
+    """
+    locked = db.info.setdefault(LOCKED_TOURNAMENTS, set())
+    if tournament_id in locked:
+        return
+    with db.no_autoflush:
+        await db.execute(select(func.pg_advisory_xact_lock(tournament_lock_key(tournament_id))))
+    locked.add(tournament_id)
+
+
+async def try_lock_tournament(db: AsyncSession, tournament_id: UUID) -> None:
+    """
+    Lock the tournament until the transaction ends, without waiting.
+
+    Args:
+        db: Database session
+        tournament_id: Tournament UUID
+
+    Raises:
+        TournamentBusyError: If another transaction holds the lock
+    """
+    locked = db.info.setdefault(LOCKED_TOURNAMENTS, set())
+    if tournament_id in locked:
+        return
+    with db.no_autoflush:
+        result = await db.execute(
+            select(func.pg_try_advisory_xact_lock(tournament_lock_key(tournament_id)))
+        )
+    if not result.scalar():
+        raise TournamentBusyError(tournament_id)
+    locked.add(tournament_id)
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _release_locks(session: Session) -> None:
+    # Transaction-scoped: Postgres released them with the transaction
+    session.info.pop(LOCKED_TOURNAMENTS, None)
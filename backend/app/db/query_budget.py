@@ -0,0 +1,172 @@
+"""
+SQL query budgets and N+1 detection (development and test instrumentation)
+
+Enabled with QUERY_BUDGET_ENABLED. Every statement sent through an
+instrumented engine is recorded by the active QueryCounter(s):
+
+- QueryCountMiddleware counts per request, adds an X-Query-Count header
+  and warns about statement shapes repeated QUERY_REPEAT_THRESHOLD times
+  (the N+1 pattern: one query per loop iteration).
+- @query_budget(n) declares the maximum number of statements for an
+  endpoint or service call. With QUERY_BUDGET_ENFORCE exceeding it raises
+  QueryBudgetExceeded (an AssertionError, so test runs fail loudly);
+  otherwise it is logged.
+
+When disabled the decorator returns the function unchanged and no engine
+events are registered.
+"""
+import functools
+import logging
+import re
+from collections import Counter
+from contextvars import ContextVar
+from typing import Callable, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_active_counters: ContextVar[Tuple["QueryCounter", ...]] = ContextVar(
+    "active_query_counters", default=()
+)
+
+_PARAMETER_LIST = re.compile(r"\$\d+(?:\s*,\s*\$\d+)*")
+_WHITESPACE = re.compile(r"\s+")
+
+
+class QueryBudgetExceeded(AssertionError):
+    """More statements (or repeated statements) than the declared budget."""
+
+
+def statement_shape(statement: str) -> str:
+    """Normalize a statement so the same query with different IN-list lengths matches"""
+    return _WHITESPACE.sub(" ", _PARAMETER_LIST.sub("?", statement)).strip()
+
+
+class QueryCounter:
+    """
+    Records statements executed while active (usable as a context manager).
+
+    Counters nest: an endpoint budget inside a request counter sees only
+    its own statements, the request counter sees all of them.
+    """
+
+    def __init__(self, label: str = ""):
+        self.label = label
+        self.statements: List[str] = []
+        self._token = None
+
+    def __enter__(self) -> "QueryCounter":
+        self._token = _active_counters.set(_active_counters.get() + (self,))
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        _active_counters.reset(self._token)
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """Statement shapes executed at least threshold times"""
+        shapes = Counter(statement_shape(s) for s in self.statements)
+        return [(shape, n) for shape, n in shapes.most_common() if n >= threshold]
+
+    def check(self, max_queries: Optional[int] = None, max_repeats: Optional[int] = None) -> List[str]:
+        """
+        Compare the recorded statements with a budget.
+
+        Args:
+            max_queries: Maximum number of statements (None = unlimited)
+            max_repeats: Maximum executions of one statement shape
+                (None = QUERY_REPEAT_THRESHOLD - 1)
+
+        Returns:
+            Violation messages (empty if within budget)
+        """
+        if max_repeats is None:
+            max_repeats = settings.QUERY_REPEAT_THRESHOLD - 1
+
+        violations = []
+        if max_queries is not None and self.count > max_queries:
+            violations.append(
+                f"{self.label}: {self.count} queries, budget {max_queries}"
+            )
+        for shape, n in self.repeated(max_repeats + 1):
+            violations.append(
+                f"{self.label}: possible N+1, {n}x {shape[:200]}"
+            )
+        return violations
+
+
+def _record_statement(conn, cursor, statement, parameters, context, executemany):
+    for counter in _active_counters.get():
+        counter.statements.append(statement)
+
+
+def install_query_counter(engine: AsyncEngine) -> None:
+    """Record engine statements in the active counters"""
+    event.listen(engine.sync_engine, "before_cursor_execute", _record_statement)
+
+
+def _report(violations: List[str]) -> None:
+    if not violations:
+        return
+    if settings.QUERY_BUDGET_ENFORCE:
+        raise QueryBudgetExceeded("; ".join(violations))
+    for violation in violations:
+        logger.warning("Query budget: %s", violation)
+
+
+def query_budget(max_queries: int, max_repeats: Optional[int] = None) -> Callable:
+    """
+    Declare the statement budget of an async endpoint or service function.
+
+    Args:
+        max_queries: Maximum statements per call
+        max_repeats: Maximum executions of one statement shape
+            (default QUERY_REPEAT_THRESHOLD - 1)
+    """
+    def decorator(func):
+        if not settings.QUERY_BUDGET_ENABLED:
+            return func
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            with QueryCounter(func.__qualname__) as counter:
+                result = await func(*args, **kwargs)
+            _report(counter.check(max_queries, max_repeats))
+            return result
+        return wrapper
+    return decorator
+
+
+class QueryCountMiddleware:
+    """Count statements per request, expose X-Query-Count and warn on N+1"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        counter = QueryCounter(f"{scope['method']} {scope['path']}")
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"x-query-count", str(counter.count).encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        with counter:
+            await self.app(scope, receive, send_wrapper)
+
+        # Requests are only observed (budgets are declared per endpoint)
+        for violation in counter.check():
+            logger.warning("Query budget: %s", violation)
@@ -0,0 +1,138 @@
+"""
+Read replica routing helpers
+
+Read-only routes use the replica through get_read_db (see session.py).
+The replica is only used while it is reachable and its replication lag is
+below DATABASE_READ_MAX_LAG_SECONDS, and never for a client that wrote
+within the last DATABASE_READ_STICKY_SECONDS (read-your-writes).
+
+A single Postgres instance can stand in for the replica locally: a
+primary reports a lag of zero.
+"""
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Cookie marking clients that must read from the primary
+PRIMARY_STICKY_COOKIE = "utp_read_primary"
+
+# Methods that do not change data (no stickiness needed)
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+# Seconds the replica has not yet replayed; 0 when caught up or on a primary
+REPLICATION_LAG_SQL = text("""
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(
+            EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0
+        )
+    END
+""")
+
+
+class ReplicaMonitor:
+    """
+    Cached replica health check.
+
+    The replica is probed at most once per DATABASE_READ_CHECK_INTERVAL;
+    requests in between reuse the last result.
+    """
+
+    def __init__(self, engine: Optional[AsyncEngine]):
+        self.engine = engine
+        self.usable = False
+        self.lag_seconds: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self._checked_at = float("-inf")
+        self._lock = asyncio.Lock()
+
+    async def is_usable(self) -> bool:
+        """Whether read-only queries may currently go to the replica"""
+        if self.engine is None:
+            return False
+        if time.monotonic() - self._checked_at < settings.DATABASE_READ_CHECK_INTERVAL:
+            return self.usable
+
+        async with self._lock:
+            # Another request may have refreshed while we waited
+            if time.monotonic() - self._checked_at >= settings.DATABASE_READ_CHECK_INTERVAL:
+                await self._check()
+                self._checked_at = time.monotonic()
+        return self.usable
+
+    async def _check(self) -> None:
+        """Probe the replica and update the cached state"""
+        try:
+            self.lag_seconds = await asyncio.wait_for(
+                self._fetch_lag(), timeout=settings.DATABASE_POOL_TIMEOUT
+            )
+            self.last_error = None
+        except Exception as e:
+            if self.usable or self.last_error is None:
+                logger.warning("Read replica unavailable, using primary: %s", e)
+            self.usable = False
+            self.lag_seconds = None
+            self.last_error = str(e) or type(e).__name__
+            return
+
+        usable = self.lag_seconds <= settings.DATABASE_READ_MAX_LAG_SECONDS
+        if usable != self.usable:
+            logger.info(
+                "Read replica %s (lag %.1fs)",
+                "enabled" if usable else "disabled", self.lag_seconds
+            )
+        self.usable = usable
+
+    async def _fetch_lag(self) -> float:
+        async with self.engine.connect() as conn:
+            result = await conn.execute(REPLICATION_LAG_SQL)
+            return float(result.scalar() or 0)
+
+    def status(self) -> Dict[str, Any]:
+        """Last known replica state"""
+        return {
+            "configured": self.engine is not None,
+            "usable": self.usable,
+            "lag_seconds": self.lag_seconds,
+            "max_lag_seconds": settings.DATABASE_READ_MAX_LAG_SECONDS,
+            "last_error": self.last_error,
+        }
+
+
+class ReadYourWritesMiddleware:
+    """
+    Pin clients to the primary for a short time after a successful write.
+
+    Sets a short-lived cookie on responses to non-safe requests, which
+    get_read_db honours by skipping the replica.
+    """
+
+    def __init__(self, app, sticky_seconds: int):
+        self.app = app
+        self.cookie = (
+            f"{PRIMARY_STICKY_COOKIE}=1; Max-Age={sticky_seconds}; "
+            "Path=/; HttpOnly; SameSite=Lax"
+        ).encode("latin-1")
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] in SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                headers = list(message.get("headers", []))
+                headers.append((b"set-cookie", self.cookie))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -2,6 +2,7 @@
 Database session management with SQLAlchemy
 """
 from typing import AsyncGenerator
+from fastapi import Request
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     create_async_engine,
@@ -9,14 +10,38 @@ from sqlalchemy.ext.asyncio import (
 )
 from sqlalchemy.orm import declarative_base
 from app.core.config import settings
+from app.db.pool import InstrumentedAsyncPool
+from app.db.replica import PRIMARY_STICKY_COOKIE, ReplicaMonitor
 
-# Create async engine
-engine = create_async_engine(
-    str(settings.DATABASE_URL),
-    echo=settings.DEBUG,
-    future=True,
-    pool_size=settings.DATABASE_POOL_SIZE,
-    max_overflow=settings.DATABASE_MAX_OVERFLOW,
+
+def _create_engine(url: str, pool_size: int):
+    """Create an async engine with the configured pool settings"""
+    return create_async_engine(
+        url,
+        echo=settings.DEBUG,
+        future=True,
+        poolclass=InstrumentedAsyncPool,
+        pool_size=pool_size,
+        max_overflow=settings.DATABASE_MAX_OVERFLOW,
+        # Fail fast (503) instead of queueing requests behind a saturated pool
+        pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+        pool_recycle=settings.DATABASE_POOL_RECYCLE,
+        pool_pre_ping=settings.DATABASE_POOL_PRE_PING,
+        connect_args={
+            # Per-connection cache of prepared asyncpg statements; every
+            # distinct SQL string is prepared once per connection
+            "prepared_statement_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE,
+        },
+    )
+
+
+# Create async engine (primary, all writes)
+engine = _create_engine(str(settings.DATABASE_URL), settings.DATABASE_POOL_SIZE)
+
+# Optional read replica engine for read-only routes
+read_engine = (
+    _create_engine(str(settings.DATABASE_READ_URL), settings.DATABASE_READ_POOL_SIZE)
+    if settings.DATABASE_READ_URL else None
 )
 
 # Create session factory
@@ -28,6 +53,16 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False,
 )
 
+ReadSessionLocal = async_sessionmaker(
+    read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autocommit=False,
+    autoflush=False,
+) if read_engine is not None else None
+
+replica_monitor = ReplicaMonitor(read_engine)
+
 # Base class for models
 Base = declarative_base()
 
@@ -35,6 +70,9 @@ Base = declarative_base()
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency for getting async database sessions
+
+    Owns the request's transaction: services only flush, the session is
+    committed once after the endpoint returns (or rolled back on error).
     """
     async with AsyncSessionLocal() as session:
         try:
@@ -47,6 +85,31 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency for read-only routes.
+
+    Uses the read replica when one is configured and healthy. Falls back to
+    the primary when the replica is down or lagging, and for clients that
+    wrote recently (read-your-writes, see ReadYourWritesMiddleware).
+    Sessions are never committed.
+    """
+    session_factory = AsyncSessionLocal
+    if (
+        ReadSessionLocal is not None
+        and PRIMARY_STICKY_COOKIE not in request.cookies
+        and await replica_monitor.is_usable()
+    ):
+        session_factory = ReadSessionLocal
+
+    async with session_factory() as session:
+        try:
+            yield session
+        finally:
+            await session.rollback()
+            await session.close()
+
+
 async def init_db():
     """Initialize database (create tables)"""
     async with engine.begin() as conn:
@@ -56,3 +119,5 @@ async def init_db():
 async def close_db():
     """Close database connections"""
     await engine.dispose()
+    if read_engine is not None:
+        await read_engine.dispose()
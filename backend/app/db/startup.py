@@ -0,0 +1,130 @@
+"""
+Database preparation on application startup
+
+DATABASE_STARTUP_MODE selects the schema work each worker does at boot:
+- "verify": one query comparing alembic_version with the migration head
+- "create_all": Base.metadata.create_all (local development without Alembic)
+- "skip": no schema work at all
+
+Migrations themselves are applied out of band (alembic upgrade head).
+"""
+import asyncio
+import logging
+from pathlib import Path
+from typing import Optional, Set
+
+from sqlalchemy import text
+from sqlalchemy.exc import ProgrammingError
+
+from app.core.config import settings
+from app.db.session import engine, init_db
+
+logger = logging.getLogger(__name__)
+
+STARTUP_MODES = ("verify", "create_all", "skip")
+
+ALEMBIC_DIR = Path(__file__).resolve().parents[2] / "alembic"
+
+
+class SchemaVersionError(RuntimeError):
+    """Database schema is older than the code expects."""
+
+
+def _migration_revisions() -> tuple:
+    """Head revision and all known revisions of the bundled migrations"""
+    from alembic.script import ScriptDirectory
+
+    script = ScriptDirectory(str(ALEMBIC_DIR))
+    known: Set[str] = {rev.revision for rev in script.walk_revisions()}
+    return script.get_current_head(), known
+
+
+async def _current_revision() -> Optional[str]:
+    async with engine.connect() as conn:
+        try:
+            result = await conn.execute(text("SELECT version_num FROM alembic_version"))
+        except ProgrammingError:
+            return None  # Table missing: never migrated
+        return result.scalar()
+
+
+async def verify_schema() -> str:
+    """
+    Check that the database is migrated to the code's Alembic head.
+
+    A database ahead of the code (a newer release migrated it during a
+    rolling deploy) is accepted with a warning; a database behind it is not.
+
+    Returns:
+        Current database revision
+
+    Raises:
+        SchemaVersionError: If the database is not migrated to head
+    """
+    head, known = _migration_revisions()
+    current = await _current_revision()
+
+    if current == head:
+        return current
+    if current is not None and current not in known:
+        logger.warning(
+            "Database revision %s is newer than code head %s", current, head
+        )
+        return current
+    raise SchemaVersionError(
+        f"Database revision {current or 'none'} does not match migration head "
+        f"{head}; run 'alembic upgrade head'"
+    )
+
+
+async def warm_pool(connections: int) -> int:
+    """
+    Open pool connections up front so the first requests do not pay for
+    connection setup.
+
+    Args:
+        connections: Number of connections to open (capped at pool size)
+
+    Returns:
+        Number of connections opened
+    """
+    connections = min(connections, settings.DATABASE_POOL_SIZE)
+
+    async def ping():
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(ping() for _ in range(connections)))
+    return connections
+
+
+async def prepare_database() -> str:
+    """
+    Run the configured schema step and warm the connection pool.
+
+    Returns:
+        Short description of what was done (for the startup log)
+
+    Raises:
+        ValueError: If DATABASE_STARTUP_MODE is unknown
+        SchemaVersionError: If verification fails
+    """
+    mode = settings.DATABASE_STARTUP_MODE
+    if mode not in STARTUP_MODES:
+        raise ValueError(
+            f"Invalid DATABASE_STARTUP_MODE {mode!r}, expected one of {STARTUP_MODES}"
+        )
+
+    if mode == "create_all":
+        await init_db()
+        summary = "tables created"
+    elif mode == "verify":
+        summary = f"schema at revision {await verify_schema()}"
+    else:
+        summary = "schema check skipped"
+
+    if settings.DATABASE_POOL_WARMUP > 0:
+        warmed = await warm_pool(settings.DATABASE_POOL_WARMUP)
+        summary += f", {warmed} connections warmed"
+
+    return summary
@@ -0,0 +1,45 @@
+"""
+Tournament engine: pure bracket, schedule and standings algorithms
+
+No database access and no async: the services load rows, call into the
+engine and persist the results. This keeps the algorithms testable and
+benchmarkable in isolation (see benchmarks/engine.py).
+"""
+from app.engine.live import LiveEntry, LiveMatch, LiveStanding, LiveTournament
+from app.engine.pairings import knockout_round_names, round_robin_pairings
+from app.engine.referees import RefereeCalendar, assign_referees
+from app.engine.schedule import OVERLAP, REST, ScheduleClash, find_clashes
+from app.engine.scoring import apply_score, parse_result_time
+from app.engine.standings import (
+    POSITION_POINTS,
+    StandingTally,
+    apply_match,
+    apply_results,
+    apply_multi_player_match,
+    apply_two_player_match,
+    rank_key,
+)
+
+__all__ = [
+    "LiveEntry",
+    "LiveMatch",
+    "LiveStanding",
+    "LiveTournament",
+    "knockout_round_names",
+    "round_robin_pairings",
+    "RefereeCalendar",
+    "assign_referees",
+    "OVERLAP",
+    "REST",
+    "ScheduleClash",
+    "find_clashes",
+    "apply_score",
+    "parse_result_time",
+    "POSITION_POINTS",
+    "StandingTally",
+    "apply_match",
+    "apply_results",
+    "apply_multi_player_match",
+    "apply_two_player_match",
+    "rank_key",
+]
@@ -0,0 +1,182 @@
+"""
+Live tournament state
+
+Compact in-memory copy of an active tournament: its matches with their
+participants (linked into the bracket graph by feeds_into_match_id) and
+the standings computed from them. Score updates are applied with the same
+rules as the database path (app.engine.scoring, app.engine.standings);
+persisting them is up to the caller (LiveTournamentService).
+
+Participants are kept as the objects they were loaded as (read-only
+reference data while a tournament is running).
+"""
+from datetime import datetime
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+from uuid import UUID
+
+from app.engine.scoring import apply_score
+from app.engine.standings import StandingTally, apply_match, rank_key
+
+# Match attributes mirrored in memory (everything a match response shows)
+MATCH_FIELDS = (
+    "id", "tournament_id", "round_number", "match_number", "round_name",
+    "group_name", "phase", "scheduled_start", "scheduled_end", "actual_start",
+    "actual_end", "venue_name", "court_field_number", "status", "match_format",
+    "duration_minutes", "is_finished", "winner_participant_id", "score_data",
+    "notes", "is_bye", "requires_referee", "referee_user_id",
+    "dependent_on_match_ids", "feeds_into_match_id", "change_version",
+    "created_at", "updated_at",
+)
+
+ENTRY_FIELDS = (
+    "id", "match_id", "participant_id", "slot_number", "team_side",
+    "final_position", "score_value", "result_time", "is_winner",
+    "is_disqualified", "detailed_score", "notes", "created_at",
+)
+
+# Standings columns are Numeric(10, 2)
+CENTS = Decimal("0.01")
+
+
+def _copy(target: Any, source: Any, fields: Sequence[str]) -> None:
+    for name in fields:
+        setattr(target, name, getattr(source, name))
+
+
+class LiveEntry:
+    """Participant of a live match (same attributes as MatchParticipant)"""
+
+    __slots__ = ENTRY_FIELDS
+
+    def __init__(self, source: Any):
+        _copy(self, source, ENTRY_FIELDS)
+
+
+class LiveMatch:
+    """Live match (same attributes as Match, participants ordered by slot)"""
+
+    __slots__ = MATCH_FIELDS + ("participants", "winner")
+
+    def __init__(self, source: Any, participants: List[LiveEntry], winner: Any = None):
+        _copy(self, source, MATCH_FIELDS)
+        self.participants = participants
+        self.winner = winner
+
+
+class LiveStanding(StandingTally):
+    """Standing computed in memory (same attributes as TournamentStandings)"""
+
+    __slots__ = (
+        "id", "tournament_id", "participant_id", "group_name", "participant",
+        "current_rank", "previous_rank", "recent_form", "additional_stats",
+        "created_at", "updated_at",
+    )
+
+
+class LiveTournament:
+    """
+    Matches, participants and standings of one active tournament.
+
+    Not thread- or task-safe: one owner (the tournament's actor) applies
+    all changes; readers only call match() and standings().
+    """
+
+    __slots__ = ("id", "version", "participants", "matches", "_standings", "_ranks")
+
+    def __init__(
+        self,
+        tournament_id: UUID,
+        version: int,
+        participants: Iterable[Any],
+        matches: Iterable[LiveMatch]
+    ):
+        self.id = tournament_id
+        self.version = version  # Tournament change_version this state reflects
+        self.participants: Dict[UUID, Any] = {p.id: p for p in participants}
+        self.matches: Dict[UUID, LiveMatch] = {m.id: m for m in matches}
+        self._standings: Dict[Optional[str], List[LiveStanding]] = {}
+        self._ranks: Dict[Optional[str], Dict[UUID, int]] = {}
+
+    def match(self, match_id: UUID) -> Optional[LiveMatch]:
+        return self.matches.get(match_id)
+
+    def apply_score(self, match_id: UUID, score_data: Any, now: datetime) -> LiveMatch:
+        """
+        Apply a score update to a match.
+
+        Args:
+            match_id: Match UUID
+            score_data: Score update (see app.engine.scoring.apply_score)
+            now: Update timestamp
+
+        Returns:
+            Updated match
+
+        Raises:
+            ValueError: If match not found or score invalid
+        """
+        match = self.matches.get(match_id)
+        if match is None:
+            raise ValueError("Match not found")
+
+        apply_score(match, score_data, now)
+        match.winner = self.participants.get(match.winner_participant_id)
+        self._standings.clear()
+        return match
+
+    def standings(self, group_name: Optional[str] = None) -> List[LiveStanding]:
+        """
+        Standings of the tournament or one group (cached until the next score).
+
+        Ties keep the participants' load order (registration order).
+
+        Args:
+            group_name: Optional group filter
+
+        Returns:
+            List of standings (sorted by rank)
+        """
+        cached = self._standings.get(group_name)
+        if cached is not None:
+            return cached
+
+        participants = [
+            p for p in self.participants.values()
+            if not group_name or p.group_assignment == group_name
+        ]
+        tallies = {p.id: LiveStanding() for p in participants}
+        for match in self.matches.values():
+            if not match.is_finished or match.is_bye:
+                continue
+            if group_name and match.group_name != group_name:
+                continue
+            apply_match(match.participants, tallies)
+
+        participants.sort(key=lambda p: rank_key(tallies[p.id]))
+
+        previous = self._ranks.get(group_name, {})
+        ranks = self._ranks[group_name] = {}
+        standings = []
+        for rank, participant in enumerate(participants, start=1):
+            standing = tallies[participant.id]
+            standing.score_for = standing.score_for.quantize(CENTS, ROUND_HALF_UP)
+            standing.score_against = standing.score_against.quantize(CENTS, ROUND_HALF_UP)
+            standing.score_difference = standing.score_difference.quantize(CENTS, ROUND_HALF_UP)
+            # No row of its own: the participant identifies the standing
+            standing.id = participant.id
+            standing.tournament_id = self.id
+            standing.participant_id = participant.id
+            standing.group_name = group_name
+            standing.participant = participant
+            standing.current_rank = rank
+            standing.previous_rank = previous.get(participant.id)
+            standing.recent_form = None
+            standing.additional_stats = None
+            standing.created_at = participant.created_at
+            standing.updated_at = participant.updated_at
+            ranks[participant.id] = rank
+            standings.append(standing)
+
+        self._standings[group_name] = standings
+        return standings
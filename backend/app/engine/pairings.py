@@ -0,0 +1,67 @@
+"""
+Bracket and schedule pairings
+"""
+from typing import List, Tuple
+
+
+def knockout_round_names(num_rounds: int) -> List[str]:
+    """
+    Generate round names for a knockout bracket.
+    
+    Args:
+        num_rounds: Number of rounds
+        
+    Returns:
+        List of round names (first round first)
+    """
+    if num_rounds == 1:
+        return ["Final"]
+    elif num_rounds == 2:
+        return ["Semifinal", "Final"]
+    elif num_rounds == 3:
+        return ["Quarterfinal", "Semifinal", "Final"]
+    elif num_rounds == 4:
+        return ["Round of 16", "Quarterfinal", "Semifinal", "Final"]
+    elif num_rounds == 5:
+        return ["Round of 32", "Round of 16", "Quarterfinal", "Semifinal", "Final"]
+    else:
+        # For larger tournaments
+        names = [f"Round {i}" for i in range(1, num_rounds - 2)]
+        names.extend(["Quarterfinal", "Semifinal", "Final"])
+        return names
+
+
+def round_robin_pairings(n: int) -> List[List[Tuple[int, int]]]:
+    """
+    Generate round-robin pairings using the circle method.
+    
+    Every participant meets every other participant exactly once. With an
+    odd number of participants a dummy is added; whoever is paired with
+    the dummy sits the round out.
+    
+    Args:
+        n: Number of participants
+        
+    Returns:
+        List of rounds, each containing list of (home, away) index tuples
+    """
+    dummy = n if n % 2 == 1 else None
+    size = n + 1 if dummy is not None else n
+    
+    rounds = []
+    participants = list(range(size))
+    
+    for _ in range(size - 1):
+        round_pairings = []
+        
+        for i in range(size // 2):
+            home, away = participants[i], participants[-(i + 1)]
+            if home != dummy and away != dummy:
+                round_pairings.append((home, away))
+        
+        rounds.append(round_pairings)
+        
+        # Rotate participants (keep first fixed)
+        participants = [participants[0], participants[-1]] + participants[1:-1]
+    
+    return rounds
@@ -0,0 +1,161 @@
+"""
+Referee assignment
+
+Assigns referees to scheduled matches so that nobody officiates a match
+their own team plays in, two matches at once or while they are busy
+otherwise (playing, refereeing elsewhere), with the matches spread evenly
+over the referees. Greedy with repair:
+
+1. Greedy: matches in order of start, each to the eligible free referee
+   with the fewest matches so far
+2. Repair: a match no referee is free for takes a referee whose one
+   overlapping assignment can move to another free referee
+3. Balance: matches move from a referee to one with at least two matches
+   fewer while that is possible (every move narrows the spread)
+
+Each referee's bookings are kept as disjoint intervals sorted by start,
+so a free/busy check is one bisect.
+"""
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from operator import attrgetter
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+
+class RefereeCalendar:
+    """Bookings of one referee: disjoint half-open intervals sorted by start"""
+
+    __slots__ = ("starts", "ends", "match_ids", "load")
+
+    def __init__(self, busy: Iterable[Tuple[datetime, datetime]] = (), load: int = 0):
+        self.starts: List[datetime] = []
+        self.ends: List[datetime] = []
+        self.match_ids: List[Optional[UUID]] = []  # None: fixed (busy) interval
+        self.load = load  # Matches assigned to the referee (fixed ones included)
+
+        # Busy intervals may overlap each other: merge them
+        for start, end in sorted(busy):
+            if self.ends and start < self.ends[-1]:
+                self.ends[-1] = max(self.ends[-1], end)
+            else:
+                self.starts.append(start)
+                self.ends.append(end)
+                self.match_ids.append(None)
+
+    def conflicts(self, start: datetime, end: datetime) -> range:
+        """Indexes of the bookings overlapping [start, end)"""
+        return range(bisect_right(self.ends, start), bisect_left(self.starts, end))
+
+    def is_free(self, start: datetime, end: datetime) -> bool:
+        return not self.conflicts(start, end)
+
+    def add(self, start: datetime, end: datetime, match_id: Optional[UUID]) -> None:
+        index = bisect_left(self.starts, start)
+        self.starts.insert(index, start)
+        self.ends.insert(index, end)
+        self.match_ids.insert(index, match_id)
+        self.load += 1
+
+    def remove(self, start: datetime, match_id: UUID) -> None:
+        index = bisect_left(self.starts, start)
+        while self.match_ids[index] != match_id:
+            index += 1
+        del self.starts[index], self.ends[index], self.match_ids[index]
+        self.load -= 1
+
+
+def assign_referees(
+    matches: Sequence[Any],
+    calendars: Dict[UUID, RefereeCalendar]
+) -> Dict[UUID, UUID]:
+    """
+    Assign a referee to as many matches as possible, balancing the load.
+
+    Args:
+        matches: Matches to assign (id, start, end and blocked: the
+            referees who must not officiate it, e.g. its players)
+        calendars: Referees (in order of preference for ties) with the
+            times they are busy and their load so far; updated with the
+            assignments
+
+    Returns:
+        Referee by match ID (matches no referee is free for are missing)
+    """
+    order = {referee_id: position for position, referee_id in enumerate(calendars)}
+    assignments: Dict[UUID, UUID] = {}
+
+    def least_loaded(
+        match: Any,
+        below: Optional[int] = None,
+        skip: Optional[UUID] = None
+    ) -> Optional[UUID]:
+        best = None
+        for referee_id, calendar in calendars.items():
+            if below is not None and calendar.load >= below:
+                continue
+            if referee_id in match.blocked or referee_id == skip:
+                continue
+            if not calendar.is_free(match.start, match.end):
+                continue
+            if best is None or (calendar.load, order[referee_id]) < (calendars[best].load, order[best]):
+                best = referee_id
+        return best
+
+    def assign(match: Any, referee_id: UUID) -> None:
+        calendars[referee_id].add(match.start, match.end, match.id)
+        assignments[match.id] = referee_id
+
+    def unassign(match: Any) -> UUID:
+        referee_id = assignments.pop(match.id)
+        calendars[referee_id].remove(match.start, match.id)
+        return referee_id
+
+    ordered = sorted(matches, key=attrgetter("start", "end"))
+    by_id = {match.id: match for match in ordered}
+
+    # 1. Greedy
+    unassigned = []
+    for match in ordered:
+        referee_id = least_loaded(match)
+        if referee_id is None:
+            unassigned.append(match)
+        else:
+            assign(match, referee_id)
+
+    # 2. Repair: free a referee by moving their one overlapping match
+    for match in unassigned:
+        for referee_id, calendar in calendars.items():
+            if referee_id in match.blocked:
+                continue
+            overlapping = calendar.conflicts(match.start, match.end)
+            if len(overlapping) != 1 or calendar.match_ids[overlapping[0]] is None:
+                continue
+            other = by_id[calendar.match_ids[overlapping[0]]]
+            unassign(other)
+            substitute = least_loaded(other, skip=referee_id)
+            if substitute is None:
+                assign(other, referee_id)
+                continue
+            assign(other, substitute)
+            assign(match, referee_id)
+            break
+
+    # 3. Balance
+    moved = True
+    while moved:
+        moved = False
+        # Lowest load at the start of the pass: loads only even out, so a
+        # referee at most one above it has no better target
+        lowest = min((calendar.load for calendar in calendars.values()), default=0)
+        for match in ordered:
+            referee_id = assignments.get(match.id)
+            if referee_id is None or calendars[referee_id].load - lowest < 2:
+                continue
+            target = least_loaded(match, below=calendars[referee_id].load - 1)
+            if target is not None:
+                unassign(match)
+                assign(match, target)
+                moved = True
+
+    return assignments
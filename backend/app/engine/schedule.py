@@ -0,0 +1,75 @@
+"""
+Schedule validation
+
+Finds matches of the same participant that overlap in time (the team is
+booked on two courts at once) or leave less than the minimum rest between
+them. One sweep per participant over its matches ordered by start: each
+match is padded by the rest time, and a heap keyed by the padded end
+holds the matches still "running" when the next one starts, so every
+conflicting pair is found in O(n log n + conflicts).
+"""
+import heapq
+from collections import defaultdict
+from datetime import datetime, timedelta
+from operator import attrgetter
+from typing import Any, Dict, Iterable, List, Tuple
+from uuid import UUID
+
+OVERLAP = "overlap"  # Both matches at the same time
+REST = "rest"  # Less than the minimum rest between them
+
+
+class ScheduleClash:
+    """Two matches of one participant that conflict (first starts first)"""
+
+    __slots__ = (
+        "participant_id", "kind", "first_match_id", "first_end",
+        "second_match_id", "second_start", "gap",
+    )
+
+    def __init__(self, participant_id: UUID, first: Any, second: Any):
+        self.participant_id = participant_id
+        self.first_match_id = first.match_id
+        self.first_end = first.end
+        self.second_match_id = second.match_id
+        self.second_start = second.start
+        self.gap: timedelta = second.start - first.end  # Negative: overlap
+        self.kind = OVERLAP if second.start < first.end else REST
+
+
+def find_clashes(bookings: Iterable[Any], min_rest: timedelta) -> List[ScheduleClash]:
+    """
+    Find the conflicting match pairs of every participant.
+
+    Matches are half-open intervals: a match may start right when the
+    previous one ends if no rest is required.
+
+    Args:
+        bookings: One entry per participant and match (participant_id,
+            match_id, start, end); any order
+        min_rest: Minimum time between two matches of a participant
+
+    Returns:
+        List of clashes (grouped by participant in order of appearance,
+        ordered by the second match's start)
+    """
+    # Grouped by dict rather than sorted by participant: UUID comparisons
+    # are Python-level and dominated the sort
+    by_participant: Dict[UUID, List[Any]] = defaultdict(list)
+    for booking in bookings:
+        by_participant[booking.participant_id].append(booking)
+
+    clashes: List[ScheduleClash] = []
+    for participant_id, matches in by_participant.items():
+        matches.sort(key=attrgetter("start", "end"))
+        # (end + rest, sequence, booking) of earlier matches that still
+        # conflict with a match starting now
+        running: List[Tuple[datetime, int, Any]] = []
+        for sequence, booking in enumerate(matches):
+            while running and running[0][0] <= booking.start:
+                heapq.heappop(running)
+            for _, _, earlier in running:
+                clashes.append(ScheduleClash(participant_id, earlier, booking))
+            heapq.heappush(running, (booking.end + min_rest, sequence, booking))
+
+    return clashes
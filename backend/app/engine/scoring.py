@@ -0,0 +1,101 @@
+"""
+Score updates
+
+Applies a score update (MatchScoreUpdate or any object with the same
+attributes) to a match: Match rows with loaded participants and live
+matches (app.engine.live) alike, so both paths follow the same rules.
+"""
+from datetime import datetime, timedelta
+from typing import Any
+
+# MatchStatus.COMPLETED (the engine does not import models)
+COMPLETED = "completed"
+
+
+def parse_result_time(time_str: str) -> timedelta:
+    """
+    Parse time string to timedelta.
+
+    Supports formats:
+    - "1:23.456" (minutes:seconds.milliseconds)
+    - "1:23:45.678" (hours:minutes:seconds.milliseconds)
+
+    Args:
+        time_str: Time string
+
+    Returns:
+        timedelta object
+    """
+    try:
+        parts = time_str.split(":")
+        if len(parts) == 2:
+            # Format: MM:SS.mmm
+            minutes = int(parts[0])
+            seconds = float(parts[1])
+            return timedelta(minutes=minutes, seconds=seconds)
+        elif len(parts) == 3:
+            # Format: HH:MM:SS.mmm
+            hours = int(parts[0])
+            minutes = int(parts[1])
+            seconds = float(parts[2])
+            return timedelta(hours=hours, minutes=minutes, seconds=seconds)
+        else:
+            raise ValueError("Invalid time format")
+    except Exception:
+        # If parsing fails, return 0
+        return timedelta(0)
+
+
+def apply_score(match: Any, score_data: Any, now: datetime) -> None:
+    """
+    Apply a score update to a match and determine the winner.
+
+    Args:
+        match: Match with its participants (entries with participant_id)
+        score_data: Score update (participant_scores, score_data,
+            winner_participant_id)
+        now: Update timestamp
+
+    Raises:
+        ValueError: If a scored participant is not in the match
+    """
+    # Find match participants (all of them before changing anything, so
+    # an invalid update leaves in-memory matches untouched)
+    by_participant = {str(mp.participant_id): mp for mp in match.participants}
+    for score_entry in score_data.participant_scores:
+        if str(score_entry.participant_id) not in by_participant:
+            raise ValueError(f"Participant {score_entry.participant_id} not in match")
+
+    # Update participant scores
+    for score_entry in score_data.participant_scores:
+        match_participant = by_participant[str(score_entry.participant_id)]
+
+        # Update scores
+        if score_entry.score_value is not None:
+            match_participant.score_value = score_entry.score_value
+
+        if score_entry.final_position is not None:
+            match_participant.final_position = score_entry.final_position
+
+        # Parse result_time if provided as string
+        if score_entry.result_time:
+            # Convert string time to timedelta (e.g., "1:23.456" -> timedelta)
+            match_participant.result_time = parse_result_time(score_entry.result_time)
+
+        match_participant.is_winner = score_entry.is_winner
+        match_participant.is_disqualified = score_entry.is_disqualified
+
+        if score_entry.detailed_score:
+            match_participant.detailed_score = score_entry.detailed_score
+
+    # Update overall match score data
+    if score_data.score_data:
+        match.score_data = score_data.score_data
+
+    # Set winner
+    if score_data.winner_participant_id:
+        match.winner_participant_id = score_data.winner_participant_id
+        match.is_finished = True
+        match.status = COMPLETED
+
+    match.updated_at = now
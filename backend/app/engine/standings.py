@@ -0,0 +1,158 @@
+"""
+Standings aggregation
+
+Match entries are any objects with participant_id, score_value, is_winner
+and final_position (MatchParticipant rows or plain tuples turned into
+objects). Tallies are any objects with the standing statistics
+attributes: StandingTally, or TournamentStandings rows directly.
+"""
+from decimal import Decimal
+from itertools import groupby
+from operator import attrgetter
+from typing import Any, Dict, Hashable, Iterable, Sequence, Tuple
+
+# Points for multi-player matches (races etc.) by final position
+POSITION_POINTS = {
+    1: 25, 2: 18, 3: 15, 4: 12, 5: 10,
+    6: 8, 7: 6, 8: 4, 9: 2, 10: 1
+}
+
+ZERO = Decimal(0)
+
+
+class StandingTally:
+    """Standing statistics of one participant (same attributes as TournamentStandings)"""
+
+    __slots__ = (
+        "matches_played", "matches_won", "matches_drawn", "matches_lost",
+        "points", "score_for", "score_against", "score_difference",
+    )
+
+    def __init__(self):
+        self.matches_played = 0
+        self.matches_won = 0
+        self.matches_drawn = 0
+        self.matches_lost = 0
+        self.points = 0
+        self.score_for = ZERO
+        self.score_against = ZERO
+        self.score_difference = ZERO
+
+    def values(self) -> Tuple:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+
+def rank_key(tally: Any) -> Tuple:
+    """Sort key: points, then score difference, then score for (all descending)"""
+    return (-tally.points, -tally.score_difference, -tally.score_for)
+
+
+def apply_two_player_match(entries: Sequence[Any], tallies: Dict[Hashable, Any]) -> None:
+    """
+    Add a standard 2-player match to the tallies.
+    
+    Explicit winners get 3 points; without a marked winner the higher
+    score wins and equal scores are a draw (1 point each).
+    
+    Args:
+        entries: The two match participants
+        tallies: Tallies by participant ID (matches of unknown
+            participants are ignored)
+    """
+    if len(entries) != 2:
+        return
+    
+    mp1, mp2 = entries
+    
+    standing1 = tallies.get(mp1.participant_id)
+    standing2 = tallies.get(mp2.participant_id)
+    
+    if not standing1 or not standing2:
+        return
+    
+    standing1.matches_played += 1
+    standing2.matches_played += 1
+    
+    score1 = mp1.score_value or ZERO
+    score2 = mp2.score_value or ZERO
+    
+    standing1.score_for += score1
+    standing1.score_against += score2
+    standing2.score_for += score2
+    standing2.score_against += score1
+    
+    if mp1.is_winner:
+        winner, loser = standing1, standing2
+    elif mp2.is_winner:
+        winner, loser = standing2, standing1
+    elif score1 == score2:
+        winner = loser = None
+    elif score1 > score2:
+        winner, loser = standing1, standing2
+    else:
+        winner, loser = standing2, standing1
+    
+    if winner is None:
+        standing1.matches_drawn += 1
+        standing1.points += 1
+        standing2.matches_drawn += 1
+        standing2.points += 1
+    else:
+        winner.matches_won += 1
+        winner.points += 3
+        loser.matches_lost += 1
+    
+    standing1.score_difference = standing1.score_for - standing1.score_against
+    standing2.score_difference = standing2.score_for - standing2.score_against
+
+
+def apply_multi_player_match(entries: Sequence[Any], tallies: Dict[Hashable, Any]) -> None:
+    """
+    Add a multi-player match (races etc.) to the tallies.
+    
+    Points by final position (POSITION_POINTS); 1st place or a marked
+    winner counts as a win. Scores count as score for (there is no
+    single opponent to count them against).
+    
+    Args:
+        entries: Match participants
+        tallies: Tallies by participant ID
+    """
+    for mp in entries:
+        standing = tallies.get(mp.participant_id)
+        if not standing:
+            continue
+        
+        standing.matches_played += 1
+        
+        if mp.final_position in POSITION_POINTS:
+            standing.points += POSITION_POINTS[mp.final_position]
+        
+        if mp.final_position == 1 or mp.is_winner:
+            standing.matches_won += 1
+        
+        if mp.score_value:
+            standing.score_for += mp.score_value
+            standing.score_difference = standing.score_for - standing.score_against
+
+
+def apply_match(entries: Sequence[Any], tallies: Dict[Hashable, Any]) -> None:
+    """Add a finished, non-bye match to the tallies"""
+    if len(entries) == 2:
+        apply_two_player_match(entries, tallies)
+    else:
+        apply_multi_player_match(entries, tallies)
+
+
+def apply_results(rows: Iterable[Any], tallies: Dict[Hashable, Any]) -> None:
+    """
+    Add match results to the tallies in a single pass.
+    
+    Args:
+        rows: One row per match participant with match_id, participant_id,
+            score_value, is_winner and final_position, ordered by match
+            (finished, non-bye matches only)
+        tallies: Tallies by participant ID
+    """
+    for _, entries in groupby(rows, key=attrgetter("match_id")):
+        apply_match(tuple(entries), tallies)
@@ -1,13 +1,30 @@
 """
 Main FastAPI application
 """
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from app.core.config import settings
-from app.db.session import init_db, close_db
-from app.api import auth, users, clubs
+from app.db.session import engine, read_engine, replica_monitor, close_db
+from app.db.startup import prepare_database
+from app.core.health import drain_connections, loop_lag_monitor, readiness_checker, shutdown_grace
+from app.core.redis import close_redis
+from app.core.metrics import PrometheusMiddleware, instrument_engine, metrics_response
+from app.core.profiling import ProfilingMiddleware, install_profiling_db_timer
+from app.db.query_budget import QueryCountMiddleware, install_query_counter
+from app.db.pool import pool_status
+from app.db.locks import TournamentBusyError
+from app.db.replica import ReadYourWritesMiddleware
+from app.services.standings_service import standings_recalculator
+from app.services.standings_view_service import standings_view_refresher
+from app.services.live_tournament_service import live_tournaments
+from app.services.job_service import job_worker
+from app.services.match_service import ScheduleConflictError
+from app.api import auth, users, clubs, admin, jobs
 from app.api.tournaments import router as tournaments_router
+from app.api.matches import router as matches_router
 
 
 @asynccontextmanager
@@ -17,13 +34,34 @@ async def lifespan(app: FastAPI):
     """
     # Startup
     print("🚀 Starting UnserTurnierplan API...")
-    await init_db()
-    print("✅ Database initialized")
+    app.state.ready = False
+    summary = await prepare_database()
+    print(f"✅ Database ready ({summary})")
+    if settings.LIVE_ENGINE_ENABLED:
+        live = await live_tournaments.start()
+        print(f"✅ Live engine: {live} active tournaments")
+    if settings.JOBS_WORKER_ENABLED or settings.JOBS_BACKEND == "local":
+        job_worker.start()
+    loop_lag_monitor.start()
+    # Readiness fails on SIGTERM, SHUTDOWN_GRACE_SECONDS before the server stops
+    shutdown_grace.install()
+    app.state.ready = True
     
     yield
     
-    # Shutdown
+    # Shutdown: the server has stopped serving; let background work and
+    # running queries finish
     print("👋 Shutting down UnserTurnierplan API...")
+    app.state.ready = False
+    await job_worker.stop()  # Running jobs fail (local) or are requeued (redis)
+    await live_tournaments.stop()  # Persists queued score updates
+    await standings_recalculator.stop()  # Runs pending recalculations
+    busy = await drain_connections(settings.SHUTDOWN_DRAIN_TIMEOUT)
+    if busy:
+        print(f"⚠️  {busy} database connections still busy after drain timeout")
+    await loop_lag_monitor.stop()
+    await standings_view_refresher.stop()
+    await close_redis()
     await close_db()
     print("✅ Database connections closed")
 
@@ -48,6 +86,74 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Keep clients on the primary right after they write
+if read_engine is not None:
+    app.add_middleware(
+        ReadYourWritesMiddleware,
+        sticky_seconds=settings.DATABASE_READ_STICKY_SECONDS,
+    )
+
+# Request metrics and /metrics endpoint
+if settings.METRICS_ENABLED:
+    instrument_engine(engine, "primary")
+    if read_engine is not None:
+        instrument_engine(read_engine, "replica")
+    app.add_middleware(
+        PrometheusMiddleware,
+        excluded_paths=["/metrics", "/health/live", "/health/ready"],
+    )
+
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        """Prometheus metrics"""
+        return metrics_response()
+
+# Statement counting and N+1 warnings (development and test runs)
+if settings.QUERY_BUDGET_ENABLED:
+    install_query_counter(engine)
+    if read_engine is not None:
+        install_query_counter(read_engine)
+    app.add_middleware(QueryCountMiddleware)
+
+# On-demand profiling (X-Profile header or targets set via /admin/profiling)
+if settings.PROFILING_ENABLED:
+    install_profiling_db_timer(engine)
+    if read_engine is not None:
+        install_profiling_db_timer(read_engine)
+    app.add_middleware(ProfilingMiddleware, router=app.router)
+
+
+@app.exception_handler(PoolTimeoutError)
+async def pool_timeout_handler(request: Request, exc: PoolTimeoutError):
+    """Database pool exhausted: ask the client to retry instead of hanging"""
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Database busy, please retry"},
+        headers={"Retry-After": "1"},
+    )
+
+
+@app.exception_handler(TournamentBusyError)
+async def tournament_busy_handler(request: Request, exc: TournamentBusyError):
+    """Another operation holds the tournament's lock: fail fast, let the client retry"""
+    return JSONResponse(
+        status_code=status.HTTP_409_CONFLICT,
+        content={"detail": str(exc)},
+        headers={"Retry-After": "1"},
+    )
+
+
+@app.exception_handler(ScheduleConflictError)
+async def schedule_conflict_handler(request: Request, exc: ScheduleConflictError):
+    """Court already booked: name the conflicting matches"""
+    return JSONResponse(
+        status_code=status.HTTP_409_CONFLICT,
+        content={
+            "detail": str(exc),
+            "conflicting_match_ids": [str(match_id) for match_id in exc.conflicting_match_ids],
+        },
+    )
+
 
 # Health check endpoint
 @app.get("/health")
@@ -61,6 +167,41 @@ async def health_check():
     }
 
 
+@app.get("/health/live")
+async def liveness():
+    """Liveness probe: the process is up and serving requests"""
+    return {"status": "alive"}
+
+
+@app.get("/health/ready")
+async def readiness(request: Request):
+    """
+    Readiness probe: startup finished, not shutting down, and database,
+    Redis and event loop healthy (result cached for a second or two)
+    """
+    if not getattr(request.app.state, "ready", False) or shutdown_grace.shutting_down:
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"status": "unavailable"},
+        )
+    result = await readiness_checker.check()
+    if result["status"] != "ready":
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content=result,
+        )
+    return result
+
+
+@app.get("/health/pool")
+async def pool_health():
+    """Database connection pool usage and checkout wait statistics"""
+    pools = pool_status(engine)
+    if read_engine is not None:
+        pools["replica"] = {**pool_status(read_engine), **replica_monitor.status()}
+    return pools
+
+
 # Root endpoint
 @app.get("/")
 async def root():
@@ -77,6 +218,10 @@ app.include_router(auth.router, prefix=settings.API_PREFIX)
 app.include_router(users.router, prefix=settings.API_PREFIX)
 app.include_router(clubs.router, prefix=settings.API_PREFIX)
 app.include_router(tournaments_router, prefix=settings.API_PREFIX)
+app.include_router(matches_router, prefix=settings.API_PREFIX)
+app.include_router(jobs.router, prefix=settings.API_PREFIX)
+if settings.PROFILING_ENABLED:
+    app.include_router(admin.router, prefix=settings.API_PREFIX)
 
 
 if __name__ == "__main__":
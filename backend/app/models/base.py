@@ -13,6 +13,10 @@ class BaseModel(Base):
     
     __abstract__ = True
     
+    # Fetch server-generated values with INSERT/UPDATE ... RETURNING
+    # instead of expiring them (no refresh round trip after writes)
+    __mapper_args__ = {"eager_defaults": True}
+    
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
@@ -11,8 +11,8 @@ from enum import Enum
 from typing import Optional
 
 from sqlalchemy import (
-    Column, String, Integer, Boolean, Text, DateTime, 
-    ForeignKey, Index, ARRAY
+    Column, String, Integer, BigInteger, Boolean, Text, DateTime, 
+    ForeignKey, Index, ARRAY, CheckConstraint, text
 )
 from sqlalchemy.dialects.postgresql import UUID as PGUUID, JSONB
 from sqlalchemy.orm import relationship
@@ -132,6 +132,9 @@ class Match(BaseModel):
         nullable=True
     )
     
+    # Change Tracking (tournament change_version of the last write)
+    change_version = Column(BigInteger, nullable=False, default=0, server_default="0")
+    
     # Relationships
     tournament = relationship("Tournament", back_populates="matches")
     participants = relationship(
@@ -157,6 +160,17 @@ class Match(BaseModel):
         Index('idx_match_tournament_status', 'tournament_id', 'status'),
         Index('idx_match_schedule', 'scheduled_start', 'scheduled_end'),
         Index('idx_match_venue', 'tournament_id', 'venue_name', 'court_field_number'),
+        Index('idx_match_tournament_version', 'tournament_id', 'change_version'),
+        Index(
+            'idx_match_referee_schedule', 'referee_user_id', 'scheduled_start',
+            postgresql_where=text('referee_user_id IS NOT NULL')
+        ),
+        CheckConstraint(
+            'scheduled_end IS NULL OR scheduled_start IS NULL OR scheduled_end >= scheduled_start',
+            name='ck_match_schedule_order'
+        ),
+        # Court bookings: the GiST exclusion constraint excl_match_court_slot
+        # (btree_gist) is created by migration 008 only
     )
     
     def __repr__(self) -> str:
@@ -42,8 +42,7 @@ class MatchParticipant(BaseModel):
     participant_id = Column(
         PGUUID(as_uuid=True),
         ForeignKey("tournament_participants.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
     
     # Position in Match
@@ -75,7 +74,8 @@ class MatchParticipant(BaseModel):
     __table_args__ = (
         UniqueConstraint('match_id', 'participant_id', name='uq_match_participant'),
         Index('idx_match_participants_match', 'match_id'),
-        Index('idx_match_participants_participant', 'participant_id'),
+        # A participant's matches without touching the table (upcoming matches)
+        Index('idx_match_participants_participant_match', 'participant_id', 'match_id'),
     )
     
     def __repr__(self) -> str:
@@ -12,7 +12,7 @@ from enum import Enum
 from typing import Optional
 
 from sqlalchemy import (
-    Column, String, Text, DateTime, Date, Integer, Boolean, 
+    Column, String, Text, DateTime, Date, Integer, BigInteger, Boolean, 
     Numeric, ForeignKey, Enum as SQLEnum, Index
 )
 from sqlalchemy.dialects.postgresql import UUID as PGUUID, JSONB
@@ -191,6 +191,12 @@ class Tournament(BaseModel):
     #   }
     # }
 
+    # Change Tracking - bumped in the same transaction by every write to the
+    # tournament or its matches, participants and standings
+    change_version = Column(BigInteger, nullable=False, default=0, server_default="0")
+    # Version of the latest deletion; delta clients behind it must resync fully
+    resync_version = Column(BigInteger, nullable=False, default=0, server_default="0")
+
     # Relationships
     club = relationship("Club", back_populates="tournaments")
     creator = relationship("User", foreign_keys="[Tournament.created_by]", back_populates="tournaments_created")
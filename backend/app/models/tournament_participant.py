@@ -12,7 +12,7 @@ from enum import Enum
 from typing import Optional
 
 from sqlalchemy import (
-    Column, String, Text, DateTime, Integer, Boolean,
+    Column, String, Text, DateTime, Integer, BigInteger, Boolean,
     Numeric, ForeignKey, Enum as SQLEnum, Index, UniqueConstraint
 )
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
@@ -67,14 +67,12 @@ class TournamentParticipant(BaseModel):
     participant_club_id = Column(
         PGUUID(as_uuid=True),
         ForeignKey("clubs.id", ondelete="CASCADE"),
-        nullable=True,
-        index=True
+        nullable=True
     )
     participant_user_id = Column(
         PGUUID(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
-        nullable=True,
-        index=True
+        nullable=True
     )
     group_assignment = Column(String(50), nullable=True, index=True)
     
@@ -129,6 +127,9 @@ class TournamentParticipant(BaseModel):
     notes = Column(Text)  # Admin notes
     player_list = Column(Text)  # JSON or text list of players
     
+    # Change Tracking (tournament change_version of the last write)
+    change_version = Column(BigInteger, nullable=False, default=0, server_default="0")
+    
     # Relationships
     tournament = relationship("Tournament", back_populates="participants")
     participant_club = relationship("Club", foreign_keys=[participant_club_id])
@@ -151,6 +152,10 @@ class TournamentParticipant(BaseModel):
         # Indexes for common queries
         Index('idx_participant_tournament_status', 'tournament_id', 'status'),
         Index('idx_participant_seed', 'tournament_id', 'seed'),
+        Index('idx_participant_tournament_version', 'tournament_id', 'change_version'),
+        # Participations of a user / club (upcoming matches across tournaments)
+        Index('idx_participant_user_entry', 'participant_user_id', 'id'),
+        Index('idx_participant_club_entry', 'participant_club_id', 'id'),
     )
     
     def __repr__(self) -> str:
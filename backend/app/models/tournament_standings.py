@@ -9,7 +9,7 @@ from decimal import Decimal
 from typing import Optional
 
 from sqlalchemy import (
-    Column, String, Integer, Numeric, ForeignKey, 
+    Column, String, Integer, BigInteger, Numeric, ForeignKey, 
     Index, UniqueConstraint
 )
 from sqlalchemy.dialects.postgresql import UUID as PGUUID, JSONB
@@ -80,6 +80,9 @@ class TournamentStandings(BaseModel):
     # Form (recent results)
     recent_form = Column(String(20))  # "WWDLL" (W=Win, D=Draw, L=Loss) - last 5 matches
     
+    # Change Tracking (tournament change_version of the last write)
+    change_version = Column(BigInteger, nullable=False, default=0, server_default="0")
+    
     # Relationships
     tournament = relationship("Tournament")
     participant = relationship("TournamentParticipant")
@@ -93,6 +96,7 @@ class TournamentStandings(BaseModel):
         Index('idx_standings_tournament', 'tournament_id'),
         Index('idx_standings_tournament_group', 'tournament_id', 'group_name'),
         Index('idx_standings_rank', 'tournament_id', 'current_rank'),
+        Index('idx_standings_tournament_version', 'tournament_id', 'change_version'),
     )
     
     def __repr__(self) -> str:
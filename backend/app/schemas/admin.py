@@ -0,0 +1,42 @@
+"""
+Admin schemas (Pydantic models for API)
+"""
+from typing import List, Optional
+from pydantic import BaseModel, Field
+
+
+class ProfilingTargets(BaseModel):
+    """Routes and functions to profile (replaces the current targets)"""
+    routes: List[str] = Field(
+        default_factory=list,
+        description='Route templates, e.g. "/api/v1/tournaments/{tournament_id}/standings"',
+    )
+    functions: List[str] = Field(
+        default_factory=list,
+        description='Profiled function names, e.g. "standings.calculate"',
+    )
+    sample_rate: float = Field(default=1.0, gt=0, le=1)
+
+
+class ProfileSummary(BaseModel):
+    """Stored profile without its call tree"""
+    id: str
+    kind: str
+    target: str
+    method: Optional[str] = None
+    path: Optional[str] = None
+    started_at: str
+    status_code: Optional[int] = None
+    duration_ms: float
+    db_queries: int
+    db_ms: float
+    python_ms: float
+
+
+class ProfilingStatus(BaseModel):
+    """Current profiling targets and recent profiles (this worker)"""
+    routes: List[str]
+    functions: List[str]
+    available_functions: List[str]
+    sample_rate: float
+    profiles: List[ProfileSummary]
@@ -0,0 +1,26 @@
+"""
+Job schemas (Pydantic models for API)
+"""
+from datetime import datetime
+from typing import Any, Dict, Optional
+from uuid import UUID
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class JobResponse(BaseModel):
+    """Background job status (result once succeeded)"""
+    id: UUID
+    kind: str
+    tournament_id: UUID
+    status: str = Field(..., description="queued, running, succeeded or failed")
+    progress: float = Field(..., ge=0, le=1)
+    message: Optional[str] = None
+    attempts: int
+    payload: Dict[str, Any]
+    result: Optional[Any] = Field(None, description="Same body as the synchronous endpoint")
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
@@ -99,6 +99,16 @@ class MatchDetail(MatchResponse):
     winner: Optional["TournamentParticipantResponse"] = None
 
 
+class MatchListParticipant(BaseModel):
+    """Participant summary embedded in match lists."""
+    participant_id: UUID
+    participant_name: str
+    slot_number: int
+    team_side: Optional[str] = None
+    score_value: Optional[Decimal] = None
+    is_winner: bool = False
+
+
 class MatchListItem(BaseModel):
     """Lightweight match for lists."""
     id: UUID
@@ -112,10 +122,24 @@ class MatchListItem(BaseModel):
     is_finished: bool
     venue_name: Optional[str]
     court_field_number: Optional[str]
+    participants: List[MatchListParticipant] = []
 
     model_config = ConfigDict(from_attributes=True)
 
 
+class UpcomingMatchItem(MatchListItem):
+    """Upcoming match of a user or club, with its tournament."""
+    tournament_id: UUID
+    tournament_name: str
+    entry_participant_id: UUID  # The user's / club's participant in this match
+    scheduled_end: Optional[datetime]
+
+
+class ScheduleConflictItem(MatchListItem):
+    """Match booked on a court in an overlapping time slot."""
+    scheduled_end: datetime
+
+
 # ==================== MATCH PARTICIPANT SCHEMAS ====================
 
 class MatchParticipantBase(BaseModel):
@@ -292,10 +316,120 @@ class StandingsListItem(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+# ==================== BRACKET TREE SCHEMAS ====================
+
+class BracketParticipant(BaseModel):
+    """Participant slot of a bracket match."""
+    participant_id: UUID
+    participant_name: str
+    seed: Optional[int] = None
+    slot_number: int
+    team_side: Optional[str] = None
+    score_value: Optional[Decimal] = None
+    final_position: Optional[int] = None
+    is_winner: bool = False
+    is_disqualified: bool = False
+
+
+class BracketMatch(BaseModel):
+    """Match node of the bracket tree (linked by feeds_into_match_id)."""
+    id: UUID
+    match_number: int
+    group_name: Optional[str]
+    phase: Optional[str]
+    scheduled_start: Optional[datetime]
+    venue_name: Optional[str]
+    court_field_number: Optional[str]
+    status: str
+    is_finished: bool
+    is_bye: bool
+    winner_participant_id: Optional[UUID]
+    score_data: Optional[Dict[str, Any]]
+    feeds_into_match_id: Optional[UUID]
+    participants: List[BracketParticipant] = []
+
+
+class BracketRound(BaseModel):
+    """Round of the bracket with its matches (ordered by match number)."""
+    round_number: int
+    round_name: Optional[str]
+    matches: List[BracketMatch]
+
+
+class BracketResponse(BaseModel):
+    """Complete bracket of a tournament as rounds → matches → participants."""
+    tournament_id: UUID
+    version: int  # Tournament change version the bracket reflects
+    rounds: List[BracketRound]
+
+
+# ==================== SCHEDULE VALIDATION SCHEMAS ====================
+
+class ScheduleClashItem(BaseModel):
+    """Two matches of one participant that overlap or leave too little rest."""
+    participant_id: UUID
+    participant_name: str
+    kind: str  # "overlap" or "rest"
+    first_match_id: UUID  # Starts first
+    first_end: datetime
+    second_match_id: UUID
+    second_start: datetime
+    gap_minutes: float  # Time between the matches, negative for overlaps
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ScheduleValidationResponse(BaseModel):
+    """All participant clashes in a tournament's schedule."""
+    tournament_id: UUID
+    version: int  # Tournament change version the check reflects
+    min_rest_minutes: int
+    checked_matches: int  # Scheduled matches with a known end
+    clashes: List[ScheduleClashItem]
+
+
+# ==================== REFEREE ASSIGNMENT SCHEMAS ====================
+
+class RefereeAssignmentRequest(BaseModel):
+    """Request to assign referees to a tournament's scheduled matches."""
+    tournament_id: UUID
+    reassign: bool = Field(default=False, description="Also replace existing referee assignments")
+
+
+class RefereeLoad(BaseModel):
+    """Referee of the pool with their matches in the tournament."""
+    user_id: UUID
+    name: str
+    assigned_matches: int
+
+
+class RefereeAssignmentResult(BaseModel):
+    """Outcome of an assignment run."""
+    tournament_id: UUID
+    assigned: int  # Matches whose referee was set or changed
+    unassigned_match_ids: List[UUID]  # No eligible referee was free
+    referees: List[RefereeLoad]  # Most loaded first
+
+
+# ==================== CHANGE FEED SCHEMAS ====================
+
+class TournamentChanges(BaseModel):
+    """Rows changed since a client's last seen tournament version."""
+    tournament_id: UUID
+    version: int
+    since: int
+    full_resync: bool  # Replace local state instead of merging
+    tournament: "TournamentResponse"
+    matches: List[MatchListItem] = []
+    participants: List["TournamentParticipantResponse"] = []
+    standings: List[StandingsResponse] = []
+
+
 # Forward references - import from other schema files
-from app.schemas.tournament import TournamentParticipantResponse
+from app.schemas.tournament import TournamentParticipantResponse, TournamentResponse
 
 # Rebuild models to resolve forward references
 MatchDetail.model_rebuild()
 MatchParticipantDetail.model_rebuild()
 StandingsDetail.model_rebuild()
+TournamentChanges.model_rebuild()
@@ -5,27 +5,38 @@ This service generates match brackets and schedules for different tournament typ
 - Knockout (single/double elimination)
 - Round-Robin (everyone plays everyone)
 - Group Stage + Knockout (future)
+
+It also reads the generated bracket back as a tree (get_bracket).
 """
 
 import math
 import random
-from typing import List, Tuple, Optional
+from typing import List, Optional
 from uuid import UUID
 from datetime import datetime, timedelta
 
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, func, literal_column
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.tournament import Tournament, TournamentType
 from app.models.tournament_participant import TournamentParticipant
 from app.models.match import Match, MatchStatus
 from app.models.match_participant import MatchParticipant
+from app.core.metrics import observe_duration
+from app.core.profiling import profiled
+from app.db.locks import try_lock_tournament
+from app.engine.pairings import knockout_round_names, round_robin_pairings
+from app.schemas.match import BracketMatch, BracketRound
+from app.services.change_feed_service import ChangeFeedService
 
 
 class BracketService:
     """Service for generating tournament brackets and schedules."""
     
     @staticmethod
+    @observe_duration("knockout_bracket_generation")
+    @profiled("bracket.knockout")
     async def generate_knockout_bracket(
         db: AsyncSession,
         tournament_id: UUID,
@@ -53,7 +64,11 @@ class BracketService:
             
         Raises:
             ValueError: If tournament not found or insufficient participants
+            TournamentBusyError: If another operation holds the tournament
         """
+        # One generation (or registration) at a time per tournament
+        await try_lock_tournament(db, tournament_id)
+        
         # Get tournament
         tournament = await db.get(Tournament, tournament_id)
         if not tournament:
@@ -86,7 +101,7 @@ class BracketService:
         num_byes = next_power_of_2 - num_participants
         
         matches = []
-        round_names = BracketService._get_round_names(num_rounds)
+        round_names = knockout_round_names(num_rounds)
         
         # Generate first round with byes if needed
         first_round_matches = []
@@ -193,11 +208,14 @@ class BracketService:
             matches.extend(current_round_matches)
             previous_round_matches = current_round_matches
         
-        await db.commit()
+        await ChangeFeedService.record_change(db, tournament_id, *matches)
+        await db.flush()
         
         return matches
     
     @staticmethod
+    @observe_duration("round_robin_generation")
+    @profiled("bracket.round_robin")
     async def generate_round_robin_schedule(
         db: AsyncSession,
         tournament_id: UUID,
@@ -226,7 +244,11 @@ class BracketService:
             
         Raises:
             ValueError: If tournament not found or insufficient participants
+            TournamentBusyError: If another operation holds the tournament
         """
+        # One generation (or registration) at a time per tournament
+        await try_lock_tournament(db, tournament_id)
+        
         # Get tournament
         tournament = await db.get(Tournament, tournament_id)
         if not tournament:
@@ -251,7 +273,7 @@ class BracketService:
             raise ValueError("Need at least 2 confirmed participants for round-robin")
         
         # Generate round-robin pairings
-        pairings = BracketService._generate_round_robin_pairings(len(participants))
+        pairings = round_robin_pairings(len(participants))
         
         matches = []
         match_number = 1
@@ -333,68 +355,101 @@ class BracketService:
                     matches.append(match)
                     match_number += 1
         
-        await db.commit()
+        await ChangeFeedService.record_change(db, tournament_id, *matches)
+        await db.flush()
         
         return matches
     
     @staticmethod
-    def _get_round_names(num_rounds: int) -> List[str]:
-        """
-        Generate round names for knockout bracket.
-        
-        Args:
-            num_rounds: Number of rounds
-            
-        Returns:
-            List of round names
-        """
-        if num_rounds == 1:
-            return ["Final"]
-        elif num_rounds == 2:
-            return ["Semifinal", "Final"]
-        elif num_rounds == 3:
-            return ["Quarterfinal", "Semifinal", "Final"]
-        elif num_rounds == 4:
-            return ["Round of 16", "Quarterfinal", "Semifinal", "Final"]
-        elif num_rounds == 5:
-            return ["Round of 32", "Round of 16", "Quarterfinal", "Semifinal", "Final"]
-        else:
-            # For larger tournaments
-            names = [f"Round {i}" for i in range(1, num_rounds - 2)]
-            names.extend(["Quarterfinal", "Semifinal", "Final"])
-            return names
-    
-    @staticmethod
-    def _generate_round_robin_pairings(n: int) -> List[List[Tuple[int, int]]]:
+    @profiled("bracket.tree")
+    async def get_bracket(
+        db: AsyncSession,
+        tournament_id: UUID,
+        phase: Optional[str] = None,
+        group_name: Optional[str] = None
+    ) -> List[BracketRound]:
         """
-        Generate round-robin pairings using circle method.
+        Get the tournament's matches as rounds → matches → participants.
         
-        Classic algorithm for fair round-robin scheduling.
+        One statement: participants (with names and seeds) are aggregated
+        per match with json_agg, as in MatchService.get_tournament_match_list.
+        Matches link to the next round via feeds_into_match_id.
         
         Args:
-            n: Number of participants
+            db: Database session
+            tournament_id: Tournament UUID
+            phase: Optional phase filter (e.g. 'knockout')
+            group_name: Optional group filter
             
         Returns:
-            List of rounds, each containing list of (home, away) tuples
+            List of rounds (ordered by round number)
         """
-        # Add dummy if odd number
-        if n % 2 == 1:
-            n += 1
-        
-        rounds = []
-        participants = list(range(n))
+        participants_json = (
+            select(
+                func.coalesce(
+                    func.json_agg(
+                        aggregate_order_by(
+                            func.json_build_object(
+                                "participant_id", MatchParticipant.participant_id,
+                                "participant_name", TournamentParticipant.participant_name,
+                                "seed", TournamentParticipant.seed,
+                                "slot_number", MatchParticipant.slot_number,
+                                "team_side", MatchParticipant.team_side,
+                                "score_value", MatchParticipant.score_value,
+                                "final_position", MatchParticipant.final_position,
+                                "is_winner", MatchParticipant.is_winner,
+                                "is_disqualified", MatchParticipant.is_disqualified
+                            ),
+                            MatchParticipant.slot_number
+                        )
+                    ),
+                    literal_column("'[]'::json")
+                )
+            )
+            .select_from(MatchParticipant)
+            .join(
+                TournamentParticipant,
+                TournamentParticipant.id == MatchParticipant.participant_id
+            )
+            .where(MatchParticipant.match_id == Match.id)
+            .scalar_subquery()
+        )
         
-        for round_num in range(n - 1):
-            round_pairings = []
-            
-            for i in range(n // 2):
-                # Skip dummy participant
-                if participants[i] < n - 1 and participants[-(i + 1)] < n - 1:
-                    round_pairings.append((participants[i], participants[-(i + 1)]))
-            
-            rounds.append(round_pairings)
-            
-            # Rotate participants (keep first fixed)
-            participants = [participants[0]] + [participants[-1]] + participants[1:-1]
+        query = select(
+            Match.id,
+            Match.round_number,
+            Match.round_name,
+            Match.match_number,
+            Match.group_name,
+            Match.phase,
+            Match.scheduled_start,
+            Match.venue_name,
+            Match.court_field_number,
+            Match.status,
+            Match.is_finished,
+            Match.is_bye,
+            Match.winner_participant_id,
+            Match.score_data,
+            Match.feeds_into_match_id,
+            participants_json.label("participants")
+        ).where(Match.tournament_id == tournament_id)
+        
+        if phase is not None:
+            query = query.where(Match.phase == phase)
+        
+        if group_name is not None:
+            query = query.where(Match.group_name == group_name)
+        
+        query = query.order_by(Match.round_number, Match.match_number)
         
+        result = await db.execute(query)
+        rounds: List[BracketRound] = []
+        for row in result:
+            if not rounds or rounds[-1].round_number != row.round_number:
+                rounds.append(BracketRound(
+                    round_number=row.round_number,
+                    round_name=row.round_name,
+                    matches=[]
+                ))
+            rounds[-1].matches.append(BracketMatch.model_validate(row, from_attributes=True))
         return rounds
@@ -0,0 +1,197 @@
+"""
+Change feed service for incremental tournament sync.
+
+Every write to a tournament, its participants, matches or standings bumps
+the tournament's monotonically increasing change_version in the same
+transaction and stamps the touched rows with the new version. Clients
+remember the last version they saw and fetch only rows stamped later.
+"""
+
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.locks import lock_tournament
+from app.models.tournament import Tournament
+from app.models.tournament_participant import TournamentParticipant
+from app.models.tournament_standings import TournamentStandings
+
+# Session.info key: tournaments whose version the transaction bumped
+# (read after commit, e.g. by the live tournament engine)
+CHANGED_TOURNAMENTS = "changed_tournaments"
+
+
+class ChangeFeedService:
+    """Service for tournament change versions and delta queries."""
+
+    @staticmethod
+    async def bump_version(
+        db: AsyncSession,
+        tournament_id: UUID,
+        resync: bool = False
+    ) -> int:
+        """
+        Increment the tournament's change version.
+
+        The UPDATE row-locks the tournament until commit, so concurrent
+        writers of the same tournament get strictly increasing versions.
+        The tournament's advisory lock is taken first (see app.db.locks).
+
+        Args:
+            db: Database session
+            tournament_id: Tournament UUID
+            resync: Also mark the new version as requiring a full resync
+                (used for deletions, which a delta cannot express)
+
+        Returns:
+            New change version
+
+        Raises:
+            ValueError: If tournament not found
+        """
+        await lock_tournament(db, tournament_id)
+        
+        values = {"change_version": Tournament.change_version + 1}
+        if resync:
+            values["resync_version"] = Tournament.change_version + 1
+
+        result = await db.execute(
+            update(Tournament)
+            .where(Tournament.id == tournament_id)
+            .values(**values)
+            .returning(Tournament.change_version)
+            .execution_options(synchronize_session="fetch")
+        )
+        version = result.scalar_one_or_none()
+        if version is None:
+            raise ValueError("Tournament not found")
+        db.info.setdefault(CHANGED_TOURNAMENTS, set()).add(tournament_id)
+        return version
+
+    @staticmethod
+    async def record_change(
+        db: AsyncSession,
+        tournament_id: UUID,
+        *rows: Any
+    ) -> int:
+        """
+        Bump the tournament version and stamp changed rows with it.
+
+        Args:
+            db: Database session
+            tournament_id: Tournament UUID
+            rows: Changed Match / TournamentParticipant / TournamentStandings objects
+
+        Returns:
+            New change version
+        """
+        version = await ChangeFeedService.bump_version(db, tournament_id)
+        for row in rows:
+            row.change_version = version
+        return version
+
+    @staticmethod
+    async def record_deletion(
+        db: AsyncSession,
+        tournament_id: UUID
+    ) -> int:
+        """
+        Bump the tournament version after deleting rows.
+
+        Clients whose last seen version is older than this get a full
+        resync from the change feed instead of a delta.
+
+        Args:
+            db: Database session
+            tournament_id: Tournament UUID
+
+        Returns:
+            New change version
+        """
+        return await ChangeFeedService.bump_version(db, tournament_id, resync=True)
+
+    @staticmethod
+    async def get_changes(
+        db: AsyncSession,
+        tournament_id: UUID,
+        since: int = 0
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get matches, participants and standings changed after a version.
+
+        Standings come from the active STANDINGS_BACKEND. The
+        materialized view has no per-row versions: all of the
+        tournament's standings are returned whenever anything changed
+        after the version (the view refresh bumps the version too).
+
+        Args:
+            db: Database session
+            tournament_id: Tournament UUID
+            since: Last change version the client has seen (0 = everything)
+
+        Returns:
+            Dictionary with the current version and changed rows,
+            or None if tournament not found
+        """
+        # Imported here to avoid circular imports with these services
+        from app.services.match_service import MatchService
+        from app.services.standings_view_service import StandingsViewService
+
+        tournament = await db.get(Tournament, tournament_id)
+        if not tournament:
+            return None
+
+        # A full snapshot is returned for new clients, clients behind the
+        # latest deletion and clients ahead of the server (e.g. after restore)
+        full_resync = (
+            since <= 0
+            or since < tournament.resync_version
+            or since > tournament.change_version
+        )
+        # Rows written before change tracking existed carry version 0
+        min_version = -1 if full_resync else since
+
+        matches = []
+        participants = []
+        standings = []
+
+        if min_version < tournament.change_version:
+            matches = await MatchService.get_tournament_match_list(
+                db, tournament_id, changed_since=min_version, limit=None
+            )
+
+            result = await db.execute(
+                select(TournamentParticipant).where(
+                    TournamentParticipant.tournament_id == tournament_id,
+                    TournamentParticipant.change_version > min_version
+                ).order_by(TournamentParticipant.registration_date)
+            )
+            participants = list(result.scalars().all())
+
+            if settings.STANDINGS_BACKEND == "materialized_view":
+                standings = await StandingsViewService.get_tournament_standings(db, tournament_id)
+            else:
+                result = await db.execute(
+                    select(TournamentStandings).where(
+                        TournamentStandings.tournament_id == tournament_id,
+                        TournamentStandings.change_version > min_version
+                    ).order_by(
+                        TournamentStandings.group_name.nullsfirst(),
+                        TournamentStandings.current_rank.nullslast()
+                    )
+                )
+                standings = list(result.scalars().all())
+
+        return {
+            "tournament_id": tournament.id,
+            "version": tournament.change_version,
+            "since": since,
+            "full_resync": full_resync,
+            "tournament": tournament,
+            "matches": matches,
+            "participants": participants,
+            "standings": standings,
+        }
@@ -118,7 +118,6 @@ class ClubMemberService:
             club.member_count += 1
             await db.flush()
         
-        await db.refresh(membership)
         
         return membership
     
@@ -140,7 +139,6 @@ class ClubMemberService:
             setattr(membership, field, value)
         
         await db.flush()
-        await db.refresh(membership)
         
         return membership
     
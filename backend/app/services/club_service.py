@@ -147,7 +147,6 @@ class ClubService:
         
         db.add(club)
         await db.flush()
-        await db.refresh(club)
         
         # Add creator as owner
         owner_membership = ClubMember(
@@ -161,7 +160,6 @@ class ClubService:
         club.member_count = 1
         
         await db.flush()
-        await db.refresh(club)
         
         return club
     
@@ -200,7 +198,6 @@ class ClubService:
             setattr(club, field, value)
         
         await db.flush()
-        await db.refresh(club)
         
         return club
     
@@ -236,6 +233,5 @@ class ClubService:
             club.verification_badge_date = date.today()
         
         await db.flush()
-        await db.refresh(club)
         
         return club
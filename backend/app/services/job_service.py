@@ -0,0 +1,545 @@
+"""
+Background jobs for heavy tournament operations.
+
+Bracket generation and full standings recalculation can run as jobs
+instead of inside the HTTP request: the endpoint enqueues the job and
+answers 202 with its ID, clients poll GET /jobs/{id} for status, progress
+and result.
+
+Jobs are kept by a queue backend (JOBS_BACKEND):
+- local: in process memory, run by this process's worker
+- redis: shared queue and job records in Redis, run by any process with a
+  worker (the API or `python -m app.worker`)
+
+Jobs of the same tournament never run concurrently (they would race on its
+matches and standings), jobs of different tournaments run in parallel up
+to JOBS_WORKER_CONCURRENCY. Failed attempts are retried with exponential
+backoff: the job goes back to the queue with a delay and its tournament is
+free for other jobs meanwhile. ValueError (invalid request, e.g. too few
+participants) and constraint violations fail the job right away.
+
+With redis, a taken job stays in a processing list under a lease until it
+is acknowledged; the lease and the tournament lock are renewed while the
+job runs (every JOBS_LOCK_TIMEOUT / 3). A job whose worker died loses its
+lease and is put back into the queue by the next worker that polls.
+"""
+
+import asyncio
+import json
+import logging
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+from uuid import UUID
+
+from sqlalchemy.exc import DBAPIError, IntegrityError
+
+from app.core.config import settings
+from app.core.redis import get_redis
+from app.db.session import AsyncSessionLocal
+from app.schemas.match import MatchResponse, StandingsDetail
+from app.services.bracket_service import BracketService
+from app.services.standings_service import StandingsService
+
+logger = logging.getLogger(__name__)
+
+# Job status
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+# Job kinds
+GENERATE_KNOCKOUT = "generate_knockout"
+GENERATE_ROUND_ROBIN = "generate_round_robin"
+RECALCULATE_STANDINGS = "recalculate_standings"
+
+JOB_FIELDS = (
+    "id", "kind", "tournament_id", "user_id", "payload", "status", "progress",
+    "message", "attempts", "result", "error", "created_at", "started_at",
+    "finished_at",
+)
+
+
+class Job:
+    """Job record (JSON-serializable values only)"""
+
+    __slots__ = JOB_FIELDS
+
+    def __init__(self, **values: Any):
+        for name in JOB_FIELDS:
+            setattr(self, name, values.get(name))
+
+    @classmethod
+    def create(cls, kind: str, tournament_id: UUID, user_id: UUID, payload: Dict[str, Any]) -> "Job":
+        return cls(
+            id=str(uuid.uuid4()),
+            kind=kind,
+            tournament_id=str(tournament_id),
+            user_id=str(user_id),
+            payload=payload,
+            status=QUEUED,
+            progress=0.0,
+            attempts=0,
+            created_at=datetime.utcnow().isoformat(),
+        )
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (SUCCEEDED, FAILED)
+
+    def to_json(self) -> str:
+        return json.dumps({name: getattr(self, name) for name in JOB_FIELDS})
+
+    @classmethod
+    def from_json(cls, data: str) -> "Job":
+        return cls(**json.loads(data))
+
+
+# ==================== QUEUE BACKENDS ====================
+
+class LocalJobQueue:
+    """In-process queue: jobs are lost on restart and only seen by this process"""
+
+    def __init__(self):
+        self._jobs: Dict[str, Job] = {}
+        self._pending: asyncio.Queue = asyncio.Queue()
+        self._busy: Set[str] = set()
+
+    async def put(self, job: Job) -> None:
+        self._prune()
+        self._jobs[job.id] = job
+        self._pending.put_nowait(job.id)
+
+    async def requeue(self, job: Job, delay: float = 0) -> None:
+        if delay > 0:
+            asyncio.get_running_loop().call_later(delay, self._pending.put_nowait, job.id)
+        else:
+            self._pending.put_nowait(job.id)
+
+    async def take(self) -> Optional[Job]:
+        job_id = await self._pending.get()
+        return self._jobs.get(job_id)
+
+    async def ack(self, job: Job) -> None:
+        pass  # Taken jobs are not tracked: they die with the process
+
+    async def renew(self, job: Job) -> bool:
+        return True  # Nothing expires
+
+    async def save(self, job: Job) -> None:
+        self._jobs[job.id] = job
+
+    async def get(self, job_id: str) -> Optional[Job]:
+        return self._jobs.get(job_id)
+
+    async def lock_tournament(self, tournament_id: str, job_id: str) -> bool:
+        if tournament_id in self._busy:
+            return False
+        self._busy.add(tournament_id)
+        return True
+
+    async def unlock_tournament(self, tournament_id: str, job_id: str) -> None:
+        self._busy.discard(tournament_id)
+
+    async def abandon(self, job: Job) -> None:
+        """Job interrupted by shutdown: nobody else will run it"""
+        job.status = FAILED
+        job.error = "Worker stopped"
+        job.finished_at = datetime.utcnow().isoformat()
+
+    def _prune(self) -> None:
+        cutoff = (datetime.utcnow() - timedelta(seconds=settings.JOBS_RESULT_TTL)).isoformat()
+        for job_id in [
+            job.id for job in self._jobs.values()
+            if job.finished and job.finished_at < cutoff
+        ]:
+            del self._jobs[job_id]
+
+
+# Release a tournament lock only if this job still holds it
+_UNLOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+# Extend a tournament lock only if this job still holds it
+_RENEW_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("expire", KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+# Move the next job into the processing list and lease it, in one step (a
+# processing entry without lease counts as abandoned)
+_TAKE_SCRIPT = """
+local job_id = redis.call("lmove", KEYS[1], KEYS[2], "LEFT", "RIGHT")
+if job_id then
+    redis.call("set", ARGV[1] .. job_id, "1", "EX", ARGV[2])
+end
+return job_id
+"""
+
+# Put a processing job back into the queue if its lease expired
+_REAP_SCRIPT = """
+if redis.call("exists", KEYS[3]) == 0 and redis.call("lrem", KEYS[2], 1, ARGV[1]) > 0 then
+    redis.call("rpush", KEYS[1], ARGV[1])
+    return 1
+end
+return 0
+"""
+
+# Move delayed jobs that are due into the queue
+_PROMOTE_SCRIPT = """
+local due = redis.call("zrangebyscore", KEYS[1], "-inf", ARGV[1])
+for _, job_id in ipairs(due) do
+    redis.call("zrem", KEYS[1], job_id)
+    redis.call("rpush", KEYS[2], job_id)
+end
+return #due
+"""
+
+
+class RedisJobQueue:
+    """
+    Queue shared by all processes: a Redis list of job IDs, a processing
+    list of taken jobs with one lease key each, a sorted set of delayed
+    jobs (by due time), job records as JSON strings (expiring
+    JOBS_RESULT_TTL after they were last written) and one lock key per
+    tournament with a running job. Needs Redis 6.2 (LMOVE).
+    """
+
+    QUEUE_KEY = "jobs:queue"
+    PROCESSING_KEY = "jobs:processing"
+    DELAYED_KEY = "jobs:delayed"
+    LEASE_PREFIX = "jobs:lease:"
+
+    def __init__(self):
+        self._next_reap = 0.0
+
+    @staticmethod
+    def _job_key(job_id: str) -> str:
+        return f"jobs:job:{job_id}"
+
+    @staticmethod
+    def _lock_key(tournament_id: str) -> str:
+        return f"jobs:lock:{tournament_id}"
+
+    async def put(self, job: Job) -> None:
+        await self.save(job)
+        await get_redis().rpush(self.QUEUE_KEY, job.id)
+
+    async def requeue(self, job: Job, delay: float = 0) -> None:
+        """Release a taken job back into the queue (after delay seconds)"""
+        async with get_redis().pipeline(transaction=True) as pipe:
+            pipe.lrem(self.PROCESSING_KEY, 1, job.id)
+            pipe.delete(self.LEASE_PREFIX + job.id)
+            if delay > 0:
+                pipe.zadd(self.DELAYED_KEY, {job.id: time.time() + delay})
+            else:
+                pipe.rpush(self.QUEUE_KEY, job.id)
+            await pipe.execute()
+
+    async def take(self) -> Optional[Job]:
+        # Polling: blocking pops would outlast REDIS_SOCKET_TIMEOUT
+        redis = get_redis()
+        while True:
+            await redis.eval(_PROMOTE_SCRIPT, 2, self.DELAYED_KEY, self.QUEUE_KEY, time.time())
+            await self._reap()
+            job_id = await redis.eval(
+                _TAKE_SCRIPT, 2, self.QUEUE_KEY, self.PROCESSING_KEY,
+                self.LEASE_PREFIX, settings.JOBS_LOCK_TIMEOUT
+            )
+            if job_id is None:
+                await asyncio.sleep(settings.JOBS_POLL_INTERVAL)
+                continue
+            job = await self.get(job_id.decode())
+            if job is not None:
+                return job
+            # Record expired: drop the job
+            await self.ack(Job(id=job_id.decode()))
+
+    async def ack(self, job: Job) -> None:
+        """Done with a taken job (finished or failed for good)"""
+        async with get_redis().pipeline(transaction=True) as pipe:
+            pipe.lrem(self.PROCESSING_KEY, 1, job.id)
+            pipe.delete(self.LEASE_PREFIX + job.id)
+            await pipe.execute()
+
+    async def renew(self, job: Job) -> bool:
+        """Extend a running job's lease and tournament lock (False if the lock was lost)"""
+        redis = get_redis()
+        await redis.expire(self.LEASE_PREFIX + job.id, settings.JOBS_LOCK_TIMEOUT)
+        return bool(await redis.eval(
+            _RENEW_LOCK_SCRIPT, 1, self._lock_key(job.tournament_id),
+            job.id, settings.JOBS_LOCK_TIMEOUT
+        ))
+
+    async def _reap(self) -> None:
+        """Requeue jobs whose worker stopped renewing their lease"""
+        now = time.monotonic()
+        if now < self._next_reap:
+            return
+        self._next_reap = now + settings.JOBS_LOCK_TIMEOUT / 3
+        redis = get_redis()
+        for job_id in await redis.lrange(self.PROCESSING_KEY, 0, -1):
+            job_id = job_id.decode()
+            if await redis.eval(
+                _REAP_SCRIPT, 3, self.QUEUE_KEY, self.PROCESSING_KEY,
+                self.LEASE_PREFIX + job_id, job_id
+            ):
+                logger.warning("Job %s: worker lost, requeued", job_id)
+
+    async def save(self, job: Job) -> None:
+        await get_redis().set(self._job_key(job.id), job.to_json(), ex=settings.JOBS_RESULT_TTL)
+
+    async def get(self, job_id: str) -> Optional[Job]:
+        data = await get_redis().get(self._job_key(job_id))
+        return Job.from_json(data) if data is not None else None
+
+    async def lock_tournament(self, tournament_id: str, job_id: str) -> bool:
+        # Expires in case the process holding it dies
+        return bool(await get_redis().set(
+            self._lock_key(tournament_id), job_id, nx=True, ex=settings.JOBS_LOCK_TIMEOUT
+        ))
+
+    async def unlock_tournament(self, tournament_id: str, job_id: str) -> None:
+        await get_redis().eval(_UNLOCK_SCRIPT, 1, self._lock_key(tournament_id), job_id)
+
+    async def abandon(self, job: Job) -> None:
+        """Job interrupted by shutdown: leave it to another worker"""
+        job.status = QUEUED
+        await self.save(job)
+        await self.requeue(job)
+
+
+def _create_queue():
+    if settings.JOBS_BACKEND == "redis":
+        return RedisJobQueue()
+    return LocalJobQueue()
+
+
+job_queue = _create_queue()
+
+
+# ==================== JOB HANDLERS ====================
+
+Progress = Callable[[float, str], Awaitable[None]]
+
+
+async def _generate_knockout(db, job: Job, progress: Progress) -> Any:
+    await progress(0.1, "Generating bracket")
+    matches = await BracketService.generate_knockout_bracket(
+        db, UUID(job.tournament_id), job.payload.get("shuffle_seeds", False)
+    )
+    await progress(0.9, "Saving matches")
+    return [MatchResponse.model_validate(m).model_dump(mode="json") for m in matches]
+
+
+async def _generate_round_robin(db, job: Job, progress: Progress) -> Any:
+    await progress(0.1, "Generating schedule")
+    matches = await BracketService.generate_round_robin_schedule(
+        db,
+        UUID(job.tournament_id),
+        job.payload.get("home_and_away", False),
+        job.payload.get("group_name"),
+    )
+    await progress(0.9, "Saving matches")
+    return [MatchResponse.model_validate(m).model_dump(mode="json") for m in matches]
+
+
+async def _recalculate_standings(db, job: Job, progress: Progress) -> Any:
+    await progress(0.1, "Recalculating standings")
+    standings = await StandingsService.calculate_standings(
+        db, UUID(job.tournament_id), job.payload.get("group_name")
+    )
+    await progress(0.9, "Saving standings")
+    return [StandingsDetail.model_validate(s).model_dump(mode="json") for s in standings]
+
+
+JOB_HANDLERS: Dict[str, Callable[..., Awaitable[Any]]] = {
+    GENERATE_KNOCKOUT: _generate_knockout,
+    GENERATE_ROUND_ROBIN: _generate_round_robin,
+    RECALCULATE_STANDINGS: _recalculate_standings,
+}
+
+
+class JobService:
+    """Service for enqueueing and looking up background jobs."""
+
+    @staticmethod
+    async def enqueue(
+        kind: str,
+        tournament_id: UUID,
+        user_id: UUID,
+        payload: Optional[Dict[str, Any]] = None
+    ) -> Job:
+        """
+        Queue a job.
+
+        Args:
+            kind: Job kind (one of JOB_HANDLERS)
+            tournament_id: Tournament the job works on (jobs of one
+                tournament run one at a time, in order; a job waiting
+                for a retry lets the next one run)
+            user_id: User who requested it
+            payload: JSON-serializable job arguments
+
+        Returns:
+            Queued job
+        """
+        if kind not in JOB_HANDLERS:
+            raise ValueError(f"Unknown job kind: {kind}")
+        job = Job.create(kind, tournament_id, user_id, payload or {})
+        await job_queue.put(job)
+        return job
+
+    @staticmethod
+    async def get_job(job_id: UUID) -> Optional[Job]:
+        """
+        Get a job by ID.
+
+        Args:
+            job_id: Job UUID
+
+        Returns:
+            Job or None if unknown (or expired, see JOBS_RESULT_TTL)
+        """
+        return await job_queue.get(str(job_id))
+
+
+class JobWorker:
+    """
+    Runs queued jobs: JOBS_WORKER_CONCURRENCY tasks taking jobs off the
+    queue, one attempt at a time. A job whose tournament is busy goes back
+    to the end of the queue.
+    """
+
+    def __init__(self):
+        self._tasks: List[asyncio.Task] = []
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    def start(self) -> None:
+        loop = asyncio.get_running_loop()
+        self._tasks = [
+            loop.create_task(self._run())
+            for _ in range(settings.JOBS_WORKER_CONCURRENCY)
+        ]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                job = await job_queue.take()
+                if job is None:
+                    continue  # Expired meanwhile
+                if job.finished:
+                    await job_queue.ack(job)
+                    continue
+                if job.status == RUNNING and job.attempts >= settings.JOBS_MAX_ATTEMPTS:
+                    # Requeued after its worker died in the last attempt
+                    self._finish(job, FAILED, error="Worker stopped during the last attempt")
+                    await job_queue.save(job)
+                    await job_queue.ack(job)
+                    continue
+                if not await job_queue.lock_tournament(job.tournament_id, job.id):
+                    await job_queue.requeue(job, settings.JOBS_POLL_INTERVAL)
+                    continue
+                try:
+                    await self._execute(job)
+                finally:
+                    await job_queue.unlock_tournament(job.tournament_id, job.id)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Job worker error")
+                await asyncio.sleep(settings.JOBS_POLL_INTERVAL)
+
+    async def _execute(self, job: Job) -> None:
+        """Run one attempt of a job (a failed attempt is requeued for the retry)"""
+        handler = JOB_HANDLERS[job.kind]
+
+        async def progress(value: float, message: str) -> None:
+            job.progress = value
+            job.message = message
+            await job_queue.save(job)
+
+        keep_alive = asyncio.get_running_loop().create_task(self._keep_alive(job))
+        try:
+            job.status = RUNNING
+            job.started_at = job.started_at or datetime.utcnow().isoformat()
+            job.attempts += 1
+            job.error = None
+            await progress(0.0, "Started")
+            try:
+                async with AsyncSessionLocal() as db:
+                    result = await handler(db, job, progress)
+                    await db.commit()
+            except asyncio.CancelledError:
+                await job_queue.abandon(job)
+                raise
+            except (ValueError, IntegrityError) as e:
+                # Invalid request or conflicting data: retrying does not help
+                self._finish(job, FAILED, error=self._describe(e))
+            except Exception as e:
+                logger.exception("Job %s (%s) attempt %s failed", job.id, job.kind, job.attempts)
+                if job.attempts >= settings.JOBS_MAX_ATTEMPTS:
+                    self._finish(job, FAILED, error=self._describe(e))
+                else:
+                    # Wait in the queue, not holding the tournament's lock
+                    job.status = QUEUED
+                    job.error = self._describe(e)
+                    job.message = "Retrying"
+                    await job_queue.save(job)
+                    await job_queue.requeue(job, settings.JOBS_RETRY_DELAY * 2 ** (job.attempts - 1))
+                    return
+            else:
+                self._finish(job, SUCCEEDED, result=result)
+        finally:
+            keep_alive.cancel()
+        await job_queue.save(job)
+        await job_queue.ack(job)
+
+    @staticmethod
+    async def _keep_alive(job: Job) -> None:
+        """Renew the job's lease and tournament lock while it runs"""
+        while True:
+            await asyncio.sleep(settings.JOBS_LOCK_TIMEOUT / 3)
+            try:
+                if not await job_queue.renew(job):
+                    logger.warning("Job %s lost the lock of tournament %s", job.id, job.tournament_id)
+            except Exception:
+                logger.exception("Job %s: renewing the lease failed", job.id)
+
+    @staticmethod
+    def _describe(error: Exception) -> str:
+        if isinstance(error, ValueError):
+            return str(error)
+        if isinstance(error, DBAPIError):
+            error = error.orig  # Without statement and parameters
+        return f"{type(error).__name__}: {error}"
+
+    @staticmethod
+    def _finish(job: Job, status: str, result: Any = None, error: Optional[str] = None) -> None:
+        job.status = status
+        job.result = result
+        job.error = error
+        job.message = None
+        if status == SUCCEEDED:
+            job.progress = 1.0
+        job.finished_at = datetime.utcnow().isoformat()
+
+
+job_worker = JobWorker()
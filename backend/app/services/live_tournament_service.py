@@ -0,0 +1,490 @@
+"""
+Live tournament engine (LIVE_ENGINE_ENABLED).
+
+ACTIVE tournaments are held in memory (app.engine.live), each owned by an
+actor: one task that applies the tournament's score events strictly in
+order, so concurrent updates never contend for locks, while match and
+standings reads are answered from memory.
+
+Changes are written behind in batches: the actor applies every event
+waiting in its inbox, then persists the whole batch to the usual tables
+in one transaction (bulk UPDATE by primary key, one change version, one
+standings update). Callers are only acknowledged after that commit, so a
+successful score response is durable.
+
+Tournaments are loaded when they become ACTIVE (and at startup) and
+evicted when COMPLETED or CANCELLED. Any other write to a live tournament
+reloads it from the database after commit. State is per process, so a
+batch is only written if the tournament is still at the version the state
+is at (checked under the tournament's lock). Otherwise someone else wrote
+in between (another worker, or a database-path edit whose reload is still
+queued behind the batch): the batch is rolled back, the state reloaded and
+the batch's score events applied again, so the other write is never
+overwritten. Standings reads notice such writes by the version as well.
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+from operator import attrgetter
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy import event, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
+
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal
+from app.engine.live import LiveEntry, LiveMatch, LiveStanding, LiveTournament
+from app.models.match import Match
+from app.models.match_participant import MatchParticipant
+from app.models.tournament import Tournament, TournamentStatus
+from app.models.tournament_participant import TournamentParticipant
+from app.schemas.match import MatchScoreUpdate
+from app.services.change_feed_service import CHANGED_TOURNAMENTS, ChangeFeedService
+from app.services.standings_service import StandingsService
+
+logger = logging.getLogger(__name__)
+
+# Session.info keys
+LIVE_WRITER = "live_engine_writer"  # The actor's own write-behind session
+LIVE_STATUS = "live_engine_status"  # Tournament status changes to act on after commit
+
+# Actor events
+SCORE = "score"
+RELOAD = "reload"
+STOP = "stop"
+
+# A score event: caller's future, match ID, score update
+ScoreEvent = Tuple[asyncio.Future, UUID, MatchScoreUpdate]
+
+# Attempts to write a batch that keeps meeting concurrent writes
+MAX_PERSIST_ATTEMPTS = 5
+
+MATCH_RESULT_FIELDS = ("status", "is_finished", "winner_participant_id", "score_data", "updated_at")
+ENTRY_RESULT_FIELDS = (
+    "score_value", "final_position", "result_time", "is_winner",
+    "is_disqualified", "detailed_score",
+)
+
+
+class StaleLiveStateError(Exception):
+    """The tournament was written since the live state was loaded"""
+
+    def __init__(self, tournament_id: UUID):
+        super().__init__("Live tournament state is outdated")
+        self.tournament_id = tournament_id
+
+
+class LiveTournamentService:
+    """Service for loading and persisting live tournament state."""
+
+    @staticmethod
+    async def load(
+        db: AsyncSession,
+        tournament_id: UUID
+    ) -> Optional[LiveTournament]:
+        """
+        Load a tournament's matches and participants into memory.
+
+        Args:
+            db: Database session
+            tournament_id: Tournament UUID
+
+        Returns:
+            Live tournament or None if not found
+        """
+        result = await db.execute(
+            select(Tournament.change_version).where(Tournament.id == tournament_id)
+        )
+        version = result.scalar_one_or_none()
+        if version is None:
+            return None
+
+        result = await db.execute(
+            select(TournamentParticipant)
+            .where(TournamentParticipant.tournament_id == tournament_id)
+            .order_by(TournamentParticipant.created_at, TournamentParticipant.id)
+        )
+        participants = list(result.scalars().all())
+        by_id = {participant.id: participant for participant in participants}
+
+        result = await db.execute(
+            select(Match)
+            .where(Match.tournament_id == tournament_id)
+            .options(selectinload(Match.participants))
+        )
+        matches = [
+            LiveMatch(
+                match,
+                [LiveEntry(mp) for mp in sorted(match.participants, key=attrgetter("slot_number"))],
+                by_id.get(match.winner_participant_id),
+            )
+            for match in result.scalars()
+        ]
+        return LiveTournament(tournament_id, version, participants, matches)
+
+    @staticmethod
+    async def persist(
+        db: AsyncSession,
+        tournament_id: UUID,
+        expected_version: int,
+        match_rows: List[Dict[str, Any]],
+        entry_rows: List[Dict[str, Any]],
+        group_names: Iterable[Optional[str]] = ()
+    ) -> Tuple[int, int]:
+        """
+        Write a batch of score changes and update the standings.
+
+        Nothing is written unless the tournament is still at the live
+        state's version: the batch was computed from that state and would
+        overwrite anything written since.
+
+        Args:
+            db: Database session
+            tournament_id: Tournament UUID
+            expected_version: Change version of the live state
+            match_rows: Changed match columns by match ID
+            entry_rows: Changed match participant columns by ID
+            group_names: Groups of the changed matches (their standings
+                are recalculated too, as on the database path)
+
+        Returns:
+            Change version of the batch and the tournament's version after
+            the standings update
+
+        Raises:
+            StaleLiveStateError: If the tournament was written since
+        """
+        # Holds the tournament's lock and row until commit: the check stays valid
+        version = await ChangeFeedService.bump_version(db, tournament_id)
+        if version != expected_version + 1:
+            raise StaleLiveStateError(tournament_id)
+        for row in match_rows:
+            row["change_version"] = version
+
+        await db.execute(update(Match), match_rows)
+        await db.execute(update(MatchParticipant), entry_rows)
+        # In this transaction: a later recalculation would bump the version
+        # again and make the live state look outdated
+        await StandingsService.results_changed(db, tournament_id, group_names, immediate=True)
+
+        result = await db.execute(
+            select(Tournament.change_version).where(Tournament.id == tournament_id)
+        )
+        return version, result.scalar_one()
+
+    @staticmethod
+    async def get_active_tournament_ids(db: AsyncSession) -> List[UUID]:
+        """
+        Get IDs of all ACTIVE tournaments.
+
+        Args:
+            db: Database session
+
+        Returns:
+            List of tournament UUIDs
+        """
+        result = await db.execute(
+            select(Tournament.id).where(Tournament.status == TournamentStatus.ACTIVE.value)
+        )
+        return list(result.scalars().all())
+
+    @staticmethod
+    def status_changed(
+        db: AsyncSession,
+        tournament_id: UUID,
+        status: str
+    ) -> None:
+        """
+        Load or evict the tournament once the status change has committed.
+
+        Args:
+            db: Database session
+            tournament_id: Tournament UUID
+            status: New tournament status
+        """
+        if settings.LIVE_ENGINE_ENABLED:
+            db.info.setdefault(LIVE_STATUS, {})[tournament_id] = status
+
+
+class LiveTournamentActor:
+    """
+    Owner of one live tournament.
+
+    Events are processed in order by a single task; all events queued
+    while a batch was being written form the next batch.
+    """
+
+    def __init__(self, tournament_id: UUID, registry: "LiveTournamentRegistry"):
+        self.tournament_id = tournament_id
+        self.state: Optional[LiveTournament] = None
+        self._registry = registry
+        self._inbox: asyncio.Queue = asyncio.Queue()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def send(self, *event: Any) -> None:
+        self._inbox.put_nowait((event, None))
+
+    async def ask(self, *event: Any) -> Any:
+        future = asyncio.get_running_loop().create_future()
+        self._inbox.put_nowait((event, future))
+        return await future
+
+    async def close(self) -> None:
+        """Persist queued events, then stop"""
+        self.send(STOP)
+        await self._task
+
+    async def _run(self) -> None:
+        while True:
+            batch = [await self._inbox.get()]
+            while len(batch) < settings.LIVE_ENGINE_MAX_BATCH and not self._inbox.empty():
+                batch.append(self._inbox.get_nowait())
+            try:
+                if await self._process(batch):
+                    return
+            except Exception as e:
+                # Memory may now be ahead of the database: start over from it
+                logger.exception("Live tournament %s: batch failed", self.tournament_id)
+                for _, future in batch:
+                    if future is not None and not future.done():
+                        future.set_exception(e)
+                self._set_state(None)
+                if any(event[0] == STOP for event, _ in batch):
+                    return
+                self.send(RELOAD)
+
+    async def _process(self, batch: List[Tuple[tuple, Optional[asyncio.Future]]]) -> bool:
+        pending: List[ScoreEvent] = []  # Applied to the state, not yet written
+        for (kind, *args), future in batch:
+            if kind == SCORE:
+                if future.cancelled():
+                    continue  # Caller gone before the update was applied
+                if self._apply(future, *args):
+                    pending.append((future, *args))
+            elif kind == RELOAD:
+                await self._flush(pending)
+                pending = []
+                await self._load()
+                if future is not None and not future.done():
+                    future.set_result(self.state is not None)
+            elif kind == STOP:
+                await self._flush(pending)
+                return True
+        await self._flush(pending)
+        return False
+
+    def _apply(self, future: asyncio.Future, match_id: UUID, score_data: MatchScoreUpdate) -> bool:
+        """Apply a score event to the state (False: the caller has its answer)"""
+        # Reapplied events may belong to callers that are gone by now
+        if self.state is None:
+            if not future.done():
+                future.set_result(None)  # Not loaded: caller uses the database path
+            return False
+        try:
+            self.state.apply_score(match_id, score_data, datetime.utcnow())
+        except ValueError as e:
+            if not future.done():
+                future.set_exception(e)
+            return False
+        return True
+
+    async def _flush(self, pending: List[ScoreEvent]) -> None:
+        """Persist the batch in one transaction, then acknowledge it"""
+        for attempt in range(1, MAX_PERSIST_ATTEMPTS + 1):
+            if not pending:
+                return
+            try:
+                await self._persist(pending)
+                break
+            except StaleLiveStateError:
+                if attempt == MAX_PERSIST_ATTEMPTS:
+                    raise
+            # Rolled back: start over from what the other writer committed
+            logger.info("Live tournament %s: written concurrently, reapplying batch", self.tournament_id)
+            await self._load()
+            pending = [event for event in pending if self._apply(*event)]
+
+        for future, match_id, _ in pending:
+            if not future.done():
+                future.set_result(self.state.match(match_id))
+
+    async def _persist(self, pending: List[ScoreEvent]) -> None:
+        # Snapshot before the first await (the state keeps changing)
+        changed = {match_id: self.state.match(match_id) for _, match_id, _ in pending}
+        expected_version = self.state.version
+        match_rows, entry_rows = [], []
+        group_names = {match.group_name for match in changed.values()}
+        for match in changed.values():
+            match_rows.append({"id": match.id, **{f: getattr(match, f) for f in MATCH_RESULT_FIELDS}})
+            for entry in match.participants:
+                entry_rows.append({
+                    "id": entry.id,
+                    "updated_at": match.updated_at,
+                    **{f: getattr(entry, f) for f in ENTRY_RESULT_FIELDS},
+                })
+
+        async with AsyncSessionLocal() as db:
+            db.info[LIVE_WRITER] = True
+            version, latest = await LiveTournamentService.persist(
+                db, self.tournament_id, expected_version, match_rows, entry_rows, group_names
+            )
+            await db.commit()
+
+        self.state.version = latest
+        for match in changed.values():
+            match.change_version = version
+
+    async def _load(self) -> None:
+        async with AsyncSessionLocal() as db:
+            state = await LiveTournamentService.load(db, self.tournament_id)
+        self._set_state(state)
+
+    def _set_state(self, state: Optional[LiveTournament]) -> None:
+        self.state = state
+        self._registry._index(self.tournament_id, state)
+
+
+class LiveTournamentRegistry:
+    """Live tournaments of this process, by tournament and by match."""
+
+    def __init__(self):
+        self._actors: Dict[UUID, LiveTournamentActor] = {}
+        self._match_index: Dict[UUID, UUID] = {}
+        self._indexed: Dict[UUID, Set[UUID]] = {}
+
+    def get(self, tournament_id: UUID) -> Optional[LiveTournament]:
+        """Loaded state of a live tournament (None if not live or loading)"""
+        actor = self._actors.get(tournament_id)
+        return actor.state if actor is not None else None
+
+    def is_live_match(self, match_id: UUID) -> bool:
+        return match_id in self._match_index
+
+    def get_match(self, match_id: UUID) -> Optional[LiveMatch]:
+        tournament_id = self._match_index.get(match_id)
+        state = self.get(tournament_id) if tournament_id else None
+        return state.match(match_id) if state is not None else None
+
+    def get_standings(
+        self,
+        tournament_id: UUID,
+        version: int,
+        group_name: Optional[str] = None
+    ) -> Optional[List[LiveStanding]]:
+        """
+        Standings from memory if the state is at least at the given version.
+
+        An older state missed a write (from another worker): it is reloaded
+        and None returned, so the caller reads the database instead.
+        """
+        state = self.get(tournament_id)
+        if state is None:
+            return None
+        if state.version < version:
+            self.reload(tournament_id)
+            return None
+        return state.standings(group_name)
+
+    async def update_score(
+        self,
+        match_id: UUID,
+        score_data: MatchScoreUpdate
+    ) -> Optional[LiveMatch]:
+        """
+        Apply a score update through the tournament's actor.
+
+        Returns after the update has been committed.
+
+        Returns:
+            Updated match, or None if the match's tournament is not live
+
+        Raises:
+            ValueError: If the score is invalid
+        """
+        tournament_id = self._match_index.get(match_id)
+        actor = self._actors.get(tournament_id) if tournament_id else None
+        if actor is None:
+            return None
+        return await actor.ask(SCORE, match_id, score_data)
+
+    def activate(self, tournament_id: UUID) -> None:
+        if tournament_id not in self._actors:
+            self._start_actor(tournament_id).send(RELOAD)
+
+    def reload(self, tournament_id: UUID) -> None:
+        actor = self._actors.get(tournament_id)
+        if actor is not None:
+            actor.send(RELOAD)
+
+    async def evict(self, tournament_id: UUID) -> None:
+        actor = self._actors.pop(tournament_id, None)
+        if actor is not None:
+            self._index(tournament_id, None)
+            await actor.close()
+
+    async def start(self) -> int:
+        """Activate all ACTIVE tournaments (application startup)"""
+        async with AsyncSessionLocal() as db:
+            tournament_ids = await LiveTournamentService.get_active_tournament_ids(db)
+        # One at a time: loading is heavy, the pool is needed for requests
+        for tournament_id in tournament_ids:
+            if tournament_id not in self._actors:
+                await self._start_actor(tournament_id).ask(RELOAD)
+        return len(tournament_ids)
+
+    async def stop(self) -> None:
+        """Persist queued events of all tournaments and stop their actors"""
+        for tournament_id in list(self._actors):
+            await self.evict(tournament_id)
+
+    def _start_actor(self, tournament_id: UUID) -> LiveTournamentActor:
+        actor = self._actors[tournament_id] = LiveTournamentActor(tournament_id, self)
+        return actor
+
+    def _index(self, tournament_id: UUID, state: Optional[LiveTournament]) -> None:
+        for match_id in self._indexed.pop(tournament_id, ()):
+            self._match_index.pop(match_id, None)
+        if state is not None and tournament_id in self._actors:
+            self._indexed[tournament_id] = set(state.matches)
+            for match_id in state.matches:
+                self._match_index[match_id] = tournament_id
+
+
+live_tournaments = LiveTournamentRegistry()
+
+
+def _schedule(coro) -> None:
+    try:
+        asyncio.get_running_loop().create_task(coro)
+    except RuntimeError:
+        coro.close()
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_committed_changes(session: Session) -> None:
+    statuses = session.info.pop(LIVE_STATUS, {})
+    changed = session.info.pop(CHANGED_TOURNAMENTS, set())
+    if session.info.get(LIVE_WRITER) or not settings.LIVE_ENGINE_ENABLED:
+        return
+
+    for tournament_id, status in statuses.items():
+        if status == TournamentStatus.ACTIVE.value:
+            try:
+                live_tournaments.activate(tournament_id)
+            except RuntimeError:
+                logger.warning("No event loop, tournament %s not activated", tournament_id)
+        elif status in (TournamentStatus.COMPLETED.value, TournamentStatus.CANCELLED.value):
+            _schedule(live_tournaments.evict(tournament_id))
+
+    # Written outside the engine: the live state is outdated
+    for tournament_id in changed - statuses.keys():
+        live_tournaments.reload(tournament_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changes(session: Session) -> None:
+    session.info.pop(LIVE_STATUS, None)
+    session.info.pop(CHANGED_TOURNAMENTS, None)
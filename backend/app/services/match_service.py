@@ -5,24 +5,109 @@ This service handles all match-related operations including CRUD,
 scoring, status management, and match participant management.
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime, timezone
 from typing import List, Optional, Dict, Any
 from uuid import UUID
 from decimal import Decimal
 
-from sqlalchemy import select, and_, or_, func
+from sqlalchemy import DateTime, cast, select, and_, or_, func, literal_column, union_all
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased, selectinload
 
+from app.models.club_member import ClubMember
 from app.models.match import Match, MatchStatus
 from app.models.match_participant import MatchParticipant
-from app.models.tournament import Tournament
+from app.models.tournament import Tournament, TournamentStatus
 from app.models.tournament_participant import TournamentParticipant
+from app.engine.scoring import apply_score
+from app.services.change_feed_service import ChangeFeedService
 from app.schemas.match import (
     MatchCreate, MatchUpdate, MatchScoreUpdate, MatchStatusUpdate,
-    ParticipantScoreEntry
+    ParticipantScoreEntry, MatchListItem, UpcomingMatchItem, ScheduleConflictItem
 )
 
+# Matches that are still to be played
+UPCOMING_STATUSES = (
+    MatchStatus.SCHEDULED.value,
+    MatchStatus.IN_PROGRESS.value,
+    MatchStatus.POSTPONED.value,
+)
+
+# Matches that no longer occupy their court (outside the booking constraint)
+SLOT_FREE_STATUSES = (
+    MatchStatus.CANCELLED.value,
+    MatchStatus.POSTPONED.value,
+    MatchStatus.WALKOVER.value,
+)
+
+# Match fields that decide a court booking
+SLOT_FIELDS = ("venue_name", "court_field_number", "scheduled_start", "scheduled_end")
+
+# SQLSTATE of exclusion constraint violations (excl_match_court_slot)
+EXCLUSION_VIOLATION = "23P01"
+
+
+class ScheduleConflictError(Exception):
+    """The court is already booked for (part of) the match's time slot"""
+
+    def __init__(self, conflicting_match_ids: List[UUID] = ()):
+        super().__init__("Court is already booked for this time slot")
+        self.conflicting_match_ids = list(conflicting_match_ids)
+
+
+def naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Timezone-aware datetimes as naive UTC (match times are naive UTC columns)"""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+async def _flush_booking(db: AsyncSession) -> None:
+    """Flush, reporting a violated booking constraint as ScheduleConflictError"""
+    try:
+        await db.flush()
+    except IntegrityError as e:
+        # A concurrent transaction booked the slot after our check
+        if getattr(e.orig, "sqlstate", None) == EXCLUSION_VIOLATION:
+            raise ScheduleConflictError() from e
+        raise
+
+
+def _participants_json(match_id):
+    """
+    Participants of the match with the given ID as a JSON array
+    (MatchListParticipant fields, ordered by slot). Correlated subquery on
+    its own aliases, so the outer query may join the same tables.
+    """
+    entry = aliased(MatchParticipant)
+    participant = aliased(TournamentParticipant)
+    return (
+        select(
+            func.coalesce(
+                func.json_agg(
+                    aggregate_order_by(
+                        func.json_build_object(
+                            "participant_id", entry.participant_id,
+                            "participant_name", participant.participant_name,
+                            "slot_number", entry.slot_number,
+                            "team_side", entry.team_side,
+                            "score_value", entry.score_value,
+                            "is_winner", entry.is_winner
+                        ),
+                        entry.slot_number
+                    )
+                ),
+                literal_column("'[]'::json")
+            )
+        )
+        .select_from(entry)
+        .join(participant, participant.id == entry.participant_id)
+        .where(entry.match_id == match_id)
+        .scalar_subquery()
+    )
+
 
 class MatchService:
     """Service for match operations."""
@@ -44,6 +129,7 @@ class MatchService:
             
         Raises:
             ValueError: If tournament doesn't exist or participants invalid
+            ScheduleConflictError: If the court is booked in the match's slot
         """
         # Verify tournament exists
         tournament = await db.get(Tournament, match_data.tournament_id)
@@ -83,9 +169,10 @@ class MatchService:
             status=MatchStatus.SCHEDULED.value,
             is_finished=False
         )
+        await MatchService.check_schedule(db, match)
         
         db.add(match)
-        await db.flush()  # Get match ID
+        await _flush_booking(db)  # Get match ID
         
         # Add participants
         num_participants = len(match_data.participant_ids)
@@ -105,8 +192,8 @@ class MatchService:
             )
             db.add(match_participant)
         
-        await db.commit()
-        await db.refresh(match)
+        await ChangeFeedService.record_change(db, match.tournament_id, match)
+        await db.flush()
         
         return match
     
@@ -187,6 +274,294 @@ class MatchService:
         result = await db.execute(query)
         return list(result.scalars().all())
     
+    @staticmethod
+    async def get_tournament_match_list(
+        db: AsyncSession,
+        tournament_id: UUID,
+        round_number: Optional[int] = None,
+        group_name: Optional[str] = None,
+        phase: Optional[str] = None,
+        status: Optional[str] = None,
+        skip: int = 0,
+        limit: Optional[int] = 100,
+        changed_since: Optional[int] = None
+    ) -> List[MatchListItem]:
+        """
+        Get lightweight match list items for a tournament.
+        
+        Selects only the columns of MatchListItem instead of full Match
+        entities (no score_data, notes or dependency arrays). Participant
+        names and scores are aggregated per match with json_agg in the
+        same statement, so no follow-up query per match is needed.
+        
+        Args:
+            db: Database session
+            tournament_id: Tournament UUID
+            round_number: Optional round filter
+            group_name: Optional group filter
+            phase: Optional phase filter
+            status: Optional status filter
+            skip: Number of records to skip
+            limit: Maximum number of records (None for all)
+            changed_since: Only matches written after this change version
+            
+        Returns:
+            List of match list items (ordered by round and match number)
+        """
+        participants_json = _participants_json(Match.id)
+        
+        query = select(
+            Match.id,
+            Match.round_number,
+            Match.match_number,
+            Match.round_name,
+            Match.group_name,
+            Match.phase,
+            Match.scheduled_start,
+            Match.status,
+            Match.is_finished,
+            Match.venue_name,
+            Match.court_field_number,
+            participants_json.label("participants")
+        ).where(Match.tournament_id == tournament_id)
+        
+        if round_number is not None:
+            query = query.where(Match.round_number == round_number)
+        
+        if group_name is not None:
+            query = query.where(Match.group_name == group_name)
+        
+        if phase is not None:
+            query = query.where(Match.phase == phase)
+        
+        if status is not None:
+            query = query.where(Match.status == status)
+        
+        if changed_since is not None:
+            query = query.where(Match.change_version > changed_since)
+        
+        query = query.order_by(Match.round_number, Match.match_number)
+        query = query.offset(skip).limit(limit)
+        
+        result = await db.execute(query)
+        return [MatchListItem.model_validate(row) for row in result]
+    
+    @staticmethod
+    async def get_upcoming_matches(
+        db: AsyncSession,
+        user_id: Optional[UUID] = None,
+        club_id: Optional[UUID] = None,
+        include_clubs: bool = True,
+        skip: int = 0,
+        limit: int = 50
+    ) -> List[UpcomingMatchItem]:
+        """
+        Get the next matches of a user or a club across all tournaments.
+        
+        One statement: participations (by participant_user_id /
+        participant_club_id) → match entries → unfinished matches, each
+        step an index lookup (migration 007), ordered by scheduled start.
+        Matches without a start time come last. Cancelled tournaments are
+        skipped.
+        
+        The participations are a UNION ALL CTE rather than an OR: with the
+        OR, Postgres walks all unfinished matches in schedule order instead
+        of starting from the few participations.
+        
+        Args:
+            db: Database session
+            user_id: User whose matches to list
+            club_id: Club whose matches to list (instead of user_id)
+            include_clubs: With user_id, also matches of clubs the user
+                is a member of
+            skip: Number of records to skip
+            limit: Maximum number of records
+            
+        Returns:
+            One item per participation in an upcoming match
+        """
+        if club_id is not None:
+            entries = select(TournamentParticipant.id).where(
+                TournamentParticipant.participant_club_id == club_id
+            )
+        else:
+            entries = select(TournamentParticipant.id).where(
+                TournamentParticipant.participant_user_id == user_id
+            )
+            if include_clubs:
+                entries = union_all(
+                    entries,
+                    select(TournamentParticipant.id)
+                    .join(ClubMember, ClubMember.club_id == TournamentParticipant.participant_club_id)
+                    .where(ClubMember.user_id == user_id)
+                )
+        entries = entries.cte("entries")
+        
+        query = (
+            select(
+                Match.id,
+                Match.tournament_id,
+                Tournament.name.label("tournament_name"),
+                MatchParticipant.participant_id.label("entry_participant_id"),
+                Match.round_number,
+                Match.match_number,
+                Match.round_name,
+                Match.group_name,
+                Match.phase,
+                Match.scheduled_start,
+                Match.scheduled_end,
+                Match.status,
+                Match.is_finished,
+                Match.venue_name,
+                Match.court_field_number,
+                _participants_json(Match.id).label("participants")
+            )
+            .select_from(entries)
+            .join(MatchParticipant, MatchParticipant.participant_id == entries.c.id)
+            .join(Match, Match.id == MatchParticipant.match_id)
+            .join(Tournament, Tournament.id == Match.tournament_id)
+            .where(
+                Match.is_finished.is_(False),
+                Match.status.in_(UPCOMING_STATUSES),
+                Tournament.status != TournamentStatus.CANCELLED.value
+            )
+            .order_by(Match.scheduled_start.asc().nullslast(), Match.id)
+            .offset(skip)
+            .limit(limit)
+        )
+        
+        result = await db.execute(query)
+        return [UpcomingMatchItem.model_validate(row) for row in result]
+    
+    @staticmethod
+    async def find_schedule_conflicts(
+        db: AsyncSession,
+        tournament_id: UUID,
+        venue_name: str,
+        court_field_number: str,
+        scheduled_start: datetime,
+        scheduled_end: datetime,
+        exclude_match_id: Optional[UUID] = None
+    ) -> List[ScheduleConflictItem]:
+        """
+        Get the matches booked on a court that overlap a time slot.
+        
+        Slots are half-open (a match may start when the previous one ends).
+        Timezone-aware slot times are compared as UTC. The conditions
+        repeat the predicate of the booking constraint's GiST index
+        (migration 008), so the overlap is an index probe rather than a
+        scan of the tournament's matches.
+        
+        Args:
+            db: Database session
+            tournament_id: Tournament UUID
+            venue_name: Venue of the slot
+            court_field_number: Court/field of the slot
+            scheduled_start: Slot start
+            scheduled_end: Slot end
+            exclude_match_id: Match being rescheduled (not a conflict with itself)
+            
+        Returns:
+            List of conflicting matches (ordered by start)
+            
+        Raises:
+            ValueError: If the slot ends before it starts
+        """
+        scheduled_start = naive_utc(scheduled_start)
+        scheduled_end = naive_utc(scheduled_end)
+        if scheduled_end < scheduled_start:
+            raise ValueError("scheduled_end must not be before scheduled_start")
+        
+        # Statuses as literals: the planner matches them against the
+        # partial index predicate, which bound parameters would not prove
+        slot_free = [literal_column(f"'{value}'") for value in SLOT_FREE_STATUSES]
+        
+        query = select(
+            Match.id,
+            Match.round_number,
+            Match.match_number,
+            Match.round_name,
+            Match.group_name,
+            Match.phase,
+            Match.scheduled_start,
+            Match.scheduled_end,
+            Match.status,
+            Match.is_finished,
+            Match.venue_name,
+            Match.court_field_number,
+            _participants_json(Match.id).label("participants")
+        ).where(
+            Match.tournament_id == tournament_id,
+            Match.venue_name == venue_name,
+            Match.court_field_number == court_field_number,
+            Match.scheduled_start.is_not(None),
+            Match.scheduled_end.is_not(None),
+            Match.status.not_in(slot_free),
+            func.tsrange(Match.scheduled_start, Match.scheduled_end).op("&&")(
+                func.tsrange(cast(scheduled_start, DateTime), cast(scheduled_end, DateTime))
+            )
+        )
+        
+        if exclude_match_id is not None:
+            query = query.where(Match.id != exclude_match_id)
+        
+        query = query.order_by(Match.scheduled_start)
+        
+        result = await db.execute(query)
+        return [ScheduleConflictItem.model_validate(row) for row in result]
+    
+    @staticmethod
+    async def check_schedule(db: AsyncSession, match: Match) -> None:
+        """
+        Check that a new or rescheduled match fits its court's bookings.
+        
+        Matches without venue, court, start or end (or that no longer
+        occupy their court) book nothing. The database constraint catches
+        bookings that race this check. Timezone-aware times are converted
+        to naive UTC on the match.
+        
+        Args:
+            db: Database session
+            match: Match with its new schedule (not flushed yet)
+            
+        Raises:
+            ValueError: If the match ends before it starts
+            ScheduleConflictError: If other matches overlap the slot
+        """
+        match.scheduled_start = naive_utc(match.scheduled_start)
+        match.scheduled_end = naive_utc(match.scheduled_end)
+        
+        if (
+            match.scheduled_start is not None
+            and match.scheduled_end is not None
+            and match.scheduled_end < match.scheduled_start
+        ):
+            raise ValueError("scheduled_end must not be before scheduled_start")
+        
+        if (
+            match.venue_name is None
+            or match.court_field_number is None
+            or match.scheduled_start is None
+            or match.scheduled_end is None
+            or match.status in SLOT_FREE_STATUSES
+        ):
+            return
+        
+        # Do not flush the new slot before probing (it would hit the
+        # constraint instead of reporting the conflicting matches)
+        with db.no_autoflush:
+            conflicts = await MatchService.find_schedule_conflicts(
+                db,
+                match.tournament_id,
+                match.venue_name,
+                match.court_field_number,
+                match.scheduled_start,
+                match.scheduled_end,
+                exclude_match_id=match.id
+            )
+        if conflicts:
+            raise ScheduleConflictError([conflict.id for conflict in conflicts])
+    
     @staticmethod
     async def update_match(
         db: AsyncSession,
@@ -205,7 +580,8 @@ class MatchService:
             Updated match
             
         Raises:
-            ValueError: If match not found
+            ValueError: If match not found or schedule invalid
+            ScheduleConflictError: If the court is booked in the new slot
         """
         match = await MatchService.get_match_by_id(db, match_id)
         if not match:
@@ -216,10 +592,13 @@ class MatchService:
         for field, value in update_data.items():
             setattr(match, field, value)
         
+        if any(field in update_data for field in SLOT_FIELDS):
+            await MatchService.check_schedule(db, match)
+        
         match.updated_at = datetime.utcnow()
         
-        await db.commit()
-        await db.refresh(match)
+        await ChangeFeedService.record_change(db, match.tournament_id, match)
+        await _flush_booking(db)
         
         return match
     
@@ -247,49 +626,10 @@ class MatchService:
         if not match:
             raise ValueError("Match not found")
         
-        # Update participant scores
-        for score_entry in score_data.participant_scores:
-            # Find match participant
-            match_participant = next(
-                (mp for mp in match.participants if str(mp.participant_id) == str(score_entry.participant_id)),
-                None
-            )
-            
-            if not match_participant:
-                raise ValueError(f"Participant {score_entry.participant_id} not in match")
-            
-            # Update scores
-            if score_entry.score_value is not None:
-                match_participant.score_value = score_entry.score_value
-            
-            if score_entry.final_position is not None:
-                match_participant.final_position = score_entry.final_position
-            
-            # Parse result_time if provided as string
-            if score_entry.result_time:
-                # Convert string time to timedelta (e.g., "1:23.456" -> timedelta)
-                match_participant.result_time = MatchService._parse_time_string(score_entry.result_time)
-            
-            match_participant.is_winner = score_entry.is_winner
-            match_participant.is_disqualified = score_entry.is_disqualified
-            
-            if score_entry.detailed_score:
-                match_participant.detailed_score = score_entry.detailed_score
-        
-        # Update overall match score data
-        if score_data.score_data:
-            match.score_data = score_data.score_data
+        apply_score(match, score_data, datetime.utcnow())
         
-        # Set winner
-        if score_data.winner_participant_id:
-            match.winner_participant_id = score_data.winner_participant_id
-            match.is_finished = True
-            match.status = MatchStatus.COMPLETED.value
-        
-        match.updated_at = datetime.utcnow()
-        
-        await db.commit()
-        await db.refresh(match)
+        await ChangeFeedService.record_change(db, match.tournament_id, match)
+        await db.flush()
         
         return match
     
@@ -312,12 +652,20 @@ class MatchService:
             
         Raises:
             ValueError: If match not found
+            ScheduleConflictError: If a postponed or cancelled match is
+                reactivated while its court is booked by another match
         """
         match = await MatchService.get_match_by_id(db, match_id)
         if not match:
             raise ValueError("Match not found")
         
+        reactivated = (
+            match.status in SLOT_FREE_STATUSES
+            and status_update.status not in SLOT_FREE_STATUSES
+        )
         match.status = status_update.status
+        if reactivated:
+            await MatchService.check_schedule(db, match)
         
         # Update timestamps based on status
         if status_update.status == MatchStatus.IN_PROGRESS.value:
@@ -332,8 +680,8 @@ class MatchService:
         
         match.updated_at = datetime.utcnow()
         
-        await db.commit()
-        await db.refresh(match)
+        await ChangeFeedService.record_change(db, match.tournament_id, match)
+        await _flush_booking(db)
         
         return match
     
@@ -357,40 +705,7 @@ class MatchService:
             return False
         
         await db.delete(match)
-        await db.commit()
+        await ChangeFeedService.record_deletion(db, match.tournament_id)
+        await db.flush()
         
         return True
-    
-    @staticmethod
-    def _parse_time_string(time_str: str) -> timedelta:
-        """
-        Parse time string to timedelta.
-        
-        Supports formats:
-        - "1:23.456" (minutes:seconds.milliseconds)
-        - "1:23:45.678" (hours:minutes:seconds.milliseconds)
-        
-        Args:
-            time_str: Time string
-            
-        Returns:
-            timedelta object
-        """
-        try:
-            parts = time_str.split(":")
-            if len(parts) == 2:
-                # Format: MM:SS.mmm
-                minutes = int(parts[0])
-                seconds = float(parts[1])
-                return timedelta(minutes=minutes, seconds=seconds)
-            elif len(parts) == 3:
-                # Format: HH:MM:SS.mmm
-                hours = int(parts[0])
-                minutes = int(parts[1])
-                seconds = float(parts[2])
-                return timedelta(hours=hours, minutes=minutes, seconds=seconds)
-            else:
-                raise ValueError("Invalid time format")
-        except Exception:
-            # If parsing fails, return 0
-            return timedelta(0)
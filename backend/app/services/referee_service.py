@@ -0,0 +1,216 @@
+"""
+Referee assignment service.
+
+Assigns referees from the organizing club's members (member and volunteer
+roles) to a tournament's scheduled matches in one run, instead of one
+update_match per match. The constraints and the optimization are in
+app.engine.referees; this service loads what they need and writes all
+assignments in one bulk UPDATE.
+"""
+
+from collections import defaultdict
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Dict, List, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy import and_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.locks import try_lock_tournament
+from app.engine.referees import RefereeCalendar, assign_referees
+from app.models.club_member import ClubMember, ClubRole
+from app.models.match import Match, MatchStatus
+from app.models.match_participant import MatchParticipant
+from app.models.tournament import Tournament
+from app.models.tournament_participant import TournamentParticipant
+from app.models.user import User
+from app.schemas.match import RefereeAssignmentResult, RefereeLoad
+from app.services.change_feed_service import ChangeFeedService
+from app.services.match_service import SLOT_FREE_STATUSES
+from app.services.schedule_service import match_end
+
+# Club roles whose members referee
+REFEREE_ROLES = (ClubRole.MEMBER.value, ClubRole.VOLUNTEER.value)
+
+
+class RefereeService:
+    """Service for assigning referees to matches."""
+
+    @staticmethod
+    async def assign_referees(
+        db: AsyncSession,
+        tournament_id: UUID,
+        reassign: bool = False
+    ) -> RefereeAssignmentResult:
+        """
+        Assign referees to the tournament's scheduled matches.
+
+        Matches that require a referee, are still scheduled and have a
+        known start and end (scheduled_end or duration_minutes) and both
+        participants are assigned; later knockout rounds are left for a
+        later run. A referee never officiates:
+        - a match they or a club they belong to play in
+        - two matches at once, or a match while they play one
+        - a match overlapping their assignments in other tournaments
+        Matches are spread evenly over the referees; existing assignments
+        are kept (and counted) unless reassign is set.
+
+        Args:
+            db: Database session
+            tournament_id: Tournament UUID
+            reassign: Also replace existing assignments of scheduled matches
+
+        Returns:
+            Assignment result with the load per referee
+
+        Raises:
+            ValueError: If tournament not found
+            TournamentBusyError: If another operation holds the tournament's lock
+        """
+        tournament = await db.get(Tournament, tournament_id)
+        if not tournament:
+            raise ValueError("Tournament not found")
+
+        await try_lock_tournament(db, tournament_id)
+
+        # Referee pool with all their clubs (to recognize their own teams)
+        pool = select(ClubMember.user_id).where(
+            and_(
+                ClubMember.club_id == tournament.club_id,
+                ClubMember.role.in_(REFEREE_ROLES)
+            )
+        )
+        result = await db.execute(
+            select(ClubMember.user_id, ClubMember.club_id, User.first_name, User.last_name)
+            .join(User, User.id == ClubMember.user_id)
+            .where(and_(ClubMember.user_id.in_(pool), User.is_active.is_(True)))
+            .order_by(User.last_name, User.first_name, ClubMember.user_id)
+        )
+        names: Dict[UUID, str] = {}
+        members_by_club: Dict[UUID, Set[UUID]] = defaultdict(set)
+        for user_id, club_id, first_name, last_name in result:
+            names[user_id] = f"{first_name} {last_name}"
+            members_by_club[club_id].add(user_id)
+
+        # Scheduled matches with their participants (one row per entry)
+        end = match_end()
+        result = await db.execute(
+            select(
+                Match.id,
+                Match.scheduled_start,
+                end.label("end"),
+                Match.status,
+                Match.is_finished,
+                Match.requires_referee,
+                Match.referee_user_id,
+                TournamentParticipant.participant_user_id,
+                TournamentParticipant.participant_club_id
+            )
+            .outerjoin(MatchParticipant, MatchParticipant.match_id == Match.id)
+            .outerjoin(TournamentParticipant, TournamentParticipant.id == MatchParticipant.participant_id)
+            .where(
+                and_(
+                    Match.tournament_id == tournament_id,
+                    Match.scheduled_start.is_not(None),
+                    end.is_not(None),
+                    Match.status.not_in(SLOT_FREE_STATUSES),
+                    Match.is_bye.isnot(True)
+                )
+            )
+        )
+        matches: Dict[UUID, SimpleNamespace] = {}
+        for row in result:
+            match = matches.get(row.id)
+            if match is None:
+                match = matches[row.id] = SimpleNamespace(
+                    id=row.id,
+                    start=row.scheduled_start,
+                    end=row.end,
+                    referee_user_id=row.referee_user_id,
+                    open=(
+                        row.requires_referee
+                        and row.status == MatchStatus.SCHEDULED.value
+                        and not row.is_finished
+                    ),
+                    entries=0,
+                    players=set(),
+                    blocked=set()
+                )
+            if row.participant_user_id is not None:
+                match.entries += 1
+                match.players.add(row.participant_user_id)
+                match.blocked.add(row.participant_user_id)
+            elif row.participant_club_id is not None:
+                match.entries += 1
+                match.blocked.update(members_by_club.get(row.participant_club_id, ()))
+
+        to_assign = [
+            match for match in matches.values()
+            if match.open and match.entries >= 2
+            and (reassign or match.referee_user_id is None)
+        ]
+        busy: Dict[UUID, List[Tuple[datetime, datetime]]] = {user_id: [] for user_id in names}
+        load: Dict[UUID, int] = dict.fromkeys(names, 0)
+        assigning = {match.id for match in to_assign}
+        for match in matches.values():
+            for user_id in match.players & names.keys():
+                busy[user_id].append((match.start, match.end))
+            if match.id not in assigning and match.referee_user_id in names:
+                busy[match.referee_user_id].append((match.start, match.end))
+                load[match.referee_user_id] += 1
+
+        # Referee duties in other tournaments during this schedule
+        if to_assign and names:
+            window_start = min(match.start for match in to_assign)
+            window_end = max(match.end for match in to_assign)
+            result = await db.execute(
+                select(Match.referee_user_id, Match.scheduled_start, end)
+                .where(
+                    and_(
+                        Match.referee_user_id.in_(list(names)),
+                        Match.tournament_id != tournament_id,
+                        Match.scheduled_start < window_end,
+                        end > window_start,
+                        Match.status.not_in(SLOT_FREE_STATUSES)
+                    )
+                )
+            )
+            for user_id, start, duty_end in result:
+                busy[user_id].append((start, duty_end))
+
+        calendars = {
+            user_id: RefereeCalendar(busy[user_id], load[user_id])
+            for user_id in names
+        }
+        assignments = assign_referees(to_assign, calendars)
+
+        rows = [
+            {"id": match.id, "referee_user_id": assignments.get(match.id)}
+            for match in to_assign
+            if assignments.get(match.id) != match.referee_user_id
+        ]
+        if rows:
+            version = await ChangeFeedService.bump_version(db, tournament_id)
+            now = datetime.utcnow()
+            for row in rows:
+                row["change_version"] = version
+                row["updated_at"] = now
+            await db.execute(update(Match), rows)
+
+        referees = sorted(
+            (
+                RefereeLoad(user_id=user_id, name=names[user_id], assigned_matches=calendar.load)
+                for user_id, calendar in calendars.items()
+            ),
+            key=lambda referee: -referee.assigned_matches
+        )
+        return RefereeAssignmentResult(
+            tournament_id=tournament_id,
+            assigned=len(rows),
+            unassigned_match_ids=[
+                match.id for match in sorted(to_assign, key=lambda match: match.start)
+                if match.id not in assignments
+            ],
+            referees=referees
+        )
@@ -0,0 +1,105 @@
+"""
+Schedule validation service.
+
+Checks a tournament's whole schedule for participants booked into two
+matches at once (on different courts) or without the minimum rest between
+matches. Court double-booking is prevented per match (see
+MatchService.check_schedule); participant clashes are only reported,
+since hand-edited schedules pass through invalid states while being fixed.
+"""
+
+from datetime import timedelta
+from typing import List, Tuple
+from uuid import UUID
+
+from sqlalchemy import Interval, and_, func, literal_column, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.engine.schedule import find_clashes
+from app.models.match import Match
+from app.models.match_participant import MatchParticipant
+from app.models.tournament_participant import TournamentParticipant
+from app.schemas.match import ScheduleClashItem
+from app.services.match_service import SLOT_FREE_STATUSES
+
+
+def match_end():
+    """
+    SQL expression for when a match ends: scheduled_end, else
+    scheduled_start + duration_minutes (NULL if neither is known).
+    """
+    minute = literal_column("interval '1 minute'", type_=Interval)
+    return func.coalesce(
+        Match.scheduled_end,
+        Match.scheduled_start + Match.duration_minutes * minute
+    )
+
+
+class ScheduleService:
+    """Service for validating tournament schedules."""
+
+    @staticmethod
+    async def find_participant_clashes(
+        db: AsyncSession,
+        tournament_id: UUID,
+        min_rest_minutes: int
+    ) -> Tuple[int, List[ScheduleClashItem]]:
+        """
+        Find every participant's overlapping matches and too short rests.
+
+        One query loads all (participant, match, start, end) entries of the
+        tournament's scheduled matches; the sweep in app.engine.schedule
+        pairs them up. A match ends at scheduled_end, else after
+        duration_minutes; matches with neither are not checked. Byes and
+        matches that no longer take place (cancelled, postponed, walkover)
+        are ignored.
+
+        Args:
+            db: Database session
+            tournament_id: Tournament UUID
+            min_rest_minutes: Minimum time between two matches of a participant
+
+        Returns:
+            Number of checked matches and the clashes (grouped by
+            participant, ordered by the second match's start)
+        """
+        end = match_end()
+
+        result = await db.execute(
+            select(
+                MatchParticipant.participant_id,
+                TournamentParticipant.participant_name,
+                Match.id.label("match_id"),
+                Match.scheduled_start.label("start"),
+                end.label("end")
+            )
+            .join(Match, Match.id == MatchParticipant.match_id)
+            .join(TournamentParticipant, TournamentParticipant.id == MatchParticipant.participant_id)
+            .where(
+                and_(
+                    Match.tournament_id == tournament_id,
+                    Match.scheduled_start.is_not(None),
+                    end.is_not(None),
+                    Match.status.not_in(SLOT_FREE_STATUSES),
+                    Match.is_bye.isnot(True)
+                )
+            )
+        )
+        bookings = result.all()
+
+        names = {booking.participant_id: booking.participant_name for booking in bookings}
+        clashes = [
+            ScheduleClashItem(
+                participant_id=clash.participant_id,
+                participant_name=names[clash.participant_id],
+                kind=clash.kind,
+                first_match_id=clash.first_match_id,
+                first_end=clash.first_end,
+                second_match_id=clash.second_match_id,
+                second_start=clash.second_start,
+                gap_minutes=clash.gap.total_seconds() / 60
+            )
+            for clash in find_clashes(bookings, timedelta(minutes=min_rest_minutes))
+        ]
+        checked_matches = len({booking.match_id for booking in bookings})
+        return checked_matches, clashes
@@ -3,26 +3,53 @@ Tournament standings calculation service.
 
 This service calculates and manages tournament standings/rankings
 based on completed matches. Implements caching for performance.
+
+With STANDINGS_RECALC_DELAY set, score updates do not recalculate in
+their own transaction: after commit, the StandingsRecalculator collects
+them per tournament and group for the delay and recalculates once.
 """
 
-from typing import List, Optional, Dict, Any
+import asyncio
+import logging
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 from uuid import UUID
-from decimal import Decimal
 
-from sqlalchemy import select, and_, func
+from sqlalchemy import Numeric, and_, case, event, func, literal, not_, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.models.tournament_standings import TournamentStandings
 from app.models.match import Match
 from app.models.match_participant import MatchParticipant
 from app.models.tournament_participant import TournamentParticipant
+from app.core.config import settings
+from app.core.metrics import observe_duration
+from app.core.profiling import profiled
+from app.db.locks import lock_tournament
+from app.db.query_budget import query_budget
+from app.db.session import AsyncSessionLocal
+from app.engine.standings import POSITION_POINTS, StandingTally, rank_key
+from app.services.change_feed_service import ChangeFeedService
+from app.services.standings_view_service import StandingsViewService
+
+logger = logging.getLogger(__name__)
+
+# Calculated columns of a standings row
+STANDING_COLUMNS = StandingTally.__slots__ + ("current_rank", "previous_rank")
+
+# Session.info key: (tournament, group) standings to recalculate after commit
+RECALC_PENDING = "standings_recalc_pending"
 
 
 class StandingsService:
     """Service for calculating and managing tournament standings."""
     
     @staticmethod
+    @observe_duration("standings_calculation")
+    @profiled("standings.calculate")
+    @query_budget(7)
     async def calculate_standings(
         db: AsyncSession,
         tournament_id: UUID,
@@ -31,8 +58,10 @@ class StandingsService:
         """
         Calculate tournament standings based on completed matches.
         
-        Recalculates from scratch based on all completed matches.
-        Updates cached standings in database.
+        Recalculates from scratch based on all completed matches
+        (aggregated in the database, see aggregate_results).
+        Updates cached standings in database. With the materialized_view
+        backend the view is refreshed instead (in this transaction).
         
         Args:
             db: Database session
@@ -42,6 +71,13 @@ class StandingsService:
         Returns:
             List of standings (sorted by rank)
         """
+        if settings.STANDINGS_BACKEND == "materialized_view":
+            await StandingsViewService.refresh(db)
+            return await StandingsViewService.get_standings(db, tournament_id, group_name)
+        
+        # Concurrent recalculations would insert the same standings rows
+        await lock_tournament(db, tournament_id)
+        
         # Get all participants
         query = select(TournamentParticipant).where(
             TournamentParticipant.tournament_id == tournament_id
@@ -53,243 +89,263 @@ class StandingsService:
         result = await db.execute(query)
         participants = list(result.scalars().all())
         
-        # Initialize or get standings for each participant
-        standings_dict = {}
-        for participant in participants:
-            standing = await StandingsService._get_or_create_standing(
-                db, tournament_id, participant.id, group_name
-            )
-            # Reset statistics (recalculate from scratch)
-            standing.matches_played = 0
-            standing.matches_won = 0
-            standing.matches_drawn = 0
-            standing.matches_lost = 0
-            standing.points = 0
-            standing.score_for = Decimal(0)
-            standing.score_against = Decimal(0)
-            standing.score_difference = Decimal(0)
-            
-            standings_dict[str(participant.id)] = standing
+        tallies = await StandingsService.aggregate_results(db, tournament_id, group_name)
+        tallies = {
+            participant.id: tallies.get(participant.id) or StandingTally()
+            for participant in participants
+        }
         
-        # Get completed matches
-        matches_query = select(Match).where(
-            and_(
-                Match.tournament_id == tournament_id,
-                Match.is_finished == True
-            )
-        ).options(
-            selectinload(Match.participants)
+        # Load the existing standings rows in one query
+        standings_query = select(TournamentStandings).where(
+            TournamentStandings.tournament_id == tournament_id
         )
         
         if group_name:
-            matches_query = matches_query.where(Match.group_name == group_name)
-        
-        result = await db.execute(matches_query)
-        matches = list(result.scalars().all())
-        
-        # Calculate stats for each match
-        for match in matches:
-            # Skip bye matches
-            if match.is_bye:
-                continue
-            
-            match_participants = match.participants
-            
-            # Determine match result type
-            if len(match_participants) == 2:
-                # Standard 2-player match
-                await StandingsService._process_two_player_match(
-                    match_participants, standings_dict
+            standings_query = standings_query.where(TournamentStandings.group_name == group_name)
+        else:
+            standings_query = standings_query.where(TournamentStandings.group_name.is_(None))
+        
+        result = await db.execute(standings_query)
+        existing = {standing.participant_id: standing for standing in result.scalars()}
+        
+        # Sort by the tallies, copy them onto the rows and assign ranks
+        participants.sort(key=lambda participant: rank_key(tallies[participant.id]))
+        
+        standings_list = []
+        added = []
+        changed = []
+        for rank, participant in enumerate(participants, start=1):
+            values = {name: getattr(tallies[participant.id], name) for name in StandingTally.__slots__}
+            values["current_rank"] = rank
+            standing = existing.get(participant.id)
+            if standing is None:
+                standing = TournamentStandings(
+                    tournament_id=tournament_id,
+                    participant_id=participant.id,
+                    group_name=group_name,
+                    **values
                 )
+                added.append(standing)
             else:
-                # Multi-player match (races, etc.)
-                await StandingsService._process_multi_player_match(
-                    match_participants, standings_dict
-                )
-        
-        # Sort standings and assign ranks
-        standings_list = list(standings_dict.values())
-        standings_list.sort(
-            key=lambda s: (
-                -s.points,  # Higher points first
-                -s.score_difference,  # Better goal difference
-                -s.score_for  # More goals scored
-            )
-        )
-        
-        # Assign ranks
-        for rank, standing in enumerate(standings_list, start=1):
-            standing.previous_rank = standing.current_rank
-            standing.current_rank = rank
-        
-        await db.commit()
+                values["previous_rank"] = standing.current_rank
+                previous_values = StandingsService._standing_values(standing)
+                # Written below in one bulk UPDATE, not by the flush (which
+                # emits one UPDATE per run of rows with the same changed columns)
+                for name, value in values.items():
+                    set_committed_value(standing, name, value)
+                # Only stamp rows whose values changed (or that were never stamped)
+                # so the change feed does not resend the whole table every time
+                if (
+                    not standing.change_version
+                    or StandingsService._standing_values(standing) != previous_values
+                ):
+                    changed.append(standing)
+            # Attach the already loaded participant (no lazy load later)
+            set_committed_value(standing, "participant", participant)
+            standings_list.append(standing)
+        
+        if added or changed:
+            version = await ChangeFeedService.bump_version(db, tournament_id)
+            now = datetime.utcnow()
+            for standing in added:
+                standing.change_version = version
+            db.add_all(added)
+            for standing in changed:
+                set_committed_value(standing, "change_version", version)
+                set_committed_value(standing, "updated_at", now)
+            if changed:
+                await db.execute(update(TournamentStandings), [
+                    {
+                        "id": standing.id,
+                        **{name: getattr(standing, name) for name in STANDING_COLUMNS},
+                        "change_version": version,
+                        "updated_at": now,
+                    }
+                    for standing in changed
+                ])
+        
+        await db.flush()
         
         return standings_list
     
     @staticmethod
-    async def _get_or_create_standing(
+    async def results_changed(
         db: AsyncSession,
         tournament_id: UUID,
-        participant_id: UUID,
-        group_name: Optional[str]
-    ) -> TournamentStandings:
+        group_names: Iterable[Optional[str]] = (),
+        immediate: bool = False
+    ) -> None:
         """
-        Get existing standing or create new one.
+        Bring standings up to date after match results changed.
+        
+        The table backend recalculates the tournament standings and those
+        of the given groups (so group tables stay current too, at one
+        extra recalculation per group): right away, or with
+        STANDINGS_RECALC_DELAY once per delay after commit (see
+        StandingsRecalculator). The database and live paths both pass
+        the groups of their changed matches. The
+        materialized_view backend refreshes the view in the background
+        after commit, so several score updates in a row cost one refresh.
         
         Args:
             db: Database session
             tournament_id: Tournament UUID
-            participant_id: Participant UUID
-            group_name: Group name or None
-            
-        Returns:
-            TournamentStandings object
+            group_names: Groups of the changed matches
+            immediate: Recalculate in this transaction regardless of
+                STANDINGS_RECALC_DELAY
         """
-        query = select(TournamentStandings).where(
-            and_(
-                TournamentStandings.tournament_id == tournament_id,
-                TournamentStandings.participant_id == participant_id
-            )
-        )
-        
-        if group_name:
-            query = query.where(TournamentStandings.group_name == group_name)
-        else:
-            query = query.where(TournamentStandings.group_name.is_(None))
+        if settings.STANDINGS_BACKEND == "materialized_view":
+            StandingsViewService.schedule_refresh(db, tournament_id)
+            return
         
-        result = await db.execute(query)
-        standing = result.scalar_one_or_none()
-        
-        if not standing:
-            standing = TournamentStandings(
-                tournament_id=tournament_id,
-                participant_id=participant_id,
-                group_name=group_name,
-                matches_played=0,
-                matches_won=0,
-                matches_drawn=0,
-                matches_lost=0,
-                points=0,
-                score_for=Decimal(0),
-                score_against=Decimal(0),
-                score_difference=Decimal(0)
+        scopes = [None] + sorted({group for group in group_names if group})
+        if settings.STANDINGS_RECALC_DELAY > 0 and not immediate:
+            db.info.setdefault(RECALC_PENDING, set()).update(
+                (tournament_id, group) for group in scopes
             )
-            db.add(standing)
-            await db.flush()
-        
-        return standing
+            return
+        for group in scopes:
+            await StandingsService.calculate_standings(db, tournament_id, group)
     
     @staticmethod
-    async def _process_two_player_match(
-        match_participants: List[MatchParticipant],
-        standings_dict: Dict[str, TournamentStandings]
-    ):
+    async def aggregate_results(
+        db: AsyncSession,
+        tournament_id: UUID,
+        group_name: Optional[str] = None
+    ) -> Dict[UUID, StandingTally]:
         """
-        Process a standard 2-player match.
+        Aggregate all finished matches per participant in one query.
+        
+        Same rules as app.engine.standings (the row-by-row reference
+        implementation), computed with window and GROUP BY aggregates so
+        only one row per participant and match type leaves the database:
+        
+        - 2-player matches: an explicit winner (the lower slot if both are
+          marked) beats the score comparison, equal scores are a draw
+        - other matches (races etc.): position points, 1st place / marked
+          winner counts as a win, scores count as score for
+        
+        Matches involving participants outside the tournament (or group)
+        are ignored, byes never count.
         
         Args:
-            match_participants: List of match participants (should be 2)
-            standings_dict: Dictionary of standings by participant ID
+            db: Database session
+            tournament_id: Tournament UUID
+            group_name: Optional group filter
+            
+        Returns:
+            Tallies by participant ID (participants without matches missing)
         """
-        if len(match_participants) != 2:
-            return
+        participant_ids = select(TournamentParticipant.id).where(
+            TournamentParticipant.tournament_id == tournament_id
+        )
+        if group_name:
+            participant_ids = participant_ids.where(
+                TournamentParticipant.group_assignment == group_name
+            )
         
-        mp1, mp2 = match_participants
+        # One row per match participant with the match-level values it is
+        # compared against (window aggregates, no self-join)
+        score = func.coalesce(MatchParticipant.score_value, literal(0, Numeric))
+        marked = func.coalesce(MatchParticipant.is_winner, False)
+        known = MatchParticipant.participant_id.in_(participant_ids)
+        per_match = {"partition_by": MatchParticipant.match_id}
+        
+        entries = select(
+            MatchParticipant.participant_id,
+            MatchParticipant.slot_number,
+            MatchParticipant.final_position,
+            score.label("score"),
+            marked.label("marked"),
+            known.label("known"),
+            func.count().over(**per_match).label("size"),
+            func.sum(score).over(**per_match).label("match_score"),
+            func.sum(case((marked, 1), else_=0)).over(**per_match).label("marked_count"),
+            func.min(case((marked, MatchParticipant.slot_number))).over(**per_match).label("first_marked_slot"),
+            func.sum(case((known, 1), else_=0)).over(**per_match).label("known_count"),
+        ).join(
+            Match, Match.id == MatchParticipant.match_id
+        ).where(
+            and_(
+                Match.tournament_id == tournament_id,
+                Match.is_finished == True,
+                Match.is_bye.isnot(True)
+            )
+        )
         
-        standing1 = standings_dict.get(str(mp1.participant_id))
-        standing2 = standings_dict.get(str(mp2.participant_id))
+        if group_name:
+            entries = entries.where(Match.group_name == group_name)
+        
+        e = entries.subquery()
+        two_player = e.c.size == 2
+        opponent_score = e.c.match_score - e.c.score
+        unmarked_two_player = and_(two_player, e.c.marked_count == 0)
+        
+        query = select(
+            e.c.participant_id,
+            two_player.label("two_player"),
+            func.count().label("played"),
+            func.sum(case(
+                (and_(unmarked_two_player, e.c.score > opponent_score), 1),
+                (and_(two_player, e.c.marked, e.c.slot_number == e.c.first_marked_slot), 1),
+                (and_(not_(two_player), or_(e.c.final_position == 1, e.c.marked)), 1),
+                else_=0
+            )).label("won"),
+            func.sum(case(
+                (and_(unmarked_two_player, e.c.score == opponent_score), 1),
+                else_=0
+            )).label("drawn"),
+            func.sum(case(POSITION_POINTS, value=e.c.final_position, else_=0)).label("position_points"),
+            func.sum(e.c.score).label("score_for"),
+            func.sum(opponent_score).label("score_against"),
+        ).where(
+            # A 2-player match only counts if both participants are known
+            and_(e.c.known, or_(not_(two_player), e.c.known_count == 2))
+        ).group_by(e.c.participant_id, two_player)
         
-        if not standing1 or not standing2:
-            return
+        result = await db.execute(query)
         
-        # Update matches played
-        standing1.matches_played += 1
-        standing2.matches_played += 1
-        
-        # Update scores
-        score1 = mp1.score_value or Decimal(0)
-        score2 = mp2.score_value or Decimal(0)
-        
-        standing1.score_for += score1
-        standing1.score_against += score2
-        standing2.score_for += score2
-        standing2.score_against += score1
-        
-        # Determine result
-        if mp1.is_winner:
-            # Player 1 wins
-            standing1.matches_won += 1
-            standing1.points += 3
-            standing2.matches_lost += 1
-        elif mp2.is_winner:
-            # Player 2 wins
-            standing2.matches_won += 1
-            standing2.points += 3
-            standing1.matches_lost += 1
-        else:
-            # Check for draw
-            if score1 == score2:
-                standing1.matches_drawn += 1
-                standing1.points += 1
-                standing2.matches_drawn += 1
-                standing2.points += 1
+        tallies: Dict[UUID, StandingTally] = {}
+        for row in result:
+            tally = tallies.get(row.participant_id)
+            if tally is None:
+                tally = tallies[row.participant_id] = StandingTally()
+            tally.matches_played += row.played
+            tally.matches_won += row.won
+            tally.score_for += row.score_for
+            if row.two_player:
+                tally.matches_drawn += row.drawn
+                tally.matches_lost += row.played - row.won - row.drawn
+                tally.points += 3 * row.won + row.drawn
+                tally.score_against += row.score_against
             else:
-                # One has higher score but no explicit winner marked
-                # Assume higher score wins
-                if score1 > score2:
-                    standing1.matches_won += 1
-                    standing1.points += 3
-                    standing2.matches_lost += 1
-                else:
-                    standing2.matches_won += 1
-                    standing2.points += 3
-                    standing1.matches_lost += 1
-        
-        # Update score difference
-        standing1.score_difference = standing1.score_for - standing1.score_against
-        standing2.score_difference = standing2.score_for - standing2.score_against
+                tally.points += row.position_points
+            tally.score_difference = tally.score_for - tally.score_against
+        return tallies
     
     @staticmethod
-    async def _process_multi_player_match(
-        match_participants: List[MatchParticipant],
-        standings_dict: Dict[str, TournamentStandings]
-    ):
+    def _standing_values(standing: TournamentStandings) -> tuple:
         """
-        Process a multi-player match (races, etc.).
-        
-        For races and multi-player games, we use final_position.
-        Points awarded based on position (e.g., F1-style: 25, 18, 15, 12, 10, 8, 6, 4, 2, 1)
+        Snapshot the calculated values of a standing for change detection.
         
         Args:
-            match_participants: List of match participants
-            standings_dict: Dictionary of standings by participant ID
-        """
-        # Simple point system for now (can be customized)
-        # Winner gets 25 points, 2nd gets 18, 3rd gets 15, etc.
-        points_by_position = {
-            1: 25, 2: 18, 3: 15, 4: 12, 5: 10,
-            6: 8, 7: 6, 8: 4, 9: 2, 10: 1
-        }
-        
-        for mp in match_participants:
-            standing = standings_dict.get(str(mp.participant_id))
-            if not standing:
-                continue
-            
-            standing.matches_played += 1
+            standing: TournamentStandings object
             
-            # Award points based on position
-            if mp.final_position and mp.final_position in points_by_position:
-                position_points = points_by_position[mp.final_position]
-                standing.points += position_points
-            
-            # Count wins (1st place)
-            if mp.final_position == 1 or mp.is_winner:
-                standing.matches_won += 1
-            
-            # Update score_for if available
-            if mp.score_value:
-                standing.score_for += mp.score_value
+        Returns:
+            Tuple of statistics and ranks
+        """
+        return (
+            standing.matches_played,
+            standing.matches_won,
+            standing.matches_drawn,
+            standing.matches_lost,
+            standing.points,
+            standing.score_for,
+            standing.score_against,
+            standing.score_difference,
+            standing.current_rank,
+            standing.previous_rank,
+        )
     
     @staticmethod
     async def get_standings(
@@ -300,7 +356,8 @@ class StandingsService:
         """
         Get current standings (from cache).
         
-        Returns cached standings without recalculation.
+        Returns cached standings without recalculation (the
+        materialized view with the materialized_view backend).
         Use calculate_standings() to update.
         
         Args:
@@ -311,6 +368,9 @@ class StandingsService:
         Returns:
             List of standings (sorted by rank)
         """
+        if settings.STANDINGS_BACKEND == "materialized_view":
+            return await StandingsViewService.get_standings(db, tournament_id, group_name)
+        
         query = select(TournamentStandings).where(
             TournamentStandings.tournament_id == tournament_id
         ).options(
@@ -326,3 +386,100 @@ class StandingsService:
         
         result = await db.execute(query)
         return list(result.scalars().all())
+
+
+class StandingsRecalculator:
+    """
+    Coalescing standings recalculation per (tournament, group).
+
+    request() starts a debounce window of STANDINGS_RECALC_DELAY: further
+    requests for the same standings within it are folded into one run.
+    recalculate() runs right away, but callers arriving while a run is in
+    flight wait for that run instead of starting another (singleflight).
+    Each run uses its own session and commits.
+    """
+
+    def __init__(self):
+        self._scheduled: Dict[Tuple[UUID, Optional[str]], asyncio.Task] = {}
+        self._inflight: Dict[Tuple[UUID, Optional[str]], asyncio.Task] = {}
+
+    def request(self, tournament_id: UUID, group_name: Optional[str] = None) -> None:
+        key = (tournament_id, group_name)
+        if key in self._scheduled:
+            return  # Covered by the run at the end of the window
+        try:
+            self._scheduled[key] = asyncio.get_running_loop().create_task(self._debounced(key))
+        except RuntimeError:
+            logger.warning("No event loop, standings recalculation of %s skipped", tournament_id)
+
+    async def recalculate(
+        self,
+        tournament_id: UUID,
+        group_name: Optional[str] = None
+    ) -> List[TournamentStandings]:
+        """
+        Recalculate standings, or join the recalculation in flight.
+
+        Args:
+            tournament_id: Tournament UUID
+            group_name: Optional group filter
+
+        Returns:
+            List of standings (sorted by rank)
+        """
+        key = (tournament_id, group_name)
+        flight = self._inflight.get(key)
+        if flight is None:
+            flight = self._inflight[key] = asyncio.get_running_loop().create_task(
+                self._calculate(key)
+            )
+            flight.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # A caller going away must not cancel the run for the others
+        return await asyncio.shield(flight)
+
+    async def stop(self) -> None:
+        """Run the recalculations still waiting in their window"""
+        scheduled, self._scheduled = self._scheduled, {}
+        for task in scheduled.values():
+            task.cancel()
+        await asyncio.gather(*scheduled.values(), return_exceptions=True)
+        for key in scheduled:
+            try:
+                await self.recalculate(*key)
+            except Exception:
+                logger.exception("Standings recalculation of %s failed", key[0])
+
+    async def _debounced(self, key: Tuple[UUID, Optional[str]]) -> None:
+        await asyncio.sleep(settings.STANDINGS_RECALC_DELAY)
+        del self._scheduled[key]  # Later requests open a new window
+        # A run already in flight may have started before the results
+        # were committed: let it finish, then run (or join) a newer one
+        flight = self._inflight.get(key)
+        if flight is not None:
+            await asyncio.wait([flight])
+        try:
+            await self.recalculate(*key)
+        except Exception:
+            logger.exception("Standings recalculation of %s failed", key[0])
+
+    @staticmethod
+    async def _calculate(key: Tuple[UUID, Optional[str]]) -> List[TournamentStandings]:
+        async with AsyncSessionLocal() as db:
+            standings = await StandingsService.calculate_standings(db, *key)
+            await db.commit()
+        return standings
+
+
+standings_recalculator = StandingsRecalculator()
+
+
+@event.listens_for(Session, "after_commit")
+def _recalculate_after_commit(session: Session) -> None:
+    pending: Set[Tuple[UUID, Optional[str]]] = session.info.pop(RECALC_PENDING, set())
+    for tournament_id, group_name in pending:
+        standings_recalculator.request(tournament_id, group_name)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_recalculation(session: Session) -> None:
+    session.info.pop(RECALC_PENDING, None)
@@ -0,0 +1,258 @@
+"""
+Database-side standings (STANDINGS_BACKEND=materialized_view).
+
+Standings of every tournament and group are computed by the materialized
+view tournament_standings_mv (migration 006) with the same rules as
+StandingsService.aggregate_results. Score updates only mark the view
+dirty; after the transaction commits, a debounced background task
+refreshes it with REFRESH MATERIALIZED VIEW CONCURRENTLY, so readers are
+never blocked and a burst of score updates costs one refresh.
+
+Every refresh bumps the generation in standings_view_state, which is part
+of the standings ETag. The background refresh also bumps the change
+version of the tournaments whose results it picked up, so change feed
+clients fetch their standings again once the view shows the new results.
+"""
+
+import asyncio
+import logging
+from typing import List, Optional, Set
+from uuid import UUID
+
+from sqlalchemy import Column, Integer, MetaData, Numeric, String, Table, event, select, text
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal
+from app.models.tournament_participant import TournamentParticipant
+
+logger = logging.getLogger(__name__)
+
+# Not part of Base.metadata: created by migration 006, never by create_all
+standings_view = Table(
+    "tournament_standings_mv",
+    MetaData(),
+    Column("tournament_id", PG_UUID(as_uuid=True)),
+    Column("group_key", String),
+    Column("participant_id", PG_UUID(as_uuid=True)),
+    Column("matches_played", Integer),
+    Column("matches_won", Integer),
+    Column("matches_drawn", Integer),
+    Column("matches_lost", Integer),
+    Column("points", Integer),
+    Column("score_for", Numeric(10, 2)),
+    Column("score_against", Numeric(10, 2)),
+    Column("score_difference", Numeric(10, 2)),
+    Column("current_rank", Integer),
+)
+
+# Session.info key: tournaments whose results the transaction changed
+# (refresh after commit)
+REFRESH_PENDING = "standings_view_refresh"
+
+
+class ViewStanding:
+    """Standings row read from the view (same attributes as TournamentStandings)."""
+
+    __slots__ = (
+        "id", "tournament_id", "participant_id", "group_name", "participant",
+        "matches_played", "matches_won", "matches_drawn", "matches_lost",
+        "points", "score_for", "score_against", "score_difference",
+        "current_rank", "previous_rank", "recent_form", "additional_stats",
+        "created_at", "updated_at",
+    )
+
+    def __init__(self, row, participant: TournamentParticipant, group_name: Optional[str]):
+        for column in standings_view.c.keys():
+            if column != "group_key":
+                setattr(self, column, getattr(row, column))
+        # No row of its own: the participant identifies the standing
+        self.id = participant.id
+        self.group_name = group_name
+        self.participant = participant
+        self.previous_rank = None
+        self.recent_form = None
+        self.additional_stats = None
+        self.created_at = participant.created_at
+        self.updated_at = participant.updated_at
+
+
+class StandingsViewService:
+    """Service for the materialized standings view."""
+
+    @staticmethod
+    async def refresh(db: AsyncSession) -> int:
+        """
+        Refresh the view without blocking readers.
+
+        Runs in the session's transaction, so it also sees results the
+        transaction wrote but has not committed yet.
+
+        Args:
+            db: Database session
+
+        Returns:
+            New view generation
+        """
+        await db.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY tournament_standings_mv"))
+        result = await db.execute(text(
+            "UPDATE standings_view_state "
+            "SET generation = generation + 1, refreshed_at = now() "
+            "RETURNING generation"
+        ))
+        return result.scalar_one()
+
+    @staticmethod
+    async def generation(db: AsyncSession) -> int:
+        """
+        Get the view generation (bumped by every refresh).
+
+        Args:
+            db: Database session
+
+        Returns:
+            Generation counter
+        """
+        result = await db.execute(text("SELECT generation FROM standings_view_state"))
+        return result.scalar() or 0
+
+    @staticmethod
+    def schedule_refresh(db: AsyncSession, tournament_id: UUID) -> None:
+        """
+        Refresh the view once the session's transaction has committed.
+
+        Args:
+            db: Database session
+            tournament_id: Tournament whose results changed
+        """
+        db.info.setdefault(REFRESH_PENDING, set()).add(tournament_id)
+
+    @staticmethod
+    async def get_standings(
+        db: AsyncSession,
+        tournament_id: UUID,
+        group_name: Optional[str] = None
+    ) -> List[ViewStanding]:
+        """
+        Get standings from the view.
+
+        Args:
+            db: Database session
+            tournament_id: Tournament UUID
+            group_name: Optional group filter
+
+        Returns:
+            List of standings (sorted by rank)
+        """
+        query = select(standings_view, TournamentParticipant).join(
+            TournamentParticipant,
+            TournamentParticipant.id == standings_view.c.participant_id
+        ).where(
+            standings_view.c.tournament_id == tournament_id,
+            standings_view.c.group_key == (group_name or "")
+        ).order_by(standings_view.c.current_rank)
+
+        result = await db.execute(query)
+        return [
+            ViewStanding(row, row.TournamentParticipant, group_name)
+            for row in result
+        ]
+
+    @staticmethod
+    async def get_tournament_standings(
+        db: AsyncSession,
+        tournament_id: UUID
+    ) -> List[ViewStanding]:
+        """
+        Get the standings of the tournament and all its groups from the view.
+
+        Args:
+            db: Database session
+            tournament_id: Tournament UUID
+
+        Returns:
+            List of standings (tournament-wide first, then by group and rank)
+        """
+        query = select(standings_view, TournamentParticipant).join(
+            TournamentParticipant,
+            TournamentParticipant.id == standings_view.c.participant_id
+        ).where(
+            standings_view.c.tournament_id == tournament_id
+        ).order_by(standings_view.c.group_key, standings_view.c.current_rank)
+
+        result = await db.execute(query)
+        return [
+            ViewStanding(row, row.TournamentParticipant, row.group_key or None)
+            for row in result
+        ]
+
+
+class StandingsViewRefresher:
+    """
+    Debounced background refresh of the standings view.
+
+    Requests arriving while a refresh is waiting or running are folded
+    into the next one, so at most one refresh per
+    STANDINGS_VIEW_REFRESH_DELAY runs per worker. After each refresh the
+    requesting tournaments' change versions are bumped.
+    """
+
+    def __init__(self):
+        self._tournaments: Set[UUID] = set()
+        self._task: Optional[asyncio.Task] = None
+
+    def request(self, tournament_ids: Set[UUID]) -> None:
+        self._tournaments.update(tournament_ids)
+        if self._task is None or self._task.done():
+            try:
+                self._task = asyncio.get_running_loop().create_task(self._run())
+            except RuntimeError:
+                logger.warning("No event loop, standings view refresh skipped")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        # Imported here to avoid a circular import with change_feed_service
+        from app.services.change_feed_service import ChangeFeedService
+
+        while self._tournaments:
+            await asyncio.sleep(settings.STANDINGS_VIEW_REFRESH_DELAY)
+            tournament_ids, self._tournaments = self._tournaments, set()
+            try:
+                async with AsyncSessionLocal() as db:
+                    await StandingsViewService.refresh(db)
+                    await db.commit()
+                # Separately, so a deleted tournament does not undo the refresh
+                for tournament_id in sorted(tournament_ids):
+                    async with AsyncSessionLocal() as db:
+                        try:
+                            await ChangeFeedService.bump_version(db, tournament_id)
+                        except ValueError:
+                            continue  # Deleted meanwhile
+                        await db.commit()
+            except Exception:
+                logger.exception("Standings view refresh failed")
+
+
+standings_view_refresher = StandingsViewRefresher()
+
+
+@event.listens_for(Session, "after_commit")
+def _refresh_after_commit(session: Session) -> None:
+    tournament_ids = session.info.pop(REFRESH_PENDING, None)
+    if tournament_ids:
+        standings_view_refresher.request(tournament_ids)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_refresh(session: Session) -> None:
+    session.info.pop(REFRESH_PENDING, None)
@@ -13,12 +13,14 @@ from sqlalchemy import select, and_, or_, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.db.locks import lock_tournament
 from app.models.tournament import Tournament, TournamentStatus
 from app.models.tournament_participant import (
     TournamentParticipant, ParticipantStatus, PaymentStatus
 )
 from app.models.club import Club
 from app.models.user import User
+from app.services.change_feed_service import ChangeFeedService
 from app.schemas.tournament import (
     TournamentParticipantCreate, TournamentParticipantUpdate,
     ParticipantStatusUpdate, ParticipantPaymentUpdate
@@ -50,6 +52,9 @@ class TournamentParticipantService:
         Raises:
             ValueError: If registration is not possible
         """
+        # Capacity and duplicate checks only hold while nobody else registers
+        await lock_tournament(db, tournament_id)
+
         # Get tournament
         tournament = await db.get(Tournament, tournament_id)
         if not tournament:
@@ -111,8 +116,8 @@ class TournamentParticipantService:
         if initial_status == ParticipantStatus.CONFIRMED.value:
             tournament.current_participants += 1
 
-        await db.commit()
-        await db.refresh(participant)
+        await ChangeFeedService.record_change(db, tournament_id, participant)
+        await db.flush()
 
         return participant
 
@@ -286,8 +291,8 @@ class TournamentParticipantService:
                 db, participant.tournament_id, old_status, new_status
             )
 
-        await db.commit()
-        await db.refresh(participant)
+        await ChangeFeedService.record_change(db, participant.tournament_id, participant)
+        await db.flush()
 
         return participant
 
@@ -314,6 +319,10 @@ class TournamentParticipantService:
         if not participant:
             return None
 
+        # The participant count depends on the status read below
+        await lock_tournament(db, participant.tournament_id)
+        await db.refresh(participant, ["status"])
+
         old_status = participant.status
         new_status = status_update.status
 
@@ -326,8 +335,8 @@ class TournamentParticipantService:
             db, participant.tournament_id, old_status, new_status
         )
 
-        await db.commit()
-        await db.refresh(participant)
+        await ChangeFeedService.record_change(db, participant.tournament_id, participant)
+        await db.flush()
 
         return participant
 
@@ -366,8 +375,8 @@ class TournamentParticipantService:
         if payment_update.payment_status == PaymentStatus.PAID.value:
             participant.payment_date = datetime.utcnow()
 
-        await db.commit()
-        await db.refresh(participant)
+        await ChangeFeedService.record_change(db, participant.tournament_id, participant)
+        await db.flush()
 
         return participant
 
@@ -404,7 +413,8 @@ class TournamentParticipantService:
             if tournament:
                 tournament.current_participants = max(0, tournament.current_participants - 1)
 
-        await db.commit()
+        await ChangeFeedService.record_deletion(db, tournament_id)
+        await db.flush()
 
         return True
 
@@ -6,7 +6,7 @@ lifecycle management, and permission checks.
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 from slugify import slugify
 
@@ -18,6 +18,8 @@ from app.models.tournament import Tournament, TournamentStatus, SportType, Tourn
 from app.models.tournament_participant import TournamentParticipant
 from app.models.club import Club
 from app.models.club_member import ClubMember
+from app.services.change_feed_service import ChangeFeedService
+from app.services.live_tournament_service import LiveTournamentService
 from app.schemas.tournament import (
     TournamentCreate, TournamentUpdate, TournamentStatusUpdate, TournamentFilters
 )
@@ -77,8 +79,7 @@ class TournamentService:
         )
         
         db.add(tournament)
-        await db.commit()
-        await db.refresh(tournament)
+        await db.flush()
         
         return tournament
     
@@ -140,6 +141,44 @@ class TournamentService:
         result = await db.execute(query)
         return result.scalar_one_or_none()
     
+    @staticmethod
+    async def get_tournament_version(
+        db: AsyncSession,
+        tournament_id: Optional[UUID] = None,
+        slug: Optional[str] = None
+    ) -> Optional[Tuple]:
+        """
+        Get a cheap version fingerprint of a tournament and its data.
+        
+        Every write to the tournament, its participants, matches and
+        standings bumps the tournament's change_version, so the counter
+        plus the club's updated_at (club data is embedded in responses)
+        identifies the current state without touching the child tables.
+        Used to answer conditional GETs without loading the resource.
+        
+        Args:
+            db: Database session
+            tournament_id: Tournament UUID
+            slug: Tournament slug (alternative to tournament_id)
+            
+        Returns:
+            Version tuple or None if tournament not found
+        """
+        query = select(
+            Tournament.change_version,
+            Tournament.updated_at,
+            Club.updated_at
+        ).join(Club, Club.id == Tournament.club_id)
+        
+        if tournament_id is not None:
+            query = query.where(Tournament.id == tournament_id)
+        else:
+            query = query.where(Tournament.slug == slug)
+        
+        result = await db.execute(query)
+        row = result.first()
+        return tuple(row) if row else None
+    
     @staticmethod
     async def get_tournaments(
         db: AsyncSession,
@@ -280,8 +319,8 @@ class TournamentService:
         for field, value in update_data.items():
             setattr(tournament, field, value)
         
-        await db.commit()
-        await db.refresh(tournament)
+        await ChangeFeedService.record_change(db, tournament.id)
+        await db.flush()
         
         return tournament
     
@@ -342,8 +381,9 @@ class TournamentService:
         
         tournament.status = new_status
         
-        await db.commit()
-        await db.refresh(tournament)
+        await ChangeFeedService.record_change(db, tournament.id)
+        LiveTournamentService.status_changed(db, tournament.id, new_status)
+        await db.flush()
         
         return tournament
     
@@ -378,7 +418,8 @@ class TournamentService:
         
         tournament.is_active = False
         
-        await db.commit()
+        await ChangeFeedService.record_deletion(db, tournament.id)
+        await db.flush()
         
         return True
     
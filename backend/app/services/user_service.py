@@ -50,7 +50,6 @@ class UserService:
         
         db.add(user)
         await db.flush()
-        await db.refresh(user)
         
         return user
     
@@ -69,7 +68,6 @@ class UserService:
             setattr(user, field, value)
         
         await db.flush()
-        await db.refresh(user)
         
         return user
     
@@ -99,7 +97,6 @@ class UserService:
         
         user.email_verified = True
         await db.flush()
-        await db.refresh(user)
         
         return user
     
@@ -114,7 +111,6 @@ class UserService:
         
         user.password_hash = get_password_hash(new_password)
         await db.flush()
-        await db.refresh(user)
         
         return user
     
@@ -0,0 +1,113 @@
+"""
+Tests for the change feed (app.services.change_feed_service) under both
+standings backends, with a fake session (no database needed)
+"""
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.config import settings
+from app.models.tournament_participant import TournamentParticipant
+from app.models.tournament_standings import TournamentStandings
+from app.services.change_feed_service import ChangeFeedService
+from app.services.match_service import MatchService
+from app.services.standings_view_service import StandingsViewService
+
+VERSION = 7
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return list(self._rows)
+
+
+class FakeSession:
+    """Answers the feed's queries by the selected entity"""
+
+    def __init__(self, tournament, rows):
+        self.tournament = tournament
+        self.rows = rows
+        self.queried = []
+
+    async def get(self, model, key):
+        return self.tournament if key == self.tournament.id else None
+
+    async def execute(self, statement):
+        entity = statement.column_descriptions[0]["entity"]
+        self.queried.append(entity)
+        return FakeResult(self.rows.get(entity, []))
+
+
+@pytest.fixture
+def tournament():
+    return SimpleNamespace(id=uuid.uuid4(), change_version=VERSION, resync_version=0)
+
+
+@pytest.fixture(autouse=True)
+def no_matches(monkeypatch):
+    async def get_tournament_match_list(db, tournament_id, changed_since, limit):
+        return []
+
+    monkeypatch.setattr(MatchService, "get_tournament_match_list", staticmethod(get_tournament_match_list))
+
+
+@pytest.fixture
+def view_standings(monkeypatch):
+    standings = [SimpleNamespace(group_name=None), SimpleNamespace(group_name="A")]
+
+    async def get_tournament_standings(db, tournament_id):
+        return standings
+
+    monkeypatch.setattr(settings, "STANDINGS_BACKEND", "materialized_view")
+    monkeypatch.setattr(
+        StandingsViewService, "get_tournament_standings", staticmethod(get_tournament_standings)
+    )
+    return standings
+
+
+async def test_table_backend_reads_changed_table_rows(monkeypatch, tournament):
+    monkeypatch.setattr(settings, "STANDINGS_BACKEND", "table")
+    table_rows = [SimpleNamespace(group_name=None)]
+    db = FakeSession(tournament, {TournamentStandings: table_rows})
+
+    changes = await ChangeFeedService.get_changes(db, tournament.id, VERSION - 1)
+
+    assert not changes["full_resync"]
+    assert changes["standings"] == table_rows
+    assert TournamentStandings in db.queried
+
+
+@pytest.mark.parametrize("since", [0, VERSION - 1])
+async def test_view_backend_returns_all_view_standings(view_standings, tournament, since):
+    db = FakeSession(tournament, {})
+
+    changes = await ChangeFeedService.get_changes(db, tournament.id, since)
+
+    assert changes["full_resync"] == (since == 0)
+    assert changes["standings"] == view_standings
+    assert TournamentStandings not in db.queried
+
+
+@pytest.mark.parametrize("backend", ["table", "materialized_view"])
+async def test_nothing_changed(monkeypatch, view_standings, tournament, backend):
+    monkeypatch.setattr(settings, "STANDINGS_BACKEND", backend)
+    db = FakeSession(tournament, {TournamentParticipant: [SimpleNamespace()]})
+
+    changes = await ChangeFeedService.get_changes(db, tournament.id, VERSION)
+
+    assert changes["version"] == VERSION
+    assert (changes["matches"], changes["participants"], changes["standings"]) == ([], [], [])
+    assert db.queried == []
+
+
+async def test_unknown_tournament(tournament):
+    db = FakeSession(tournament, {})
+
+    assert await ChangeFeedService.get_changes(db, uuid.uuid4(), 0) is None
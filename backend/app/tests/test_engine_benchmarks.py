@@ -0,0 +1,29 @@
+"""
+Micro-benchmarks of the engine algorithms (pytest-benchmark)
+
+Run with the tests; `--benchmark-skip` leaves them out,
+`--benchmark-only` runs nothing else and `--benchmark-compare` flags
+regressions against a saved run (`--benchmark-autosave`). The same cases
+with other sizes: `python -m benchmarks.engine`.
+"""
+import pytest
+
+from app.engine import round_robin_pairings
+from benchmarks.engine import aggregate, check_pairings, make_results
+
+
+@pytest.mark.benchmark(group="pairings")
+def test_round_robin_pairings_1000(benchmark):
+    rounds = benchmark(round_robin_pairings, 1000)
+
+    check_pairings(1000, rounds)
+
+
+@pytest.mark.benchmark(group="standings")
+def test_standings_100k_results(benchmark):
+    matches = make_results(num_participants=500, num_results=100_000)
+    participant_ids = list({e.participant_id for entries in matches for e in entries})
+
+    table = benchmark.pedantic(aggregate, args=(participant_ids, matches), rounds=3)
+
+    assert sum(t.matches_played for t in table) == sum(len(entries) for entries in matches)
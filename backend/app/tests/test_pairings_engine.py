@@ -0,0 +1,51 @@
+"""
+Tests for round-robin pairings and knockout round names (app.engine.pairings)
+"""
+from itertools import combinations
+
+import pytest
+
+from app.engine import knockout_round_names, round_robin_pairings
+
+
+@pytest.mark.parametrize("n", [2, 3, 4, 5, 6, 7, 8, 9, 16, 17, 64, 65])
+def test_everyone_meets_everyone_once(n):
+    rounds = round_robin_pairings(n)
+
+    pairings = [frozenset(pairing) for round_pairings in rounds for pairing in round_pairings]
+    assert len(pairings) == n * (n - 1) // 2
+    assert set(pairings) == {frozenset(pair) for pair in combinations(range(n), 2)}
+
+
+@pytest.mark.parametrize("n", [2, 3, 4, 5, 6, 7, 8, 9, 16, 17, 64, 65])
+def test_nobody_plays_twice_per_round(n):
+    rounds = round_robin_pairings(n)
+
+    # Odd n: one more round, everyone sits out exactly once
+    assert len(rounds) == (n if n % 2 else n - 1)
+    for round_pairings in rounds:
+        seen = [participant for pairing in round_pairings for participant in pairing]
+        assert len(seen) == len(set(seen))
+        assert len(seen) == n - n % 2
+
+
+def test_six_players_play_fifteen_matches():
+    # Regression: the last participant was dropped for even n (10 matches)
+    rounds = round_robin_pairings(6)
+
+    assert sum(len(round_pairings) for round_pairings in rounds) == 15
+    assert any(5 in pairing for round_pairings in rounds for pairing in round_pairings)
+
+
+def test_single_participant_has_no_matches():
+    assert all(round_pairings == [] for round_pairings in round_robin_pairings(1))
+
+
+@pytest.mark.parametrize("num_rounds,names", [
+    (1, ["Final"]),
+    (2, ["Semifinal", "Final"]),
+    (4, ["Round of 16", "Quarterfinal", "Semifinal", "Final"]),
+    (6, ["Round 1", "Round 2", "Round 3", "Quarterfinal", "Semifinal", "Final"]),
+])
+def test_knockout_round_names(num_rounds, names):
+    assert knockout_round_names(num_rounds) == names
@@ -0,0 +1,155 @@
+"""
+Tests for referee assignment (app.engine.referees)
+"""
+import random
+import uuid
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import Dict, List
+
+import pytest
+
+from app.engine import RefereeCalendar, assign_referees
+
+DAY = datetime(2025, 6, 7, 8, 0)
+
+
+def at(minute: int) -> datetime:
+    return DAY + timedelta(minutes=minute)
+
+
+def match(start_minute: int, minutes: int, blocked=()) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        start=at(start_minute),
+        end=at(start_minute + minutes),
+        blocked=set(blocked),
+    )
+
+
+def random_day(seed: int, num_matches: int, num_referees: int) -> tuple:
+    """Matches on one day (some referees blocked each) and referees who also play"""
+    rng = random.Random(seed)
+    referees = [uuid.uuid4() for _ in range(num_referees)]
+    matches = [
+        match(rng.randrange(0, 8 * 60, 10), rng.choice((20, 30, 40)), rng.sample(referees, rng.randint(0, 2)))
+        for _ in range(num_matches)
+    ]
+    busy = {
+        referee_id: [(at(m), at(m + 30)) for m in rng.sample(range(0, 8 * 60, 15), 2)]
+        for referee_id in referees
+    }
+    return matches, busy
+
+
+def overlaps(start: datetime, end: datetime, intervals: list) -> bool:
+    return any(start < other_end and other_start < end for other_start, other_end in intervals)
+
+
+def check_assignments(matches: List[SimpleNamespace], busy: Dict[uuid.UUID, list], assignments) -> None:
+    """Valid assignments, and no unassigned match had a free eligible referee"""
+    assigned: Dict[uuid.UUID, list] = {referee_id: [] for referee_id in busy}
+    for item in matches:
+        referee_id = assignments.get(item.id)
+        if referee_id is None:
+            continue
+        assert referee_id not in item.blocked, "blocked referee assigned"
+        assert not overlaps(item.start, item.end, busy[referee_id]), "busy referee assigned"
+        assert not overlaps(item.start, item.end, assigned[referee_id]), "referee booked twice"
+        assigned[referee_id].append((item.start, item.end))
+    for item in matches:
+        if item.id in assignments:
+            continue
+        for referee_id in busy:
+            assert (
+                referee_id in item.blocked
+                or overlaps(item.start, item.end, busy[referee_id] + assigned[referee_id])
+            ), "free referee left unused"
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("num_matches,num_referees", [(40, 3), (80, 8), (120, 20)])
+def test_random_days_are_valid(seed, num_matches, num_referees):
+    matches, busy = random_day(seed, num_matches, num_referees)
+    calendars = {referee_id: RefereeCalendar(intervals) for referee_id, intervals in busy.items()}
+
+    assignments = assign_referees(matches, calendars)
+
+    check_assignments(matches, busy, assignments)
+    loads = {referee_id: calendar.load for referee_id, calendar in calendars.items()}
+    assert sum(loads.values()) == len(assignments)
+
+
+def test_blocked_referee_is_never_assigned():
+    referee = uuid.uuid4()
+    item = match(0, 30, blocked=[referee])
+
+    assert assign_referees([item], {referee: RefereeCalendar()}) == {}
+
+
+def test_busy_referee_is_not_assigned():
+    busy_referee, free_referee = uuid.uuid4(), uuid.uuid4()
+    item = match(30, 30)
+    calendars = {
+        busy_referee: RefereeCalendar([(at(0), at(45))]),
+        free_referee: RefereeCalendar(load=5),
+    }
+
+    assert assign_referees([item], calendars) == {item.id: free_referee}
+
+
+def test_touching_matches_share_a_referee():
+    referee = uuid.uuid4()
+    first, second = match(0, 30), match(30, 30)
+
+    assert assign_referees([first, second], {referee: RefereeCalendar()}) == {
+        first.id: referee, second.id: referee
+    }
+
+
+def test_overlapping_busy_intervals_are_merged():
+    calendar = RefereeCalendar([(at(0), at(30)), (at(20), at(60)), (at(90), at(100))])
+
+    assert calendar.starts == [at(0), at(90)]
+    assert calendar.ends == [at(60), at(100)]
+    assert calendar.is_free(at(60), at(90))
+    assert not calendar.is_free(at(50), at(70))
+
+
+def test_repair_moves_an_assignment_to_free_a_referee():
+    # Greedy gives the first match to the first referee, the only one the
+    # second match may have
+    first_referee, second_referee = uuid.uuid4(), uuid.uuid4()
+    first = match(0, 60)
+    second = match(30, 60, blocked=[second_referee])
+    calendars = {first_referee: RefereeCalendar(), second_referee: RefereeCalendar()}
+
+    assignments = assign_referees([first, second], calendars)
+
+    assert assignments == {first.id: second_referee, second.id: first_referee}
+
+
+def test_load_is_balanced():
+    referees = [uuid.uuid4() for _ in range(3)]
+    matches = [match(30 * i, 30) for i in range(9)]
+    calendars = {referee_id: RefereeCalendar() for referee_id in referees}
+
+    assignments = assign_referees(matches, calendars)
+
+    assert len(assignments) == 9
+    assert [calendar.load for calendar in calendars.values()] == [3, 3, 3]
+
+
+def test_existing_load_counts():
+    loaded, idle = uuid.uuid4(), uuid.uuid4()
+    matches = [match(30 * i, 30) for i in range(4)]
+    calendars = {loaded: RefereeCalendar(load=4), idle: RefereeCalendar()}
+
+    assign_referees(matches, calendars)
+
+    assert calendars[loaded].load == 4
+    assert calendars[idle].load == 4
+
+
+def test_no_referees():
+    assert assign_referees([match(0, 30)], {}) == {}
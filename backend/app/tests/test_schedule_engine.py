@@ -0,0 +1,115 @@
+"""
+Tests for the schedule clash sweep (app.engine.schedule)
+"""
+import random
+import uuid
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import List
+
+import pytest
+
+from app.engine import OVERLAP, REST, find_clashes
+
+DAY = datetime(2025, 6, 7, 8, 0)
+
+
+def booking(participant_id, match_id, start_minute: int, minutes: int) -> SimpleNamespace:
+    start = DAY + timedelta(minutes=start_minute)
+    return SimpleNamespace(
+        participant_id=participant_id,
+        match_id=match_id,
+        start=start,
+        end=start + timedelta(minutes=minutes),
+    )
+
+
+def random_bookings(seed: int, num_participants: int, num_matches: int) -> List[SimpleNamespace]:
+    """1v1 matches on one day (5-minute slots, so touching and equal starts occur)"""
+    rng = random.Random(seed)
+    participants = [uuid.uuid4() for _ in range(num_participants)]
+    bookings = []
+    for match_id in range(num_matches):
+        start_minute = rng.randrange(0, 8 * 60, 5)
+        minutes = rng.choice((10, 20, 30))
+        for participant_id in rng.sample(participants, 2):
+            bookings.append(booking(participant_id, match_id, start_minute, minutes))
+    return bookings
+
+
+def brute_force_clashes(bookings: List[SimpleNamespace], min_rest: timedelta) -> set:
+    """Conflicting (participant, match pair) by comparing all pairs"""
+    expected = set()
+    for i, a in enumerate(bookings):
+        for b in bookings[i + 1:]:
+            if a.participant_id != b.participant_id:
+                continue
+            first, second = sorted((a, b), key=lambda item: (item.start, item.end))
+            if second.start < first.end + min_rest:
+                expected.add((a.participant_id, frozenset((a.match_id, b.match_id))))
+    return expected
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("rest_minutes", [0, 10, 45])
+def test_matches_brute_force(seed, rest_minutes):
+    bookings = random_bookings(seed, num_participants=12, num_matches=60)
+    min_rest = timedelta(minutes=rest_minutes)
+
+    found = [
+        (clash.participant_id, frozenset((clash.first_match_id, clash.second_match_id)))
+        for clash in find_clashes(bookings, min_rest)
+    ]
+
+    assert len(found) == len(set(found)), "clash reported twice"
+    assert set(found) == brute_force_clashes(bookings, min_rest)
+
+
+def test_back_to_back_without_rest_is_no_clash():
+    player = uuid.uuid4()
+    bookings = [booking(player, 1, 0, 30), booking(player, 2, 30, 30)]
+
+    assert find_clashes(bookings, timedelta(0)) == []
+
+
+def test_back_to_back_with_rest_is_rest_clash():
+    player = uuid.uuid4()
+    bookings = [booking(player, 2, 30, 30), booking(player, 1, 0, 30)]
+
+    [clash] = find_clashes(bookings, timedelta(minutes=10))
+
+    assert clash.kind == REST
+    assert (clash.first_match_id, clash.second_match_id) == (1, 2)
+    assert clash.gap == timedelta(0)
+
+
+def test_overlap():
+    player = uuid.uuid4()
+    bookings = [booking(player, 1, 0, 30), booking(player, 2, 20, 30)]
+
+    [clash] = find_clashes(bookings, timedelta(minutes=10))
+
+    assert clash.kind == OVERLAP
+    assert clash.first_end == DAY + timedelta(minutes=30)
+    assert clash.second_start == DAY + timedelta(minutes=20)
+    assert clash.gap == timedelta(minutes=-10)
+
+
+def test_every_pair_of_a_long_match_is_reported():
+    player = uuid.uuid4()
+    bookings = [booking(player, 1, 0, 120)] + [
+        booking(player, match_id, 30 * (match_id - 1), 20) for match_id in (2, 3, 4)
+    ]
+
+    clashes = find_clashes(bookings, timedelta(0))
+
+    assert {(clash.first_match_id, clash.second_match_id) for clash in clashes} == {
+        (1, 2), (1, 3), (1, 4)
+    }
+    assert [clash.second_start for clash in clashes] == sorted(clash.second_start for clash in clashes)
+
+
+def test_other_participants_do_not_clash():
+    bookings = [booking(uuid.uuid4(), 1, 0, 30), booking(uuid.uuid4(), 2, 0, 30)]
+
+    assert find_clashes(bookings, timedelta(minutes=10)) == []
@@ -0,0 +1,137 @@
+"""
+Tests for standings aggregation (app.engine.standings)
+"""
+import uuid
+from decimal import Decimal
+from types import SimpleNamespace
+
+from app.engine import (
+    POSITION_POINTS,
+    StandingTally,
+    apply_match,
+    apply_multi_player_match,
+    apply_results,
+    apply_two_player_match,
+    rank_key,
+)
+from benchmarks.engine import aggregate, make_results
+
+
+def entry(participant_id, score=None, is_winner=False, final_position=None, match_id=None):
+    return SimpleNamespace(
+        match_id=match_id,
+        participant_id=participant_id,
+        score_value=Decimal(score) if score is not None else None,
+        is_winner=is_winner,
+        final_position=final_position,
+    )
+
+
+def tallies_for(*participant_ids):
+    return {participant_id: StandingTally() for participant_id in participant_ids}
+
+
+def test_two_player_win_by_score():
+    home, away = uuid.uuid4(), uuid.uuid4()
+    tallies = tallies_for(home, away)
+
+    apply_two_player_match([entry(home, 3), entry(away, 1)], tallies)
+
+    assert tallies[home].values() == (1, 1, 0, 0, 3, Decimal(3), Decimal(1), Decimal(2))
+    assert tallies[away].values() == (1, 0, 0, 1, 0, Decimal(1), Decimal(3), Decimal(-2))
+
+
+def test_two_player_draw():
+    home, away = uuid.uuid4(), uuid.uuid4()
+    tallies = tallies_for(home, away)
+
+    apply_two_player_match([entry(home, 2), entry(away, 2)], tallies)
+
+    for tally in tallies.values():
+        assert (tally.matches_drawn, tally.points, tally.score_difference) == (1, 1, 0)
+
+
+def test_two_player_marked_winner_beats_score():
+    home, away = uuid.uuid4(), uuid.uuid4()
+    tallies = tallies_for(home, away)
+
+    apply_two_player_match([entry(home, 1), entry(away, 2, is_winner=False)], tallies)
+    apply_two_player_match([entry(home, 1, is_winner=True), entry(away, 2)], tallies)
+
+    assert (tallies[home].matches_won, tallies[home].matches_lost, tallies[home].points) == (1, 1, 3)
+    assert (tallies[away].matches_won, tallies[away].matches_lost, tallies[away].points) == (1, 1, 3)
+
+
+def test_two_player_unknown_participant_is_ignored():
+    home = uuid.uuid4()
+    tallies = tallies_for(home)
+
+    apply_two_player_match([entry(home, 3), entry(uuid.uuid4(), 1)], tallies)
+
+    assert tallies[home].matches_played == 0
+
+
+def test_multi_player_points_by_position():
+    players = [uuid.uuid4() for _ in range(12)]
+    tallies = tallies_for(*players)
+
+    apply_multi_player_match(
+        [entry(player, 100 - position, final_position=position) for position, player in enumerate(players, start=1)],
+        tallies
+    )
+
+    assert sum(tally.points for tally in tallies.values()) == sum(POSITION_POINTS.values())
+    assert sum(tally.matches_played for tally in tallies.values()) == 12
+    assert [tally.matches_won for tally in tallies.values()] == [1] + [0] * 11
+    assert tallies[players[0]].score_for == Decimal(99)
+    assert all(tally.score_against == 0 for tally in tallies.values())
+    assert tallies[players[-1]].points == 0
+
+
+def test_apply_match_dispatches_by_size():
+    players = [uuid.uuid4() for _ in range(3)]
+    tallies = tallies_for(*players)
+
+    apply_match([entry(players[0], 1), entry(players[1], 0)], tallies)
+    apply_match([entry(player, final_position=position) for position, player in enumerate(players, start=1)], tallies)
+
+    assert tallies[players[0]].points == 3 + POSITION_POINTS[1]
+    assert tallies[players[1]].matches_lost == 1
+    assert tallies[players[2]].points == POSITION_POINTS[3]
+
+
+def test_apply_results_groups_rows_by_match():
+    home, away = uuid.uuid4(), uuid.uuid4()
+    tallies = tallies_for(home, away)
+    rows = [
+        entry(home, 1, match_id=1), entry(away, 0, match_id=1),
+        entry(home, 0, match_id=2), entry(away, 0, match_id=2),
+    ]
+
+    apply_results(rows, tallies)
+
+    assert (tallies[home].matches_played, tallies[home].points) == (2, 4)
+    assert (tallies[away].matches_played, tallies[away].points) == (2, 1)
+
+
+def test_tally_totals_over_many_results():
+    matches = make_results(num_participants=50, num_results=2000)
+    participant_ids = list({e.participant_id for entries in matches for e in entries})
+
+    table = aggregate(participant_ids, matches)
+
+    two_player = [entries for entries in matches if len(entries) == 2]
+    draws = sum(
+        1 for home, away in two_player
+        if not home.is_winner and not away.is_winner and home.score_value == away.score_value
+    )
+    multi_player_points = sum(
+        POSITION_POINTS.get(e.final_position, 0) for entries in matches if len(entries) > 2 for e in entries
+    )
+    assert sum(t.matches_played for t in table) == sum(len(entries) for entries in matches)
+    assert sum(t.matches_drawn for t in table) == 2 * draws
+    assert sum(t.points for t in table) == 3 * (len(two_player) - draws) + 2 * draws + multi_player_points
+    assert sum(t.score_against for t in table) == sum(
+        e.score_value for entries in two_player for e in entries
+    )
+    assert all(rank_key(a) <= rank_key(b) for a, b in zip(table, table[1:]))
@@ -0,0 +1,40 @@
+"""
+Standalone background job worker (JOBS_BACKEND=redis)
+
+Runs queued jobs without serving HTTP, so API processes can set
+JOBS_WORKER_ENABLED=False:
+
+    python -m app.worker
+"""
+import asyncio
+import logging
+import signal
+
+from app.core.config import settings
+from app.core.redis import close_redis
+from app.db.session import close_db
+from app.services.job_service import job_worker
+
+
+async def main() -> None:
+    if settings.JOBS_BACKEND != "redis":
+        raise SystemExit("JOBS_BACKEND=redis required (local jobs run in the API process)")
+
+    stopping = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stopping.set)
+
+    job_worker.start()
+    print(f"✅ Job worker running ({settings.JOBS_WORKER_CONCURRENCY} concurrent jobs)")
+    await stopping.wait()
+
+    print("👋 Stopping job worker...")
+    await job_worker.stop()  # Running jobs go back to the queue
+    await close_redis()
+    await close_db()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=settings.LOG_LEVEL)
+    asyncio.run(main())
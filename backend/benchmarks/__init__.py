@@ -0,0 +1,3 @@
+"""
+Benchmarks for UnserTurnierplan (run from the backend directory)
+"""
@@ -0,0 +1,252 @@
+"""
+Tournament engine micro-benchmarks.
+
+Times the DB-free algorithms in app.engine on synthetic data: round-robin
+pairing generation for up to 1000 participants, knockout round names,
+standings aggregation over 100k match results, the schedule clash sweep
+over as many scheduled matches and referee assignment for a 1000-match
+tournament day. Every case is checked for
+correctness before it is timed, so a broken algorithm fails instead of
+reporting a fast time. No database needed. The correctness checks and
+the n=1000 pairing and 100k-result cases also run with pytest
+(app/tests, pytest-benchmark).
+
+Usage (from the backend directory):
+    python -m benchmarks.engine
+    python -m benchmarks.engine --results 100000 --repeat 5 --json
+"""
+import argparse
+import json
+import random
+import time
+import uuid
+from datetime import datetime, timedelta
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List
+
+from app.engine import (
+    RefereeCalendar,
+    StandingTally,
+    apply_match,
+    assign_referees,
+    find_clashes,
+    knockout_round_names,
+    rank_key,
+    round_robin_pairings,
+)
+
+PAIRING_SIZES = (8, 64, 256, 1000)
+
+
+def _time(fn: Callable[[], Any], repeat: int) -> float:
+    """Best wall time of repeat runs in seconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def check_pairings(n: int, rounds: List[List[tuple]]) -> None:
+    """Everyone meets everyone exactly once, nobody plays twice per round"""
+    pairs = set()
+    for round_pairings in rounds:
+        seen = [p for pairing in round_pairings for p in pairing]
+        assert len(seen) == len(set(seen)), f"n={n}: participant twice in a round"
+        pairs.update(frozenset(pairing) for pairing in round_pairings)
+    assert len(pairs) == n * (n - 1) // 2, f"n={n}: {len(pairs)} pairings"
+    assert sum(len(r) for r in rounds) == len(pairs), f"n={n}: repeated pairing"
+
+
+def make_results(num_participants: int, num_results: int) -> List[List[SimpleNamespace]]:
+    """Synthetic finished matches (mostly 1v1, some 8-player races)"""
+    rng = random.Random(42)
+    participants = [uuid.uuid4() for _ in range(num_participants)]
+    matches = []
+    for i in range(num_results):
+        if i % 20 == 19:
+            field = rng.sample(participants, 8)
+            matches.append([
+                SimpleNamespace(participant_id=p, score_value=Decimal(rng.randint(0, 100)),
+                                is_winner=position == 1, final_position=position)
+                for position, p in enumerate(field, start=1)
+            ])
+            continue
+        home, away = rng.sample(participants, 2)
+        home_score, away_score = rng.randint(0, 5), rng.randint(0, 5)
+        matches.append([
+            SimpleNamespace(participant_id=home, score_value=Decimal(home_score),
+                            is_winner=home_score > away_score and i % 2 == 0,
+                            final_position=None),
+            SimpleNamespace(participant_id=away, score_value=Decimal(away_score),
+                            is_winner=away_score > home_score and i % 2 == 0,
+                            final_position=None),
+        ])
+    return matches
+
+
+def aggregate(participant_ids: List[uuid.UUID], matches: List[List[Any]]) -> List[StandingTally]:
+    tallies = {participant_id: StandingTally() for participant_id in participant_ids}
+    for entries in matches:
+        apply_match(entries, tallies)
+    return sorted(tallies.values(), key=rank_key)
+
+
+def make_bookings(num_participants: int, num_matches: int) -> List[SimpleNamespace]:
+    """Synthetic 1v1 matches spread over a weekend (5-minute slots)"""
+    rng = random.Random(42)
+    participants = [uuid.uuid4() for _ in range(num_participants)]
+    first = datetime(2025, 6, 7, 8, 0)
+    bookings = []
+    for match_id in range(num_matches):
+        start = first + timedelta(minutes=rng.randrange(0, 2 * 24 * 60, 5))
+        end = start + timedelta(minutes=rng.choice((10, 20, 30)))
+        for participant_id in rng.sample(participants, 2):
+            bookings.append(SimpleNamespace(
+                participant_id=participant_id, match_id=match_id, start=start, end=end
+            ))
+    return bookings
+
+
+def check_clashes(bookings: List[SimpleNamespace], min_rest: timedelta) -> None:
+    """The sweep finds exactly the pairs a comparison of all pairs finds"""
+    expected = set()
+    for i, a in enumerate(bookings):
+        for b in bookings[i + 1:]:
+            if a.participant_id != b.participant_id:
+                continue
+            first, second = sorted((a, b), key=lambda booking: (booking.start, booking.end))
+            if second.start < first.end + min_rest:
+                expected.add((a.participant_id, frozenset((a.match_id, b.match_id))))
+    found = [
+        (clash.participant_id, frozenset((clash.first_match_id, clash.second_match_id)))
+        for clash in find_clashes(bookings, min_rest)
+    ]
+    assert len(found) == len(set(found)), "clash reported twice"
+    assert set(found) == expected, f"{len(found)} clashes, expected {len(expected)}"
+
+
+def make_referee_day(
+    num_matches: int,
+    num_referees: int
+) -> tuple:
+    """Matches on one day (some referees blocked each) and referees who also play"""
+    rng = random.Random(42)
+    referees = [uuid.uuid4() for _ in range(num_referees)]
+    first = datetime(2025, 6, 7, 8, 0)
+    matches = []
+    for _ in range(num_matches):
+        start = first + timedelta(minutes=rng.randrange(0, 12 * 60, 10))
+        matches.append(SimpleNamespace(
+            id=uuid.uuid4(),
+            start=start,
+            end=start + timedelta(minutes=rng.choice((20, 30, 40))),
+            blocked=set(rng.sample(referees, rng.randint(0, 2))),
+        ))
+    busy = {
+        referee_id: [
+            (first + timedelta(minutes=m), first + timedelta(minutes=m + 30))
+            for m in rng.sample(range(0, 12 * 60, 15), 2)
+        ]
+        for referee_id in referees
+    }
+    return matches, busy
+
+
+def check_referees(matches: List[SimpleNamespace], busy: Dict[uuid.UUID, list]) -> None:
+    """Valid assignments, and no unassigned match had a free eligible referee"""
+    def overlaps(start: datetime, end: datetime, intervals: list) -> bool:
+        return any(start < other_end and other_start < end for other_start, other_end in intervals)
+
+    assignments = assign_referees(matches, {r: RefereeCalendar(b) for r, b in busy.items()})
+    assigned: Dict[uuid.UUID, list] = {referee_id: [] for referee_id in busy}
+    for match in matches:
+        referee_id = assignments.get(match.id)
+        if referee_id is None:
+            continue
+        assert referee_id not in match.blocked, "blocked referee assigned"
+        assert not overlaps(match.start, match.end, busy[referee_id]), "busy referee assigned"
+        assert not overlaps(match.start, match.end, assigned[referee_id]), "referee booked twice"
+        assigned[referee_id].append((match.start, match.end))
+    for match in matches:
+        if match.id in assignments:
+            continue
+        for referee_id in busy:
+            assert (
+                referee_id in match.blocked
+                or overlaps(match.start, match.end, busy[referee_id] + assigned[referee_id])
+            ), "free referee left unused"
+
+
+def run(num_results: int, num_participants: int, repeat: int) -> Dict[str, Dict[str, float]]:
+    results: Dict[str, Dict[str, float]] = {}
+
+    for n in PAIRING_SIZES:
+        check_pairings(n, round_robin_pairings(n))
+        check_pairings(n - 1, round_robin_pairings(n - 1))
+        seconds = _time(lambda: round_robin_pairings(n), repeat)
+        results[f"round_robin_pairings n={n}"] = {
+            "ms": seconds * 1000,
+            "us_per_match": seconds / (n * (n - 1) // 2) * 1e6,
+        }
+
+    seconds = _time(lambda: [knockout_round_names(r) for r in range(1, 11)], repeat)
+    results["knockout_round_names 1-10"] = {"ms": seconds * 1000, "us_per_match": 0.0}
+
+    matches = make_results(num_participants, num_results)
+    participant_ids = list({e.participant_id for entries in matches for e in entries})
+    table = aggregate(participant_ids, matches)
+    assert sum(t.matches_played for t in table) == sum(len(m) for m in matches)
+    assert all(rank_key(a) <= rank_key(b) for a, b in zip(table, table[1:]))
+    seconds = _time(lambda: aggregate(participant_ids, matches), repeat)
+    results[f"standings {num_results} results"] = {
+        "ms": seconds * 1000,
+        "us_per_match": seconds / num_results * 1e6,
+    }
+
+    min_rest = timedelta(minutes=10)
+    check_clashes(make_bookings(50, 500), min_rest)
+    # About 16 matches per participant, so clashes do not dominate the output
+    bookings = make_bookings(max(num_participants, num_results // 8), num_results)
+    seconds = _time(lambda: find_clashes(bookings, min_rest), repeat)
+    results[f"schedule clashes {num_results} matches"] = {
+        "ms": seconds * 1000,
+        "us_per_match": seconds / num_results * 1e6,
+    }
+
+    matches, busy = make_referee_day(1000, 60)
+    check_referees(matches, busy)
+    seconds = _time(
+        lambda: assign_referees(matches, {r: RefereeCalendar(b) for r, b in busy.items()}),
+        repeat
+    )
+    results["referee assignment 1000 matches"] = {
+        "ms": seconds * 1000,
+        "us_per_match": seconds / len(matches) * 1e6,
+    }
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--results", type=int, default=100_000, help="Match results to aggregate")
+    parser.add_argument("--participants", type=int, default=500, help="Participants in the standings")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per case (best is kept)")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable JSON")
+    args = parser.parse_args()
+
+    results = run(args.results, args.participants, args.repeat)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'case':<34}{'ms':>12}{'µs/match':>12}")
+    for name, r in results.items():
+        print(f"{name:<34}{r['ms']:>12.2f}{r['us_per_match']:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
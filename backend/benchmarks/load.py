@@ -0,0 +1,335 @@
+"""
+Tournament day load benchmark.
+
+Drives concurrent mixed workloads against the API using a dataset seeded
+by benchmarks.seed:
+
+- spectators: tournament page, match list, standings and change feed reads
+- scorers: score submissions (each recalculates the standings)
+- registration: registration rush on the open tournaments
+- generation: bracket / schedule generation (each seeded tournament once)
+
+All scenarios run at the same time for --duration seconds, each with its
+own number of virtual users. Reports p50/p95/p99 latency and throughput
+per scenario and per operation; --output writes the results as JSON and
+--compare checks them against an earlier run (exit code 1 on regression).
+
+By default the app runs in-process (ASGI, no network, lifespan not run;
+the live tournament engine is started when LIVE_ENGINE_ENABLED is set);
+use --base-url to load a running server instead.
+
+Usage (from the backend directory):
+    python -m benchmarks.seed
+    python -m benchmarks.load --duration 60 --output results/run.json
+    python -m benchmarks.load --base-url http://localhost:8000 --compare results/run.json
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import statistics
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
+
+import httpx
+
+from app.core.config import settings
+
+P = settings.API_PREFIX
+DEFAULT_MANIFEST = os.path.join(os.path.dirname(__file__), "results", "seed.json")
+
+# Operation = (name, coroutine issuing one request)
+Operation = Tuple[str, Callable[[httpx.AsyncClient], Awaitable[httpx.Response]]]
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile of an ascending list"""
+    if not sorted_values:
+        return 0.0
+    index = max(math.ceil(q / 100 * len(sorted_values)) - 1, 0)
+    return sorted_values[min(index, len(sorted_values) - 1)]
+
+
+class Recorder:
+    """Latencies and errors per scenario and operation"""
+
+    def __init__(self):
+        self.latencies: Dict[Tuple[str, str], List[float]] = defaultdict(list)
+        self.errors: Dict[Tuple[str, str], int] = defaultdict(int)
+        self.error_samples: Dict[str, str] = {}
+
+    async def call(self, scenario: str, operation: Operation, client: httpx.AsyncClient) -> bool:
+        name, request = operation
+        key = (scenario, name)
+        start = time.perf_counter()
+        try:
+            response = await request(client)
+            failed = response.status_code >= 400
+            detail = f"{response.status_code} {response.text[:200]}"
+        except httpx.HTTPError as e:
+            failed = True
+            detail = f"{type(e).__name__}: {e}"
+        self.latencies[key].append((time.perf_counter() - start) * 1000)
+        if failed:
+            self.errors[key] += 1
+            self.error_samples.setdefault(name, detail)
+        return not failed
+
+    def summary(self, elapsed: float) -> Dict[str, Any]:
+        scenarios: Dict[str, Any] = {}
+        for scenario in sorted({scenario for scenario, _ in self.latencies}):
+            keys = [key for key in self.latencies if key[0] == scenario]
+            scenarios[scenario] = {
+                **self._stats(sum((self.latencies[key] for key in keys), []),
+                              sum(self.errors[key] for key in keys), elapsed),
+                "operations": {
+                    name: self._stats(self.latencies[(scenario, name)],
+                                      self.errors[(scenario, name)], elapsed)
+                    for _, name in sorted(keys)
+                },
+            }
+        return scenarios
+
+    @staticmethod
+    def _stats(latencies: List[float], errors: int, elapsed: float) -> Dict[str, Any]:
+        ordered = sorted(latencies)
+        return {
+            "requests": len(ordered),
+            "errors": errors,
+            "throughput_rps": round(len(ordered) / elapsed, 2) if elapsed else 0.0,
+            "mean_ms": round(statistics.fmean(ordered), 2) if ordered else 0.0,
+            "p50_ms": round(percentile(ordered, 50), 2),
+            "p95_ms": round(percentile(ordered, 95), 2),
+            "p99_ms": round(percentile(ordered, 99), 2),
+            "max_ms": round(ordered[-1], 2) if ordered else 0.0,
+        }
+
+
+def spectator_operations(manifest: Dict[str, Any]) -> Callable[[], Operation]:
+    """Random read of a random running tournament (weighted like a match day)"""
+    tournaments = manifest["tournaments"]
+
+    def pick() -> Operation:
+        tournament = random.choice(tournaments)
+        tid = tournament["id"]
+        return random.choices([
+            ("GET /tournaments/{id}", lambda c: c.get(f"{P}/tournaments/{tid}")),
+            ("GET /matches?tournament_id", lambda c: c.get(
+                f"{P}/matches", params={"tournament_id": tid})),
+            ("GET /matches/standings/{id}", lambda c: c.get(f"{P}/matches/standings/{tid}")),
+            ("GET /tournaments/{id}/changes", lambda c: c.get(
+                f"{P}/tournaments/{tid}/changes",
+                params={"since": random.randint(1, 50)})),
+        ], weights=[2, 3, 4, 1])[0]
+    return pick
+
+
+def scorer_operations(manifest: Dict[str, Any], headers: Dict[str, str]) -> Callable[[], Operation]:
+    """Score submission for a random open match"""
+    matches = manifest["score_matches"]
+
+    def pick() -> Operation:
+        match = random.choice(matches)
+        home, away = match["participants"]
+        body = {"participant_scores": [
+            {"participant_id": home, "score_value": random.randint(0, 5)},
+            {"participant_id": away, "score_value": random.randint(0, 5)},
+        ]}
+        return ("PUT /matches/{id}/score", lambda c: c.put(
+            f"{P}/matches/{match['id']}/score", json=body, headers=headers))
+    return pick
+
+
+def registration_operations(manifest: Dict[str, Any], headers: Dict[str, str]) -> Iterator[Operation]:
+    """Every player registers once for every open tournament, then the rush is over"""
+    for tid in manifest["registration_tournaments"]:
+        for i, player_id in enumerate(manifest["player_ids"]):
+            body = {"participant_name": f"Player {i}", "participant_user_id": player_id}
+            yield ("POST /tournaments/{id}/register", lambda c, tid=tid, body=body: c.post(
+                f"{P}/tournaments/{tid}/register", json=body, headers=headers))
+
+
+def generation_operations(manifest: Dict[str, Any], headers: Dict[str, str]) -> Iterator[Operation]:
+    """Each seeded generation tournament is drawn exactly once"""
+    for tournament in manifest["generation_tournaments"]:
+        kind = "knockout" if tournament["type"] == "knockout" else "round-robin"
+        body = {"tournament_id": tournament["id"]}
+        yield (f"POST /matches/generate/{kind}", lambda c, kind=kind, body=body: c.post(
+            f"{P}/matches/generate/{kind}", json=body, headers=headers))
+
+
+async def virtual_user(scenario: str, next_operation: Callable[[], Optional[Operation]],
+                       client: httpx.AsyncClient, recorder: Recorder, deadline: float,
+                       think_time: float) -> None:
+    while time.monotonic() < deadline:
+        operation = next_operation()
+        if operation is None:  # Scenario exhausted (all registrations / draws done)
+            return
+        await recorder.call(scenario, operation, client)
+        if think_time:
+            await asyncio.sleep(random.uniform(0, 2 * think_time))
+
+
+def _from_iterator(operations: Iterator[Operation]) -> Callable[[], Optional[Operation]]:
+    return lambda: next(operations, None)
+
+
+async def login(client: httpx.AsyncClient, manifest: Dict[str, Any]) -> Dict[str, str]:
+    response = await client.post(f"{P}/auth/login/json", json={
+        "email": manifest["owner_email"], "password": manifest["password"],
+    })
+    response.raise_for_status()
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+async def run(args, manifest: Dict[str, Any]) -> Dict[str, Any]:
+    if args.base_url:
+        transport = None
+        base_url = args.base_url
+    else:
+        from app.main import app
+        transport = httpx.ASGITransport(app=app)
+        base_url = "http://bench"
+        if settings.LIVE_ENGINE_ENABLED:
+            from app.services.live_tournament_service import live_tournaments
+            await live_tournaments.start()
+
+    try:
+        limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+        async with httpx.AsyncClient(transport=transport, base_url=base_url,
+                                     limits=limits, timeout=args.timeout) as client:
+            headers = await login(client, manifest)
+            scenarios = {
+                "spectators": (args.spectators, spectator_operations(manifest)),
+                "scorers": (args.scorers, scorer_operations(manifest, headers)),
+                "registration": (args.registrants,
+                                 _from_iterator(registration_operations(manifest, headers))),
+                "generation": (args.generators,
+                               _from_iterator(generation_operations(manifest, headers))),
+            }
+
+            recorder = Recorder()
+            started_at = datetime.utcnow().isoformat()
+            start = time.monotonic()
+            deadline = start + args.duration
+            await asyncio.gather(*(
+                virtual_user(name, next_operation, client, recorder, deadline, args.think_time)
+                for name, (users, next_operation) in scenarios.items()
+                for _ in range(users)
+            ))
+            elapsed = time.monotonic() - start
+    finally:
+        if transport is not None:
+            from app.db.session import close_db
+            if settings.LIVE_ENGINE_ENABLED:
+                await live_tournaments.stop()
+            await close_db()
+
+    return {
+        "meta": {
+            "started_at": started_at,
+            "target": args.base_url or "in-process",
+            "duration_s": round(elapsed, 2),
+            "manifest_tag": manifest["tag"],
+            "users": {name: users for name, (users, _) in scenarios.items()},
+            "think_time_s": args.think_time,
+        },
+        "scenarios": recorder.summary(elapsed),
+        "error_samples": recorder.error_samples,
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """Regressions: p95 latency up or throughput down by more than tolerance"""
+    regressions = []
+    for scenario, stats in current["scenarios"].items():
+        previous = baseline.get("scenarios", {}).get(scenario)
+        if not previous:
+            continue
+        rows = [(scenario, stats, previous)] + [
+            (f"{scenario} {name}", op, previous["operations"][name])
+            for name, op in stats["operations"].items()
+            if name in previous.get("operations", {})
+        ]
+        for label, now, before in rows:
+            if before["p95_ms"] and now["p95_ms"] > before["p95_ms"] * (1 + tolerance):
+                regressions.append(
+                    f"{label}: p95 {before['p95_ms']} -> {now['p95_ms']} ms"
+                )
+        if (
+            previous["throughput_rps"]
+            and stats["throughput_rps"] < previous["throughput_rps"] * (1 - tolerance)
+        ):
+            regressions.append(
+                f"{scenario}: throughput {previous['throughput_rps']} -> "
+                f"{stats['throughput_rps']} req/s"
+            )
+    return regressions
+
+
+def print_report(results: Dict[str, Any]) -> None:
+    meta = results["meta"]
+    print(f"{meta['target']}, {meta['duration_s']}s, users {meta['users']}")
+    print(
+        f"{'scenario / operation':<46} {'reqs':>6} {'err':>5} {'rps':>8} "
+        f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}"
+    )
+    for scenario, stats in results["scenarios"].items():
+        rows = [(scenario, stats)] + [
+            (f"  {name}", op) for name, op in stats["operations"].items()
+        ]
+        for label, row in rows:
+            print(
+                f"{label:<46} {row['requests']:>6} {row['errors']:>5} "
+                f"{row['throughput_rps']:>8.1f} {row['p50_ms']:>8.2f} "
+                f"{row['p95_ms']:>8.2f} {row['p99_ms']:>8.2f}"
+            )
+    for name, sample in results["error_samples"].items():
+        print(f"first error {name}: {sample}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--manifest", default=DEFAULT_MANIFEST, help="Seed manifest (benchmarks.seed)")
+    parser.add_argument("--base-url", help="Load a running server instead of the in-process app")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds to run")
+    parser.add_argument("--spectators", type=int, default=50, help="Virtual users reading")
+    parser.add_argument("--scorers", type=int, default=5, help="Virtual users submitting scores")
+    parser.add_argument("--registrants", type=int, default=20, help="Virtual users registering")
+    parser.add_argument("--generators", type=int, default=2, help="Virtual users generating brackets")
+    parser.add_argument("--think-time", type=float, default=0.0, help="Mean pause between requests (s)")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Request timeout (s)")
+    parser.add_argument("--output", help="Write results as JSON")
+    parser.add_argument("--compare", help="Baseline results JSON to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed regression (0.2 = 20%%)")
+    args = parser.parse_args()
+
+    with open(args.manifest) as f:
+        manifest = json.load(f)
+
+    results = asyncio.run(run(args, manifest))
+    print_report(results)
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions beyond {args.tolerance:.0%} against {args.compare}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,304 @@
+"""
+Tournament day dataset for the load benchmark.
+
+Seeds a realistic dataset into the configured database (DATABASE_URL):
+clubs, running tournaments with 32-256 club participants, their brackets
+and round-robin schedules (thousands of matches), partially played with
+standings, plus the fixtures the load scenarios consume:
+
+- generation tournaments: confirmed participants but no matches yet
+- registration tournaments: open for registration, with a pool of
+  player accounts to register
+
+Every run uses a fresh tag, so runs never collide and can be seeded into
+a shared database. The IDs the load benchmark needs are written to a
+manifest (JSON).
+
+Usage (from the backend directory, database migrated):
+    python -m benchmarks.seed
+    python -m benchmarks.seed --clubs 300 --tournaments 120 --manifest seed.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+from sqlalchemy import and_, insert, select, update
+
+from app.core.security import get_password_hash
+from app.db.session import AsyncSessionLocal, engine
+from app.models.club import Club
+from app.models.match import Match
+from app.models.match_participant import MatchParticipant
+from app.models.tournament import Tournament
+from app.models.tournament_participant import TournamentParticipant
+from app.models.user import User
+from app.services.bracket_service import BracketService
+from app.services.standings_service import StandingsService
+
+PASSWORD = "Benchmark123!"
+DEFAULT_MANIFEST = os.path.join(os.path.dirname(__file__), "results", "seed.json")
+PARTICIPANT_COUNTS = (32, 64, 128, 256)
+CITIES = ("Berlin", "Hamburg", "München", "Köln", "Leipzig", "Dresden", "Bremen")
+
+
+def _rows(count: int, make) -> List[Dict[str, Any]]:
+    now = datetime.utcnow()
+    return [
+        {"id": uuid.uuid4(), "created_at": now, "updated_at": now, **make(i)}
+        for i in range(count)
+    ]
+
+
+async def seed_accounts(tag: str, clubs: int, players: int) -> Dict[str, Any]:
+    """Owner account, clubs (also the team participants) and player accounts"""
+    password_hash = get_password_hash(PASSWORD)  # bcrypt is slow, hash once
+
+    def user(prefix: str):
+        return lambda i: {
+            "email": f"{prefix}{i}-{tag}@bench.example", "password_hash": password_hash,
+            "first_name": "Bench", "last_name": f"{prefix.title()} {i}",
+            "language": "de", "timezone": "Europe/Berlin",
+            "email_verified": True, "is_active": True, "is_superuser": False,
+            "two_factor_enabled": False,
+        }
+
+    owner = _rows(1, user("owner"))
+    player_rows = _rows(players, user("player"))
+    club_rows = _rows(clubs, lambda i: {
+        "name": f"Bench Club {i} {tag}", "slug": f"bench-club-{i}-{tag}",
+        "city": CITIES[i % len(CITIES)], "country": "Deutschland",
+        "verification_status": "pending", "member_count": 0, "is_active": True,
+    })
+
+    async with AsyncSessionLocal() as db:
+        await db.execute(insert(User.__table__), owner + player_rows)
+        await db.execute(insert(Club.__table__), club_rows)
+        await db.commit()
+
+    return {
+        "owner": owner[0],
+        "club_ids": [row["id"] for row in club_rows],
+        "player_ids": [row["id"] for row in player_rows],
+    }
+
+
+def _tournament_row(tag: str, name: str, club_id, owner_id, tournament_type: str,
+                    status: str, max_participants: int, day: int) -> Dict[str, Any]:
+    start = datetime.utcnow().replace(hour=9, minute=0, second=0, microsecond=0) + timedelta(days=day)
+    return {
+        "name": f"{name} {tag}", "slug": f"{name.lower().replace(' ', '-')}-{tag}",
+        "club_id": club_id, "created_by": owner_id,
+        "sport_type": "football", "tournament_type": tournament_type,
+        "status": status, "participant_type": "team",
+        "start_date": start, "end_date": start + timedelta(hours=10),
+        "registration_start": start - timedelta(days=30),
+        "registration_end": start - timedelta(days=1),
+        "city": CITIES[day % len(CITIES)],
+        "min_participants": 2, "max_participants": max_participants,
+        "current_participants": 0, "is_public": True, "is_active": True,
+        "change_version": 0, "resync_version": 0,
+    }
+
+
+async def _insert_tournament(db, row: Dict[str, Any], club_ids: List) -> uuid.UUID:
+    """Insert a tournament with confirmed club participants"""
+    tournament_id = uuid.uuid4()
+    now = datetime.utcnow()
+    participant_club_ids = random.sample(club_ids, row["max_participants"])
+    await db.execute(insert(Tournament.__table__), [{
+        **row, "id": tournament_id, "created_at": now, "updated_at": now,
+        "current_participants": len(participant_club_ids),
+    }])
+    await db.execute(insert(TournamentParticipant.__table__), [
+        {
+            "id": uuid.uuid4(), "created_at": now, "updated_at": now,
+            "tournament_id": tournament_id, "participant_club_id": club_id,
+            "registered_by": row["created_by"], "participant_name": f"Team {seed}",
+            "registration_date": now, "status": "confirmed",
+            "payment_status": "not_required", "seed": seed, "change_version": 0,
+        }
+        for seed, club_id in enumerate(participant_club_ids, start=1)
+    ])
+    return tournament_id
+
+
+async def _play_matches(db, tournament_id, rounds: int) -> None:
+    """Finish the matches of the first rounds with random scores"""
+    played = (
+        select(Match.id)
+        .where(and_(
+            Match.tournament_id == tournament_id,
+            Match.round_number <= rounds,
+            Match.is_bye.is_(False),
+        ))
+        .scalar_subquery()
+    )
+    participants = (await db.execute(
+        select(MatchParticipant).where(MatchParticipant.match_id.in_(played))
+    )).scalars().all()
+    for participant in participants:
+        participant.score_value = random.randint(0, 4)
+    await db.execute(
+        update(Match)
+        .where(Match.id.in_(played))
+        .values(status="completed", is_finished=True)
+        .execution_options(synchronize_session=False)
+    )
+    await db.flush()
+    await StandingsService.calculate_standings(db, tournament_id)
+
+
+async def seed_tournaments(tag: str, accounts: Dict[str, Any], count: int) -> List[Dict[str, Any]]:
+    """Running tournaments with generated matches (knockout, 32er round robin)"""
+    club_ids = accounts["club_ids"]
+    owner_id = accounts["owner"]["id"]
+    sizes = [size for size in PARTICIPANT_COUNTS if size <= len(club_ids)]
+    tournaments = []
+
+    for i in range(count):
+        size = random.choice(sizes)
+        tournament_type = "round_robin" if size == 32 and i % 2 else "knockout"
+        row = _tournament_row(
+            tag, f"Bench Cup {i}", club_ids[i % len(club_ids)], owner_id,
+            tournament_type, "active", size, i % 14,
+        )
+        async with AsyncSessionLocal() as db:
+            tournament_id = await _insert_tournament(db, row, club_ids)
+            if tournament_type == "knockout":
+                matches = await BracketService.generate_knockout_bracket(db, tournament_id)
+                played_rounds = 1
+            else:
+                matches = await BracketService.generate_round_robin_schedule(db, tournament_id)
+                played_rounds = max(match.round_number for match in matches) // 2
+            await _play_matches(db, tournament_id, played_rounds)
+            await db.commit()
+
+        tournaments.append({
+            "id": str(tournament_id), "slug": row["slug"], "type": tournament_type,
+            "participants": size, "matches": len(matches),
+        })
+    return tournaments
+
+
+async def seed_fixtures(tag: str, accounts: Dict[str, Any], generation: int,
+                        registration: int) -> Dict[str, Any]:
+    """Tournaments consumed by the generation and registration scenarios"""
+    club_ids = accounts["club_ids"]
+    owner_id = accounts["owner"]["id"]
+    sizes = [size for size in PARTICIPANT_COUNTS if size <= len(club_ids)]
+    generation_tournaments = []
+    registration_ids = []
+
+    async with AsyncSessionLocal() as db:
+        for i in range(generation):
+            tournament_type = "round_robin" if i % 4 == 3 else "knockout"
+            size = 32 if tournament_type == "round_robin" else random.choice(sizes)
+            row = _tournament_row(
+                tag, f"Bench Draw {i}", club_ids[i % len(club_ids)], owner_id,
+                tournament_type, "published", size, 14 + i % 7,
+            )
+            tournament_id = await _insert_tournament(db, row, club_ids)
+            generation_tournaments.append({"id": str(tournament_id), "type": tournament_type})
+
+        rows = _rows(registration, lambda i: _tournament_row(
+            tag, f"Bench Open {i}", club_ids[i % len(club_ids)], owner_id,
+            "knockout", "registration_open", len(accounts["player_ids"]) + 1, 21 + i,
+        ))
+        if rows:
+            for row in rows:
+                row["participant_type"] = "individual"
+            await db.execute(insert(Tournament.__table__), rows)
+        registration_ids = [str(row["id"]) for row in rows]
+        await db.commit()
+
+    return {"generation": generation_tournaments, "registration": registration_ids}
+
+
+async def score_matches(tournament_ids: List[str], limit: int) -> List[Dict[str, Any]]:
+    """Open matches with both participants set (targets of score submissions)"""
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(MatchParticipant.match_id, MatchParticipant.participant_id)
+            .join(Match, Match.id == MatchParticipant.match_id)
+            .where(and_(
+                Match.tournament_id.in_([uuid.UUID(t) for t in tournament_ids]),
+                Match.is_finished.is_(False),
+            ))
+            .order_by(MatchParticipant.match_id, MatchParticipant.slot_number)
+        )
+        slots: Dict[str, List[str]] = {}
+        for match_id, participant_id in result:
+            slots.setdefault(str(match_id), []).append(str(participant_id))
+
+    matches = [
+        {"id": match_id, "participants": participant_ids}
+        for match_id, participant_ids in slots.items()
+        if len(participant_ids) == 2
+    ]
+    random.shuffle(matches)
+    return matches[:limit]
+
+
+async def seed(args) -> Dict[str, Any]:
+    tag = uuid.uuid4().hex[:8]
+    random.seed(args.random_seed)
+    start = time.perf_counter()
+
+    accounts = await seed_accounts(tag, args.clubs, args.players)
+    tournaments = await seed_tournaments(tag, accounts, args.tournaments)
+    fixtures = await seed_fixtures(tag, accounts, args.generation, args.registration)
+    matches = await score_matches([t["id"] for t in tournaments], args.score_matches)
+    await engine.dispose()
+
+    return {
+        "tag": tag,
+        "seeded_at": datetime.utcnow().isoformat(),
+        "seconds": round(time.perf_counter() - start, 1),
+        "owner_email": accounts["owner"]["email"],
+        "password": PASSWORD,
+        "clubs": len(accounts["club_ids"]),
+        "tournaments": tournaments,
+        "total_matches": sum(t["matches"] for t in tournaments),
+        "score_matches": matches,
+        "generation_tournaments": fixtures["generation"],
+        "registration_tournaments": fixtures["registration"],
+        "player_ids": [str(player_id) for player_id in accounts["player_ids"]],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--clubs", type=int, default=300, help="Clubs (at least 256 for the largest tournaments)")
+    parser.add_argument("--tournaments", type=int, default=60, help="Running tournaments with matches")
+    parser.add_argument("--generation", type=int, default=40, help="Tournaments waiting for bracket generation")
+    parser.add_argument("--registration", type=int, default=5, help="Tournaments open for registration")
+    parser.add_argument("--players", type=int, default=1000, help="Player accounts for the registration rush")
+    parser.add_argument("--score-matches", type=int, default=500, help="Open matches used for score submissions")
+    parser.add_argument("--random-seed", type=int, default=2024)
+    parser.add_argument("--manifest", default=DEFAULT_MANIFEST, help="Output manifest path")
+    args = parser.parse_args()
+
+    manifest = asyncio.run(seed(args))
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.manifest)), exist_ok=True)
+    with open(args.manifest, "w") as f:
+        json.dump(manifest, f, indent=2)
+
+    print(
+        f"Seeded {manifest['clubs']} clubs, {len(manifest['tournaments'])} tournaments "
+        f"with {manifest['total_matches']} matches, "
+        f"{len(manifest['generation_tournaments'])} generation and "
+        f"{len(manifest['registration_tournaments'])} registration tournaments "
+        f"in {manifest['seconds']}s (tag {manifest['tag']})"
+    )
+    print(f"Manifest: {args.manifest}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""
+Response serialization benchmark.
+
+Compares FastAPI's default response path (response model validation +
+jsonable_encoder + json.dumps) with the bulk ModelListSerializer path for
+the tournaments, matches and standings list endpoints.
+
+Usage (from the backend directory):
+    python -m benchmarks.serialization
+    python -m benchmarks.serialization --items 500 --repeat 20 --json
+"""
+import argparse
+import asyncio
+import json
+import time
+import uuid
+from datetime import datetime, timedelta
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from app.core.responses import ModelListSerializer
+from app.schemas.match import MatchListItem, StandingsDetail
+from app.schemas.tournament import TournamentListItem
+
+
+def make_tournament(i: int) -> SimpleNamespace:
+    """Synthetic tournament row"""
+    start = datetime(2025, 6, 1) + timedelta(days=i)
+    return SimpleNamespace(
+        id=uuid.uuid4(), name=f"Sommercup {i}", slug=f"sommercup-{i}",
+        department="Fußball", sport_type="football", tournament_type="knockout",
+        status="registration_open", start_date=start,
+        end_date=start + timedelta(days=1), location="Sportpark",
+        city="Berlin", current_participants=12, max_participants=16,
+        banner_url=None, is_public=True, created_at=start,
+    )
+
+
+def make_match(i: int) -> SimpleNamespace:
+    """Synthetic match list row"""
+    return SimpleNamespace(
+        id=uuid.uuid4(), round_number=i // 8 + 1, match_number=i % 8 + 1,
+        round_name="Round 1", group_name="Group A", phase="group_stage",
+        scheduled_start=datetime(2025, 6, 1, 10) + timedelta(minutes=15 * i),
+        status="completed", is_finished=True, venue_name="Halle 1",
+        court_field_number="Court 2",
+        participants=[
+            {
+                "participant_id": uuid.uuid4(), "participant_name": f"Team {i}-{slot}",
+                "slot_number": slot, "team_side": side,
+                "score_value": Decimal("2.000"), "is_winner": slot == 1,
+            }
+            for slot, side in ((1, "home"), (2, "away"))
+        ],
+    )
+
+
+def make_standing(i: int) -> SimpleNamespace:
+    """Synthetic standings row with participant"""
+    now = datetime(2025, 6, 1, 12)
+    tournament_id = uuid.uuid4()
+    participant = SimpleNamespace(
+        id=uuid.uuid4(), tournament_id=tournament_id,
+        participant_name=f"Team {i}", display_name=None, contact_email=None,
+        contact_phone=None, player_list=None, notes=None,
+        participant_club_id=uuid.uuid4(), participant_user_id=None,
+        registered_by=uuid.uuid4(), registration_date=now, status="confirmed",
+        payment_status="paid", payment_amount=Decimal("25.00"),
+        payment_date=now, seed=i + 1, created_at=now,
+        participant_type="club", is_confirmed=True, is_paid=True,
+    )
+    return SimpleNamespace(
+        id=uuid.uuid4(), tournament_id=tournament_id,
+        participant_id=participant.id, group_name=None,
+        matches_played=10, matches_won=6, matches_drawn=2, matches_lost=2,
+        points=20, score_for=Decimal("21.00"), score_against=Decimal("12.00"),
+        score_difference=Decimal("9.00"), current_rank=i + 1,
+        previous_rank=i + 2, recent_form="WWDLW", additional_stats=None,
+        created_at=now, updated_at=now, participant=participant,
+    )
+
+
+CASES: Dict[str, Any] = {
+    "tournaments": (TournamentListItem, make_tournament),
+    "matches": (MatchListItem, make_match),
+    "standings": (StandingsDetail, make_standing),
+}
+
+
+async def _fastapi_default(model: Any, items: List[Any]) -> bytes:
+    """Serialize like a route with response_model=List[model]"""
+    field = create_response_field(name="benchmark", type_=List[model])
+    content = await serialize_response(
+        field=field, response_content=items, is_coroutine=True
+    )
+    return JSONResponse(content).body
+
+
+def _time(fn: Callable[[], Any], repeat: int) -> float:
+    """Best wall time of repeat runs in seconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(num_items: int, repeat: int) -> Dict[str, Dict[str, float]]:
+    """Run all cases and return per-item timings in microseconds"""
+    results = {}
+    loop = asyncio.new_event_loop()
+    try:
+        for name, (model, factory) in CASES.items():
+            items = [factory(i) for i in range(num_items)]
+            serializer = ModelListSerializer(model)
+
+            # Both paths must produce the same document
+            before_doc = json.loads(loop.run_until_complete(_fastapi_default(model, items)))
+            after_doc = json.loads(serializer.dump_json(items))
+            assert before_doc == after_doc, f"{name}: output differs"
+
+            before = _time(
+                lambda: loop.run_until_complete(_fastapi_default(model, items)), repeat
+            )
+            after = _time(lambda: serializer.dump_json(items), repeat)
+            results[name] = {
+                "items": num_items,
+                "before_us_per_item": before / num_items * 1e6,
+                "after_us_per_item": after / num_items * 1e6,
+                "speedup": before / after,
+            }
+    finally:
+        loop.close()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=100, help="Items per list")
+    parser.add_argument("--repeat", type=int, default=30, help="Runs per case (best is kept)")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable JSON")
+    args = parser.parse_args()
+
+    results = run(args.items, args.repeat)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'list':<12}{'before µs/item':>16}{'after µs/item':>16}{'speedup':>10}")
+    for name, r in results.items():
+        print(
+            f"{name:<12}{r['before_us_per_item']:>16.2f}"
+            f"{r['after_us_per_item']:>16.2f}{r['speedup']:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+"""
+Standings aggregation benchmark for large leagues.
+
+Seeds one league tournament with many finished matches (mostly 1v1, some
+multi-player races, byes and unfinished matches mixed in) and compares
+the row-by-row reference aggregation (all result rows fetched, tallied by
+app.engine) with the SQL aggregation used by StandingsService. Both must
+produce identical tallies. With --view the materialized standings view
+(migration 006) is refreshed, timed and checked against them as well; its
+refresh covers every tournament in the database.
+
+Requires a migrated database (DATABASE_URL).
+
+Usage (from the backend directory):
+    python -m benchmarks.standings
+    python -m benchmarks.standings --participants 500 --matches 50000 --json
+    python -m benchmarks.standings --view
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+import uuid
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict, Tuple
+
+from sqlalchemy import and_, insert, select
+
+from app.db.session import AsyncSessionLocal, engine
+from app.engine import StandingTally, apply_results
+from app.models.match import Match
+from app.models.match_participant import MatchParticipant
+from app.models.tournament_participant import TournamentParticipant
+from app.services.standings_service import StandingsService
+from app.services.standings_view_service import StandingsViewService
+from benchmarks.seed import _insert_tournament, _tournament_row, seed_accounts
+
+BATCH = 5000
+
+
+def _entry(now, match_id, participant_id, slot, score=None, winner=False, position=None):
+    return {
+        "id": uuid.uuid4(), "created_at": now, "updated_at": now,
+        "match_id": match_id, "participant_id": participant_id, "slot_number": slot,
+        "score_value": score, "is_winner": winner, "final_position": position,
+        "is_disqualified": False,
+    }
+
+
+async def seed_league(num_participants: int, num_matches: int) -> uuid.UUID:
+    tag = uuid.uuid4().hex[:8]
+    rng = random.Random(7)
+    accounts = await seed_accounts(tag, num_participants, 0)
+
+    async with AsyncSessionLocal() as db:
+        row = _tournament_row(
+            tag, "Bench League", accounts["club_ids"][0], accounts["owner"]["id"],
+            "round_robin", "active", num_participants, 0,
+        )
+        tournament_id = await _insert_tournament(db, row, accounts["club_ids"])
+        participant_ids = list((await db.execute(
+            select(TournamentParticipant.id)
+            .where(TournamentParticipant.tournament_id == tournament_id)
+        )).scalars())
+
+        now = datetime.utcnow()
+        matches, entries = [], []
+        for i in range(num_matches):
+            match_id = uuid.uuid4()
+            matches.append({
+                "id": match_id, "created_at": now, "updated_at": now,
+                "tournament_id": tournament_id, "round_number": i // 100 + 1,
+                "match_number": i % 100 + 1, "status": "completed",
+                "is_finished": i % 10 != 0, "is_bye": i % 97 == 0,
+                "requires_referee": False, "change_version": 0,
+            })
+            if i % 25 == 24:
+                for position, participant_id in enumerate(rng.sample(participant_ids, 6), start=1):
+                    entries.append(_entry(
+                        now, match_id, participant_id, position,
+                        score=Decimal(rng.randint(0, 50)) if position % 2 else None,
+                        position=position if position < 5 else None,
+                    ))
+                continue
+            home, away = rng.sample(participant_ids, 2)
+            home_score, away_score = rng.randint(0, 5), rng.randint(0, 5)
+            entries.append(_entry(
+                now, match_id, home, 1, score=Decimal(home_score) if i % 7 else None,
+                winner=home_score > away_score and i % 3 == 0,
+            ))
+            entries.append(_entry(
+                now, match_id, away, 2, score=Decimal(away_score), winner=i % 11 == 0,
+            ))
+
+        for start in range(0, len(matches), BATCH):
+            await db.execute(insert(Match.__table__), matches[start:start + BATCH])
+        for start in range(0, len(entries), BATCH):
+            await db.execute(insert(MatchParticipant.__table__), entries[start:start + BATCH])
+        await db.commit()
+    return tournament_id
+
+
+async def reference_tallies(db, tournament_id: uuid.UUID) -> Dict[uuid.UUID, StandingTally]:
+    """Fetch every result row and tally them in Python"""
+    participant_ids = (await db.execute(
+        select(TournamentParticipant.id)
+        .where(TournamentParticipant.tournament_id == tournament_id)
+    )).scalars()
+    tallies = {participant_id: StandingTally() for participant_id in participant_ids}
+    rows = await db.execute(
+        select(
+            MatchParticipant.match_id, MatchParticipant.participant_id,
+            MatchParticipant.score_value, MatchParticipant.is_winner,
+            MatchParticipant.final_position,
+        )
+        .join(Match, Match.id == MatchParticipant.match_id)
+        .where(and_(
+            Match.tournament_id == tournament_id,
+            Match.is_finished.is_(True),
+            Match.is_bye.isnot(True),
+        ))
+        .order_by(MatchParticipant.match_id, MatchParticipant.slot_number)
+    )
+    apply_results(rows, tallies)
+    return tallies
+
+
+async def view_tallies(db, tournament_id: uuid.UUID) -> Dict[uuid.UUID, tuple]:
+    """Refresh the materialized view and read the tournament's rows"""
+    await StandingsViewService.refresh(db)
+    await db.commit()
+    return {
+        standing.participant_id: tuple(
+            getattr(standing, name) for name in StandingTally.__slots__
+        )
+        for standing in await StandingsViewService.get_standings(db, tournament_id)
+        if standing.matches_played
+    }
+
+
+async def _best(fn, repeat: int) -> Tuple[float, Any]:
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        async with AsyncSessionLocal() as db:
+            start = time.perf_counter()
+            result = await fn(db)
+            best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+async def run(num_participants: int, num_matches: int, repeat: int, view: bool) -> Dict[str, Any]:
+    tournament_id = await seed_league(num_participants, num_matches)
+
+    reference_s, reference = await _best(
+        lambda db: reference_tallies(db, tournament_id), repeat
+    )
+    sql_s, aggregated = await _best(
+        lambda db: StandingsService.aggregate_results(db, tournament_id), repeat
+    )
+    full_s, _ = await _best(
+        lambda db: StandingsService.calculate_standings(db, tournament_id), repeat
+    )
+    if view:
+        view_s, viewed = await _best(lambda db: view_tallies(db, tournament_id), repeat)
+    await engine.dispose()
+
+    played = {pid: tally.values() for pid, tally in reference.items() if tally.matches_played}
+    assert played == {pid: tally.values() for pid, tally in aggregated.items()}, \
+        "SQL aggregation differs from the reference"
+
+    results = {
+        "participants": num_participants,
+        "matches": num_matches,
+        "reference_ms": reference_s * 1000,
+        "sql_ms": sql_s * 1000,
+        "speedup": reference_s / sql_s,
+        "calculate_standings_ms": full_s * 1000,
+    }
+    if view:
+        assert played == viewed, "Materialized view differs from the reference"
+        results["view_refresh_ms"] = view_s * 1000
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--participants", type=int, default=200, help="League size")
+    parser.add_argument("--matches", type=int, default=20000, help="Matches in the league")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per path (best is kept)")
+    parser.add_argument("--view", action="store_true", help="Also check and time the materialized view")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable JSON")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.participants, args.matches, args.repeat, args.view))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(
+        f"{results['participants']} participants, {results['matches']} matches: "
+        f"reference {results['reference_ms']:.1f} ms, SQL {results['sql_ms']:.1f} ms "
+        f"({results['speedup']:.1f}x), calculate_standings {results['calculate_standings_ms']:.1f} ms"
+    )
+    if "view_refresh_ms" in results:
+        print(f"materialized view refresh (all tournaments) {results['view_refresh_ms']:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
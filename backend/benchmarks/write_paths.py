@@ -0,0 +1,206 @@
+"""
+Write endpoint benchmark.
+
+Runs the main write endpoints in-process (ASGI, no network) against the
+configured database and reports latency plus database round trips
+(statements, BEGIN, COMMIT, ROLLBACK) per request.
+
+Requires a migrated database (DATABASE_URL). Creates its own user, club
+and tournament on every run.
+
+Usage (from the backend directory):
+    python -m benchmarks.write_paths
+    python -m benchmarks.write_paths --repeat 200 --json
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List
+
+import httpx
+from sqlalchemy import event
+
+from app.core.config import settings
+from app.db.session import engine
+from app.main import app
+
+P = settings.API_PREFIX
+PASSWORD = "Benchmark123!"
+
+
+class RoundTripCounter:
+    """Counts database round trips issued through the primary engine"""
+
+    def __init__(self):
+        self.count = 0
+        sync_engine = engine.sync_engine
+        for name in ("before_cursor_execute", "begin", "commit", "rollback"):
+            event.listen(sync_engine, name, self._increment)
+
+    def _increment(self, *args, **kwargs):
+        self.count += 1
+
+
+def ok(response: httpx.Response) -> httpx.Response:
+    if response.status_code >= 400:
+        raise RuntimeError(
+            f"{response.request.method} {response.request.url} -> "
+            f"{response.status_code}: {response.text[:300]}"
+        )
+    return response
+
+
+async def setup(client: httpx.AsyncClient) -> Dict[str, Any]:
+    """Create an owner, a club and a round-robin tournament with matches"""
+    tag = uuid.uuid4().hex[:8]
+
+    async def register(prefix: str) -> Dict[str, Any]:
+        return ok(await client.post(f"{P}/auth/register", json={
+            "email": f"{prefix}{tag}@bench.example", "password": PASSWORD,
+            "first_name": "Bench", "last_name": prefix,
+        })).json()
+
+    await register("owner")
+    token = ok(await client.post(f"{P}/auth/login/json", json={
+        "email": f"owner{tag}@bench.example", "password": PASSWORD,
+    })).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    club = ok(await client.post(
+        f"{P}/clubs", json={"name": f"Bench Club {tag}", "city": "Berlin"},
+        headers=headers
+    )).json()
+
+    now = datetime.utcnow()
+    tournament = ok(await client.post(f"{P}/tournaments", json={
+        "name": f"Bench Cup {tag}", "club_id": club["id"],
+        "start_date": (now + timedelta(days=10)).isoformat(),
+        "end_date": (now + timedelta(days=11)).isoformat(),
+        "registration_start": (now - timedelta(days=1)).isoformat(),
+        "registration_end": (now + timedelta(days=5)).isoformat(),
+        "max_participants": 16,
+    }, headers=headers)).json()
+    tid = tournament["id"]
+    for new_status in ("published", "registration_open"):
+        ok(await client.put(
+            f"{P}/tournaments/{tid}/status", json={"status": new_status},
+            headers=headers
+        ))
+
+    participants = []
+    for i in range(8):
+        user = await register(f"player{i}-")
+        participant = ok(await client.post(f"{P}/tournaments/{tid}/register", json={
+            "participant_name": f"Player {i}", "participant_user_id": user["id"],
+        }, headers=headers)).json()
+        ok(await client.put(
+            f"{P}/tournaments/{tid}/participants/{participant['id']}/status",
+            json={"status": "confirmed"}, headers=headers
+        ))
+        participants.append(participant["id"])
+
+    ok(await client.post(
+        f"{P}/matches/generate/round-robin", json={"tournament_id": tid},
+        headers=headers
+    ))
+    matches = ok(await client.get(f"{P}/matches", params={"tournament_id": tid})).json()
+
+    return {
+        "headers": headers, "club_id": club["id"], "tournament_id": tid,
+        "participant_id": participants[0], "match": matches[0],
+    }
+
+
+def scenarios(ctx: Dict[str, Any]) -> Dict[str, Callable[[httpx.AsyncClient, int], Any]]:
+    """Endpoint name -> coroutine function issuing one request"""
+    headers = ctx["headers"]
+    tid = ctx["tournament_id"]
+    match = ctx["match"]
+    home, away = (p["participant_id"] for p in match["participants"])
+
+    return {
+        "PUT /tournaments/{id}": lambda c, i: c.put(
+            f"{P}/tournaments/{tid}", json={"description": f"Run {i}"},
+            headers=headers
+        ),
+        "PUT /tournaments/{id}/participants/{id}": lambda c, i: c.put(
+            f"{P}/tournaments/{tid}/participants/{ctx['participant_id']}",
+            json={"display_name": f"Player {i}"}, headers=headers
+        ),
+        "PUT /matches/{id}": lambda c, i: c.put(
+            f"{P}/matches/{match['id']}", json={"notes": f"Run {i}"},
+            headers=headers
+        ),
+        "PUT /matches/{id}/status": lambda c, i: c.put(
+            f"{P}/matches/{match['id']}/status",
+            json={"status": "in_progress", "notes": f"Run {i}"}, headers=headers
+        ),
+        "PUT /matches/{id}/score": lambda c, i: c.put(
+            f"{P}/matches/{match['id']}/score", json={
+                "participant_scores": [
+                    {"participant_id": home, "score_value": i % 4},
+                    {"participant_id": away, "score_value": 1},
+                ],
+            }, headers=headers
+        ),
+        "PUT /clubs/{id}": lambda c, i: c.put(
+            f"{P}/clubs/{ctx['club_id']}", json={"description": f"Run {i}"},
+            headers=headers
+        ),
+    }
+
+
+async def run(repeat: int) -> List[Dict[str, Any]]:
+    counter = RoundTripCounter()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        ctx = await setup(client)
+        results = []
+        for name, request in scenarios(ctx).items():
+            ok(await request(client, -1))  # Warm up statement caches
+
+            timings = []
+            counter.count = 0
+            for i in range(repeat):
+                start = time.perf_counter()
+                ok(await request(client, i))
+                timings.append((time.perf_counter() - start) * 1000)
+
+            timings.sort()
+            results.append({
+                "endpoint": name,
+                "round_trips": counter.count / repeat,
+                "mean_ms": statistics.fmean(timings),
+                "p50_ms": timings[len(timings) // 2],
+                "p95_ms": timings[int(len(timings) * 0.95) - 1],
+            })
+    await engine.dispose()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=100, help="Requests per endpoint")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.repeat))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'endpoint':<42} {'trips':>6} {'mean ms':>8} {'p50 ms':>8} {'p95 ms':>8}")
+    for row in results:
+        print(
+            f"{row['endpoint']:<42} {row['round_trips']:>6.1f} {row['mean_ms']:>8.2f} "
+            f"{row['p50_ms']:>8.2f} {row['p95_ms']:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()